@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Flex Message組み立てのマイクロベンチマーク.
+
+10件のカルーセルを送信用JSONにするまでの処理時間を比較する。
+
+- SDK: FlexBox・FlexTextなどのSDKモデルを組み立ててto_jsonでシリアライズ
+- 現行: flex_rendererで辞書を直接組み立ててencode_jsonでシリアライズ
+
+実行方法:
+    uv run python benchmarks/bench_flex_rendering.py [カルーセル数]
+"""
+
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from linebot.v3.messaging import (  # noqa: E402
+    FlexBubble,
+    FlexButton,
+    FlexCarousel,
+    FlexMessage,
+    URIAction,
+)
+from linebot.v3.messaging.models import FlexBox, FlexText  # noqa: E402
+
+from src.infrastructure.flex_renderer import encode_json, render_flex_message  # noqa: E402
+from src.models.news_article import NewsArticle  # noqa: E402
+from src.utils.date_helper import format_datetime_jst  # noqa: E402
+
+
+def build_articles(count: int) -> list[NewsArticle]:
+    """カルーセル1件分の記事を生成.
+
+    Args:
+        count: 記事数
+
+    Returns:
+        記事のリスト
+    """
+    return [
+        NewsArticle(
+            title=f"政府、生成AIの利用ガイドラインを公表 その{i} - 日本経済新聞",
+            url=f"https://example.com/news/{i}",
+            published_date=datetime(2025, 1, 15, 12, i, 0, tzinfo=timezone.utc),
+            summary="政府は生成AIの利用に関するガイドラインを公表した。" * 3,
+        )
+        for i in range(count)
+    ]
+
+
+def sdk_path(articles: list[NewsArticle]) -> str:
+    """SDKモデルによる組み立て.
+
+    Args:
+        articles: 記事のリスト
+
+    Returns:
+        JSON文字列
+    """
+    bubbles = []
+    for i, article in enumerate(articles[:10]):
+        summary = article.summary or article.description
+        bubbles.append(
+            FlexBubble(
+                header=FlexBox(
+                    layout="vertical",
+                    contents=[FlexText(text=f"📰 ニュース #{i + 1}", size="sm", color="#1DB446")],
+                ),
+                body=FlexBox(
+                    layout="vertical",
+                    contents=[
+                        FlexText(text=article.title[:60], size="lg", weight="bold", wrap=True),
+                        FlexBox(
+                            layout="vertical",
+                            margin="md",
+                            spacing="sm",
+                            contents=[
+                                FlexText(text=summary[:150], size="sm", color="#666666", wrap=True),
+                                FlexText(
+                                    text=format_datetime_jst(article.published_date),
+                                    size="xs",
+                                    color="#999999",
+                                    margin="md",
+                                ),
+                            ],
+                        ),
+                    ],
+                ),
+                footer=FlexBox(
+                    layout="vertical",
+                    spacing="sm",
+                    contents=[
+                        FlexButton(
+                            style="primary",
+                            action=URIAction(label="記事を読む", uri=article.get_url_string()),
+                        )
+                    ],
+                ),
+            )
+        )
+    message = FlexMessage(alt_text="bench: 10件の新着ニュース", contents=FlexCarousel(contents=bubbles))
+    return message.to_json()
+
+
+def current_path(articles: list[NewsArticle]) -> bytes:
+    """flex_rendererによる組み立て.
+
+    Args:
+        articles: 記事のリスト
+
+    Returns:
+        JSONバイト列
+    """
+    return encode_json(render_flex_message(articles, "bench"))
+
+
+def main() -> None:
+    """ベンチマークを実行."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    articles = build_articles(10)
+    bubbles = count * 10
+    repeat = 5
+
+    for name, func in [("sdk", sdk_path), ("current", current_path)]:
+        best = min(
+            timeit.repeat(
+                lambda f=func: [f(articles) for _ in range(count)], number=1, repeat=repeat
+            )
+        )
+        print(
+            f"{name:8s}: {best * 1000:8.2f} ms / {count} carousels "
+            f"({best / bubbles * 1e6:.2f} us/bubble)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""RSS日付処理のマイクロベンチマーク.
+
+大量のRSSエントリーについて、以下の2つの経路の処理時間を比較する。
+
+- 従来: 日付文字列をparsedate_to_datetimeで再パースし、記事ごとにis_today_jstで判定
+- 現行: feedparserのpublished_parsedから直接UTCのdatetimeを作り、収集期間は1回だけ計算
+
+実行方法:
+    uv run python benchmarks/bench_rss_date_parsing.py [エントリー数]
+"""
+
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.date_helper import (  # noqa: E402
+    get_today_start_jst,
+    is_today_jst,
+    parse_feed_date,
+    parse_rss_date,
+)
+
+
+def build_entries(count: int) -> list[dict]:
+    """feedparserのエントリー相当のデータを生成.
+
+    Args:
+        count: エントリー数
+
+    Returns:
+        published と published_parsed を持つ辞書のリスト
+    """
+    base = datetime.now(timezone.utc)
+    entries = []
+    for i in range(count):
+        dt = base - timedelta(minutes=i)
+        entries.append(
+            {
+                "published": dt.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+                "published_parsed": dt.utctimetuple(),
+            }
+        )
+    return entries
+
+
+def legacy_path(entries: list[dict]) -> int:
+    """従来の処理経路.
+
+    Args:
+        entries: エントリーのリスト
+
+    Returns:
+        当日分の件数
+    """
+    count = 0
+    for entry in entries:
+        dt = parse_rss_date(entry["published"]) or datetime.now()
+        if is_today_jst(dt):
+            count += 1
+    return count
+
+
+def current_path(entries: list[dict]) -> int:
+    """現行の処理経路.
+
+    Args:
+        entries: エントリーのリスト
+
+    Returns:
+        収集期間内の件数
+    """
+    window_start = get_today_start_jst()
+    window_end = datetime.now(timezone.utc)
+    count = 0
+    for entry in entries:
+        dt = parse_feed_date(entry["published_parsed"], entry["published"])
+        if dt is not None and window_start <= dt <= window_end:
+            count += 1
+    return count
+
+
+def main() -> None:
+    """ベンチマークを実行."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    entries = build_entries(count)
+    repeat = 5
+
+    for name, func in [("legacy", legacy_path), ("current", current_path)]:
+        best = min(timeit.repeat(lambda f=func: f(entries), number=1, repeat=repeat))
+        print(
+            f"{name:8s}: {best * 1000:8.2f} ms / {count} entries "
+            f"({best / count * 1e6:.2f} us/entry)"
+        )
+
+
+if __name__ == "__main__":
+    main()
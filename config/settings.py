@@ -17,6 +17,9 @@ class Settings:
     # LINE設定
     LINE_CHANNEL_ACCESS_TOKEN: str = os.getenv("LINE_CHANNEL_ACCESS_TOKEN", "")
 
+    # LINEチャンネルシークレット（Webhookサーバーの署名検証に使用）
+    LINE_CHANNEL_SECRET: str = os.getenv("LINE_CHANNEL_SECRET", "")
+
     # Gemini設定
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
 
@@ -31,6 +34,33 @@ class Settings:
         "DEFAULT_LLM_PROVIDER", "gemini"
     )  # type: ignore
 
+    # 要約1件あたりにLLMへ渡す記事テキストの最大トークン数（概算）
+    LLM_MAX_INPUT_TOKENS: int = int(os.getenv("LLM_MAX_INPUT_TOKENS", "512"))
+
+    # 要約プロンプトのシステム指示をGeminiのコンテキストキャッシュに登録するか
+    # （モデルごとの最小トークン数に満たない場合は自動的にsystem_instructionで渡す）
+    GEMINI_CONTEXT_CACHE: bool = os.getenv("GEMINI_CONTEXT_CACHE", "false").lower() == "true"
+
+    # 外部APIのレート制限（ホスト=リクエスト数/秒:バースト数 をカンマ区切り）
+    RATE_LIMITS: str = os.getenv(
+        "RATE_LIMITS",
+        "news.google.com=1:3,generativelanguage.googleapis.com=1:2,api.line.me=10:10",
+    )
+
+    # レート制限で待機する際に加える乱数の最大値（秒）
+    RATE_LIMIT_JITTER: float = float(os.getenv("RATE_LIMIT_JITTER", "0.1"))
+
+    # 一時的な障害時の最大試行回数（初回を含む）
+    RETRY_MAX_ATTEMPTS: int = int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))
+
+    # サーキットブレーカーを開く連続失敗回数と、開いた状態を維持する秒数
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = int(
+        os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5")
+    )
+    CIRCUIT_BREAKER_RECOVERY_SECONDS: float = float(
+        os.getenv("CIRCUIT_BREAKER_RECOVERY_SECONDS", "60")
+    )
+
     # ログ設定
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE: str = os.getenv("LOG_FILE", "data/logs/news_notification.log")
@@ -38,6 +68,83 @@ class Settings:
     # キャッシュ設定
     CACHE_FILE: str = os.getenv("CACHE_FILE", "data/cache/notified_urls.json")
 
+    # BM25用コーパス統計ファイル
+    CORPUS_STATS_FILE: str = os.getenv(
+        "CORPUS_STATS_FILE", "data/cache/corpus_stats.json"
+    )
+
+    # 通知先ごとの最終正常実行時刻（ウォーターマーク）ファイル
+    WATERMARK_FILE: str = os.getenv("WATERMARK_FILE", "data/cache/watermarks.json")
+
+    # 収集期間をウォーターマークからさかのぼらせる時間（分）
+    WATERMARK_OVERLAP_MINUTES: int = int(os.getenv("WATERMARK_OVERLAP_MINUTES", "60"))
+
+    # キーワードごとの取得実績ファイル
+    KEYWORD_STATS_FILE: str = os.getenv(
+        "KEYWORD_STATS_FILE", "data/cache/keyword_stats.json"
+    )
+
+    # 新着の無いキーワードの取得間隔（実行回数）の上限
+    POLLING_MAX_INTERVAL_RUNS: int = int(os.getenv("POLLING_MAX_INTERVAL_RUNS", "16"))
+
+    # 記事ページのリダイレクト先・本文のキャッシュファイルと有効期間（時間）
+    ARTICLE_CACHE_FILE: str = os.getenv(
+        "ARTICLE_CACHE_FILE", "data/cache/article_bodies.json"
+    )
+    ARTICLE_CACHE_TTL_HOURS: float = float(os.getenv("ARTICLE_CACHE_TTL_HOURS", "72"))
+    # 取得に失敗した記事URLを取得し直さない期間（時間）
+    ARTICLE_FETCH_FAILURE_TTL_HOURS: float = float(
+        os.getenv("ARTICLE_FETCH_FAILURE_TTL_HOURS", "1")
+    )
+
+    # 記事ページを並行して取得する数と、1ページあたりのタイムアウト（秒）
+    ARTICLE_FETCH_MAX_WORKERS: int = int(os.getenv("ARTICLE_FETCH_MAX_WORKERS", "4"))
+    ARTICLE_FETCH_TIMEOUT_SECONDS: float = float(
+        os.getenv("ARTICLE_FETCH_TIMEOUT_SECONDS", "10")
+    )
+
+    # ダイジェストモードの通知先の蓄積記事ファイル
+    DIGEST_BUFFER_FILE: str = os.getenv("DIGEST_BUFFER_FILE", "data/cache/digest_buffer.json")
+
+    # emailチャンネルで使うSMTPサーバー
+    SMTP_HOST: str = os.getenv("SMTP_HOST", "")
+    SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
+    SMTP_SENDER: str = os.getenv("SMTP_SENDER", "")
+    SMTP_USERNAME: str = os.getenv("SMTP_USERNAME", "")
+    SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD", "")
+    SMTP_USE_TLS: bool = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
+
+    # LINEの月間メッセージ通数の上限（0の場合は上限なし）と、送信通数の記録ファイル
+    LINE_MONTHLY_MESSAGE_QUOTA: int = int(os.getenv("LINE_MONTHLY_MESSAGE_QUOTA", "0"))
+    QUOTA_FILE: str = os.getenv("QUOTA_FILE", "data/cache/message_quota.json")
+
+    # 通数の目安を超えて後回しにする記事数の上限（通知先ごと）
+    DELIVERY_DEFER_MAX_ARTICLES: int = int(os.getenv("DELIVERY_DEFER_MAX_ARTICLES", "50"))
+
+    # 送信待ちのLINE通知を保存するディレクトリ（アウトボックス）
+    OUTBOX_DIR: str = os.getenv("OUTBOX_DIR", "data/outbox")
+
+    # 実行の最後に未送信の通知を再送し続ける時間の上限（秒）と、再送間隔の基準（秒）
+    OUTBOX_DRAIN_SECONDS: float = float(os.getenv("OUTBOX_DRAIN_SECONDS", "60"))
+    OUTBOX_RETRY_BASE_SECONDS: float = float(os.getenv("OUTBOX_RETRY_BASE_SECONDS", "30"))
+
+    # 再送を諦めるまでの時間（LINEがリトライキーを保持する24時間以内）
+    OUTBOX_MAX_AGE_HOURS: float = float(os.getenv("OUTBOX_MAX_AGE_HOURS", "24"))
+
+    # 要約済み記事を保存する記事ストア（Webhookサーバーの検索対象）と保持日数
+    ARTICLE_STORE_FILE: str = os.getenv("ARTICLE_STORE_FILE", "data/cache/articles.db")
+    ARTICLE_STORE_RETENTION_DAYS: int = int(os.getenv("ARTICLE_STORE_RETENTION_DAYS", "30"))
+
+    # Webhookサーバーの待ち受けアドレス・パスと、検索結果として返す最大記事数
+    WEBHOOK_HOST: str = os.getenv("WEBHOOK_HOST", "0.0.0.0")
+    WEBHOOK_PORT: int = int(os.getenv("WEBHOOK_PORT", "8000"))
+    WEBHOOK_PATH: str = os.getenv("WEBHOOK_PATH", "/callback")
+    WEBHOOK_MAX_RESULTS: int = int(os.getenv("WEBHOOK_MAX_RESULTS", "5"))
+    # 検索範囲（targets: 送信者の通知先に送信済みの記事のみ、all: 保存済みのすべての記事）
+    WEBHOOK_SEARCH_SCOPE: Literal["targets", "all"] = os.getenv(
+        "WEBHOOK_SEARCH_SCOPE", "targets"
+    )  # type: ignore
+
     # キーワード設定ファイル
     KEYWORDS_FILE: str = os.getenv("KEYWORDS_FILE", "config/keywords.yaml")
 
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""記事本文の付与（エンリッチメント）ビジネスロジック."""
+
+from typing import List
+
+from src.infrastructure.article_fetcher import ArticleFetcher
+from src.models.news_article import NewsArticle
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ArticleEnricher:
+    """記事ページから取得した本文を記事に付与するクラス."""
+
+    def __init__(self, article_fetcher: ArticleFetcher) -> None:
+        """初期化.
+
+        Args:
+            article_fetcher: 記事本文取得クライアント
+        """
+        self.article_fetcher = article_fetcher
+
+    def enrich(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+        """記事に本文を付与.
+
+        本文を取得できなかった記事はbodyがNoneのまま（説明文で要約する）。
+
+        Args:
+            articles: 記事のリスト
+
+        Returns:
+            本文付きの記事のリスト
+        """
+        if not articles:
+            return articles
+
+        bodies = self.article_fetcher.fetch_bodies(
+            [article.get_url_string() for article in articles]
+        )
+        for article in articles:
+            body = bodies.get(article.get_url_string())
+            if body:
+                article.body = body
+
+        logger.info(f"記事本文付与: {len(bodies)}/{len(articles)}件")
+        return articles
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""BM25Fによる関連性スコアリングのビジネスロジック."""
+
+import math
+from typing import Dict, List
+
+from src.infrastructure.corpus_stats_manager import CorpusStatsManager
+from src.models.news_article import NewsArticle
+from src.utils.logger import get_logger
+from src.utils.text_normalizer import normalize_text
+
+logger = get_logger(__name__)
+
+
+class BM25Scorer:
+    """タイトルと説明文を対象にしたBM25F（フィールド重み付きBM25）スコアラー.
+
+    日本語は空白で分かち書きされないため、キーワードを1語として扱い
+    フィールド内の出現回数を語頻度とする。スコアは語ごとの上限（IDF）の
+    合計で割り、0.0〜1.0に正規化する。
+    """
+
+    DEFAULT_FIELD_WEIGHTS: Dict[str, float] = {"title": 2.0, "description": 1.0}
+
+    def __init__(
+        self,
+        corpus_stats: CorpusStatsManager,
+        field_weights: Dict[str, float] | None = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        """初期化.
+
+        Args:
+            corpus_stats: コーパス統計マネージャー
+            field_weights: フィールドごとの重み（デフォルト: タイトル2.0, 説明文1.0）
+            k1: 語頻度の飽和パラメータ
+            b: 文書長正規化パラメータ
+        """
+        self.corpus_stats = corpus_stats
+        self.field_weights = field_weights or dict(self.DEFAULT_FIELD_WEIGHTS)
+        self.k1 = k1
+        self.b = b
+
+    def score_articles(
+        self, articles: List[NewsArticle], keywords: List[str]
+    ) -> List[float]:
+        """記事のバッチをまとめてスコアリング.
+
+        バッチ内の記事でコーパス統計を更新してから、IDFと平均フィールド長を
+        1回だけ計算し、全記事に適用する。
+
+        Args:
+            articles: 記事のリスト
+            keywords: キーワードのリスト
+
+        Returns:
+            記事と同じ順序のスコアのリスト（0.0〜1.0）
+        """
+        if not articles:
+            return []
+
+        terms = [
+            term for term in dict.fromkeys(normalize_text(k) for k in keywords) if term
+        ]
+        fields = list(self.field_weights)
+
+        # 記事ごと・フィールドごとの正規化済みテキストと語頻度行列を作成
+        texts = [
+            {
+                "title": article.get_normalized_title(),
+                "description": article.get_normalized_description(),
+            }
+            for article in articles
+        ]
+        field_lengths = [{field: len(text[field]) for field in fields} for text in texts]
+        term_freqs = [
+            [[text[field].count(term) for field in fields] for term in terms]
+            for text in texts
+        ]
+        document_terms = [
+            {term for term, freqs in zip(terms, row) if any(freqs)} for row in term_freqs
+        ]
+
+        self.corpus_stats.add_documents(
+            document_keys=[article.get_url_string() for article in articles],
+            field_lengths=field_lengths,
+            document_terms=document_terms,
+            terms=terms,
+            published_dates=[article.published_date for article in articles],
+        )
+
+        idfs = [self._idf(term) for term in terms]
+        idf_total = sum(idfs)
+        if idf_total == 0.0:
+            return [0.0] * len(articles)
+
+        weights = [self.field_weights[field] for field in fields]
+        avg_lengths = [
+            self.corpus_stats.get_average_field_length(field) or 1.0 for field in fields
+        ]
+
+        scores = []
+        for lengths, row in zip(field_lengths, term_freqs):
+            # フィールドごとの長さ正規化係数（記事ごとに1回だけ計算）
+            norms = [
+                weight / (1.0 - self.b + self.b * lengths[field] / avg_length)
+                for weight, field, avg_length in zip(weights, fields, avg_lengths)
+            ]
+            raw = 0.0
+            for idf, freqs in zip(idfs, row):
+                tf = sum(freq * norm for freq, norm in zip(freqs, norms))
+                if tf > 0.0:
+                    raw += idf * tf / (self.k1 + tf)
+            scores.append(min(raw / idf_total, 1.0))
+
+        logger.debug(f"BM25スコア計算完了: articles={len(articles)}件, terms={len(terms)}語")
+        return scores
+
+    def _idf(self, term: str) -> float:
+        """語のIDFを計算.
+
+        Args:
+            term: 語
+
+        Returns:
+            IDF（常に0以上）
+        """
+        df, n = self.corpus_stats.get_term_stats(term)
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
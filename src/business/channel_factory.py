@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""通知先のチャンネル設定から通知チャンネルを作成するファクトリー."""
+
+from typing import Dict, List, Optional
+
+import requests
+
+from src.business.line_channel import LineChannel
+from src.infrastructure.notification_channel import (
+    EmailChannel,
+    NotificationChannel,
+    SlackChannel,
+    WebhookChannel,
+)
+from src.infrastructure.resilience import Resilience
+from src.models.keyword_config import ChannelConfig, NotificationTarget
+
+
+class NotificationChannelFactory:
+    """通知先のチャンネル設定から通知チャンネルを作成するファクトリークラス.
+
+    LINEのチャンネルは全通知先で共有し、グループ化・アウトボックスを1か所で扱う。
+    Slack・Webhookは1つのHTTPセッションを共有し、チャンネルの種類ごとの
+    リトライ・サーキットブレーカーを使う。
+    """
+
+    def __init__(
+        self,
+        line_channel: LineChannel,
+        resiliences: Optional[Dict[str, Resilience]] = None,
+        session: Optional[requests.Session] = None,
+        smtp_host: str = "",
+        smtp_port: int = 587,
+        smtp_sender: str = "",
+        smtp_username: str = "",
+        smtp_password: str = "",
+        smtp_use_tls: bool = True,
+        timeout: float = 10.0,
+    ) -> None:
+        """初期化.
+
+        Args:
+            line_channel: LINE通知チャンネル
+            resiliences: チャンネルの種類ごとのリトライ・サーキットブレーカー（オプション）
+            session: Slack・Webhookで共有するHTTPセッション（省略時は新規作成）
+            smtp_host: SMTPサーバーのホスト名
+            smtp_port: SMTPサーバーのポート番号
+            smtp_sender: 送信元のメールアドレス
+            smtp_username: SMTP認証のユーザー名
+            smtp_password: SMTP認証のパスワード
+            smtp_use_tls: STARTTLSを使うか
+            timeout: 送信のタイムアウト（秒）
+        """
+        self.line_channel = line_channel
+        self.resiliences = resiliences or {}
+        self.session = session or requests.Session()
+        self.smtp_host = smtp_host
+        self.smtp_port = smtp_port
+        self.smtp_sender = smtp_sender
+        self.smtp_username = smtp_username
+        self.smtp_password = smtp_password
+        self.smtp_use_tls = smtp_use_tls
+        self.timeout = timeout
+
+    def create_for_target(self, target: NotificationTarget) -> List[NotificationChannel]:
+        """通知先のチャンネルをすべて作成.
+
+        Args:
+            target: 通知先
+
+        Returns:
+            通知チャンネルのリスト
+
+        Raises:
+            ValueError: チャンネルを作成できない設定の場合
+        """
+        return [self.create(config, target.name) for config in target.channels]
+
+    def create(self, config: ChannelConfig, target_name: str) -> NotificationChannel:
+        """通知チャンネルを作成.
+
+        Args:
+            config: チャンネル設定
+            target_name: 通知先の名前（チャンネル名に使用）
+
+        Returns:
+            NotificationChannel
+
+        Raises:
+            ValueError: 不正なチャンネルの種類、またはSMTPサーバーが未設定の場合
+        """
+        name = f"{config.type}:{target_name}"
+        resilience = self.resiliences.get(config.type)
+        if config.type == "line":
+            return self.line_channel
+        elif config.type == "slack":
+            return SlackChannel(
+                name,
+                webhook_url=config.url or "",
+                session=self.session,
+                resilience=resilience,
+                timeout=self.timeout,
+            )
+        elif config.type == "webhook":
+            return WebhookChannel(
+                name,
+                url=config.url or "",
+                session=self.session,
+                resilience=resilience,
+                timeout=self.timeout,
+            )
+        elif config.type == "email":
+            if not self.smtp_host:
+                raise ValueError("emailチャンネルの使用時はSMTP_HOSTが必須です")
+            return EmailChannel(
+                name,
+                recipients=config.to,
+                smtp_host=self.smtp_host,
+                smtp_port=self.smtp_port,
+                sender=self.smtp_sender,
+                username=self.smtp_username,
+                password=self.smtp_password,
+                use_tls=self.smtp_use_tls,
+                resilience=resilience,
+                timeout=self.timeout,
+            )
+        else:
+            raise ValueError(f"不正な通知チャンネル: {config.type}")
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""メッセージ通数の上限を考慮した送信計画のビジネスロジック."""
+
+import calendar
+import math
+from datetime import datetime
+from typing import List, Tuple
+
+from src.infrastructure.flex_renderer import MAX_BUBBLES_PER_CAROUSEL, MAX_MESSAGES_PER_REQUEST
+from src.infrastructure.line_client import LineClient
+from src.infrastructure.quota_manager import QuotaManager
+from src.models.delivery_plan import DeliveryDecision, QuotaForecast
+from src.models.keyword_config import NotificationTarget
+from src.models.news_article import NewsArticle
+from src.utils.date_helper import JST
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DeliveryScheduler:
+    """当月の残り通数から、通知先ごとに送信・後回し・破棄を判断するクラス.
+
+    残り通数を月末までの日数で割った本日の目安の範囲で、優先度（priority）と
+    関連性スコアの高い通知先から送信する。目安を超える通知先は、優先度が1以上なら
+    月の残り通数の範囲で送信し、それ以外はダイジェストに回して後の実行で送信する。
+    月の残り通数が無い場合は破棄する。
+    """
+
+    # 1リクエスト（送信先1人につき1通）で送信できる記事数
+    ARTICLES_PER_MESSAGE = MAX_BUBBLES_PER_CAROUSEL * MAX_MESSAGES_PER_REQUEST
+
+    def __init__(
+        self,
+        quota_manager: QuotaManager,
+        monthly_quota: int,
+        max_deferred_articles: int = ARTICLES_PER_MESSAGE,
+        channel: str = LineClient.QUOTA_CHANNEL,
+    ) -> None:
+        """初期化.
+
+        Args:
+            quota_manager: 送信メッセージ数の利用実績マネージャー
+            monthly_quota: 月間の上限通数（0の場合は上限なし）
+            max_deferred_articles: 後回しにする記事数の上限（超えた分は関連性の低い順に破棄）
+            channel: 上限を管理するチャンネル名
+        """
+        self.quota_manager = quota_manager
+        self.monthly_quota = monthly_quota
+        self.max_deferred_articles = max_deferred_articles
+        self.channel = channel
+
+    def forecast(self, now: datetime) -> QuotaForecast:
+        """当月の利用状況と月末の見通しを算出.
+
+        Args:
+            now: 現在日時（タイムゾーン情報付き）
+
+        Returns:
+            メッセージ通数の見通し
+        """
+        now_jst = now.astimezone(JST)
+        today = now_jst.date()
+        days_in_month = calendar.monthrange(today.year, today.month)[1]
+
+        used = self.quota_manager.get_monthly_usage(self.channel, today)
+        used_today = self.quota_manager.get_daily_usage(self.channel, today)
+        remaining = max(0, self.monthly_quota - used)
+
+        # 昨日までの残り通数を今日から月末までで均等に割り振る
+        days_left = days_in_month - today.day + 1
+        daily_budget = max(0, self.monthly_quota - (used - used_today)) / days_left
+
+        elapsed_days = (today.day - 1) + (
+            now_jst.hour * 3600 + now_jst.minute * 60 + now_jst.second
+        ) / 86400
+        projected = used * days_in_month / elapsed_days if elapsed_days > 0 else float(used)
+
+        return QuotaForecast(
+            period=today.strftime("%Y-%m"),
+            monthly_quota=self.monthly_quota,
+            used=used,
+            used_today=used_today,
+            remaining=remaining,
+            daily_budget=daily_budget,
+            projected=projected,
+        )
+
+    def plan(
+        self,
+        candidates: List[Tuple[NotificationTarget, List[NewsArticle]]],
+        now: datetime,
+    ) -> List[DeliveryDecision]:
+        """通知先ごとに送信・後回し・破棄を判断.
+
+        Args:
+            candidates: (通知先, 送信候補の記事)のリスト
+            now: 現在日時（タイムゾーン情報付き）
+
+        Returns:
+            通知先ごとの送信判断のリスト（送信を優先する順）
+        """
+        candidates = [(target, articles) for target, articles in candidates if articles]
+        if self.monthly_quota <= 0:
+            return [
+                DeliveryDecision(
+                    target_name=target.name,
+                    action="send",
+                    articles=articles,
+                    cost=self.estimate_cost(articles),
+                    reason="上限なし",
+                )
+                for target, articles in candidates
+            ]
+
+        forecast = self.forecast(now)
+        self._log_forecast(forecast)
+
+        today_remaining = forecast.get_today_remaining()
+        remaining = forecast.remaining
+        decisions = []
+        for target, articles in sorted(candidates, key=self._priority_key):
+            # LINEを使わない通知先は通数を消費しない
+            cost = self.estimate_cost(articles) if target.uses_line() else 0
+            if cost <= today_remaining:
+                action, reason = "send", "本日の目安内"
+            elif cost <= remaining and target.priority > 0:
+                action, reason = "send", f"優先度{target.priority}のため目安を超えて送信"
+            elif cost <= remaining:
+                action, reason = "defer", "本日の目安を超えるためダイジェストに回す"
+            else:
+                action, reason = "drop", "当月の上限に達したため破棄"
+
+            if action == "send":
+                today_remaining -= cost
+                remaining -= cost
+                decisions.append(
+                    DeliveryDecision(
+                        target_name=target.name,
+                        action=action,
+                        articles=articles,
+                        cost=cost,
+                        reason=reason,
+                    )
+                )
+            elif action == "defer":
+                decisions.extend(self._defer(target, articles, reason))
+            else:
+                decisions.append(
+                    DeliveryDecision(
+                        target_name=target.name, action=action, articles=articles, reason=reason
+                    )
+                )
+
+        for decision in decisions:
+            logger.info(
+                f"送信判断: target={decision.target_name}, action={decision.action}, "
+                f"articles={len(decision.articles)}件, cost={decision.cost}通 ({decision.reason})"
+            )
+        return decisions
+
+    def estimate_cost(self, articles: List[NewsArticle]) -> int:
+        """記事を送信するのに必要な通数を算出（送信先1人あたり）.
+
+        Args:
+            articles: 記事のリスト
+
+        Returns:
+            必要な通数
+        """
+        return math.ceil(len(articles) / self.ARTICLES_PER_MESSAGE)
+
+    def _defer(
+        self, target: NotificationTarget, articles: List[NewsArticle], reason: str
+    ) -> List[DeliveryDecision]:
+        """記事を後回しにし、上限を超える分を関連性の低い順に破棄.
+
+        Args:
+            target: 通知先
+            articles: 記事のリスト
+            reason: 後回しにする理由
+
+        Returns:
+            後回し（と破棄）の送信判断のリスト
+        """
+        ranked = sorted(articles, key=lambda article: -(article.relevance_score or 0.0))
+        kept = ranked[: self.max_deferred_articles]
+        dropped = ranked[self.max_deferred_articles :]
+
+        decisions = [
+            DeliveryDecision(target_name=target.name, action="defer", articles=kept, reason=reason)
+        ]
+        if dropped:
+            decisions.append(
+                DeliveryDecision(
+                    target_name=target.name,
+                    action="drop",
+                    articles=dropped,
+                    reason="後回しにする記事数の上限を超えたため関連性の低い記事を破棄",
+                )
+            )
+        return decisions
+
+    @staticmethod
+    def _priority_key(
+        candidate: Tuple[NotificationTarget, List[NewsArticle]],
+    ) -> Tuple[int, float]:
+        """送信を優先する順の並び替えキー（優先度、最大関連性スコアの降順）.
+
+        Args:
+            candidate: (通知先, 送信候補の記事)
+
+        Returns:
+            並び替えキー
+        """
+        target, articles = candidate
+        top_score = max((article.relevance_score or 0.0) for article in articles)
+        return (-target.priority, -top_score)
+
+    def _log_forecast(self, forecast: QuotaForecast) -> None:
+        """メッセージ通数の見通しをログに出力.
+
+        Args:
+            forecast: メッセージ通数の見通し
+        """
+        logger.info(
+            f"LINEメッセージ通数({forecast.period}): {forecast.used}/{forecast.monthly_quota}通 "
+            f"(残り{forecast.remaining}通), 本日 {forecast.used_today}/"
+            f"{forecast.daily_budget:.1f}通, 月末予測 {forecast.projected:.0f}通"
+        )
+        if forecast.projected > forecast.monthly_quota:
+            logger.warning(
+                f"現在のペースでは月末までに上限を超える見込みです: "
+                f"予測{forecast.projected:.0f}通 > 上限{forecast.monthly_quota}通"
+            )
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""ダイジェストモードの記事蓄積・送信判定ビジネスロジック."""
+
+from datetime import datetime, timedelta
+from typing import List
+
+from src.infrastructure.digest_buffer_manager import DigestBufferManager
+from src.models.keyword_config import NotificationTarget
+from src.models.news_article import NewsArticle
+from src.utils.date_helper import JST
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DigestScheduler:
+    """ダイジェストモードの通知先の記事を蓄積し、送信するタイミングを判定するクラス.
+
+    蓄積を始めてから送信時刻（digest_times）を迎えた場合か、蓄積記事数が
+    digest_max_articlesに達した場合に、蓄積した記事をまとめて1回で送信する。
+    それ以外の実行では収集・要約した記事を蓄積するだけで送信しない。
+    """
+
+    def __init__(self, buffer_manager: DigestBufferManager) -> None:
+        """初期化.
+
+        Args:
+            buffer_manager: ダイジェストバッファマネージャー
+        """
+        self.buffer_manager = buffer_manager
+
+    def collect(
+        self, target: NotificationTarget, articles: List[NewsArticle], now: datetime
+    ) -> List[NewsArticle]:
+        """記事を蓄積し、送信するタイミングであれば蓄積した記事を返す.
+
+        返した記事は送信が完了するまでバッファに残し、mark_flushedで削除する。
+
+        Args:
+            target: 通知先
+            articles: 今回要約した記事のリスト
+            now: 現在日時（タイムゾーン情報付き）
+
+        Returns:
+            今回送信する記事のリスト（蓄積を続ける場合は空）
+        """
+        buffered_count = self.buffer_manager.add_articles(target.name, articles, now)
+        if buffered_count == 0:
+            return []
+
+        started_at = self.buffer_manager.get_started_at(target.name)
+        size_reached = (
+            target.digest_max_articles is not None
+            and buffered_count >= target.digest_max_articles
+        )
+        time_reached = started_at is not None and self._has_scheduled_time_between(
+            target.digest_times, started_at, now
+        )
+
+        if not (size_reached or time_reached):
+            logger.info(f"ダイジェストに蓄積: target={target.name}, 蓄積={buffered_count}件")
+            return []
+
+        reason = "蓄積記事数" if size_reached else "送信時刻"
+        logger.info(
+            f"ダイジェスト送信: target={target.name}, articles={buffered_count}件 ({reason})"
+        )
+        return self.buffer_manager.get_articles(target.name)
+
+    def merge_deferred(
+        self, target: NotificationTarget, articles: List[NewsArticle]
+    ) -> List[NewsArticle]:
+        """送信を後回しにした記事と今回の記事をまとめる（ダイジェストモードでない通知先用）.
+
+        Args:
+            target: 通知先
+            articles: 今回要約した記事のリスト
+
+        Returns:
+            後回しにした記事に、未蓄積の今回の記事を続けたリスト
+        """
+        deferred = self.buffer_manager.get_articles(target.name)
+        if not deferred:
+            return articles
+
+        deferred_urls = {article.get_url_string() for article in deferred}
+        logger.info(f"後回しにした記事を送信候補に追加: target={target.name}, {len(deferred)}件")
+        return deferred + [a for a in articles if a.get_url_string() not in deferred_urls]
+
+    def defer(
+        self, target: NotificationTarget, articles: List[NewsArticle], now: datetime
+    ) -> None:
+        """送信を後回しにする記事をバッファに保存（次回以降の実行で送信する）.
+
+        Args:
+            target: 通知先
+            articles: 後回しにする記事のリスト
+            now: 現在日時（タイムゾーン情報付き）
+        """
+        self.buffer_manager.replace_articles(target.name, articles, now)
+
+    def mark_flushed(self, target: NotificationTarget) -> None:
+        """送信したダイジェストの記事をバッファから削除.
+
+        Args:
+            target: 通知先
+        """
+        self.buffer_manager.clear(target.name)
+
+    def hold_for_channel(
+        self, target: NotificationTarget, channel_name: str, articles: List[NewsArticle], now: datetime
+    ) -> None:
+        """他のチャンネルでは送信できたが、このチャンネルで送信できなかった記事を保存.
+
+        記事は通知済みとなるため、次回以降の実行でこのチャンネルにだけ再送する。
+
+        Args:
+            target: 通知先
+            channel_name: 送信に失敗したチャンネルの名前
+            articles: 送信できなかった記事のリスト
+            now: 現在日時（タイムゾーン情報付き）
+        """
+        self.buffer_manager.replace_articles(self._channel_key(target, channel_name), articles, now)
+
+    def get_held(self, target: NotificationTarget, channel_name: str) -> List[NewsArticle]:
+        """チャンネルに再送する記事を取得.
+
+        Args:
+            target: 通知先
+            channel_name: チャンネルの名前
+
+        Returns:
+            再送する記事のリスト
+        """
+        return self.buffer_manager.get_articles(self._channel_key(target, channel_name))
+
+    def release_held(self, target: NotificationTarget, channel_name: str) -> None:
+        """チャンネルに再送した記事を削除.
+
+        Args:
+            target: 通知先
+            channel_name: チャンネルの名前
+        """
+        self.buffer_manager.clear(self._channel_key(target, channel_name))
+
+    @staticmethod
+    def _channel_key(target: NotificationTarget, channel_name: str) -> str:
+        """チャンネルごとの再送記事を保存するバッファのキーを作成.
+
+        Args:
+            target: 通知先
+            channel_name: チャンネルの名前
+
+        Returns:
+            バッファのキー
+        """
+        return f"{target.name}@{channel_name}"
+
+    @staticmethod
+    def _has_scheduled_time_between(
+        digest_times: List[str], since: datetime, until: datetime
+    ) -> bool:
+        """sinceより後、until以前に送信時刻（JST）があるか判定.
+
+        Args:
+            digest_times: 送信時刻（JSTのHH:MM）のリスト
+            since: 期間の開始（この時刻は含まない）
+            until: 期間の終了（この時刻を含む）
+
+        Returns:
+            期間内に送信時刻がある場合True
+        """
+        day = since.astimezone(JST).date()
+        last_day = until.astimezone(JST).date()
+        while day <= last_day:
+            for digest_time in digest_times:
+                hour, minute = (int(part) for part in digest_time.split(":"))
+                scheduled = datetime(day.year, day.month, day.day, hour, minute, tzinfo=JST)
+                if since < scheduled <= until:
+                    return True
+            day += timedelta(days=1)
+        return False
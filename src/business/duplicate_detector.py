@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""類似記事（同一ニュースの別配信元）のクラスタリングビジネスロジック."""
+
+import random
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from src.models.news_article import NewsArticle
+from src.utils.logger import get_logger
+from src.utils.text_normalizer import normalize_text
+
+logger = get_logger(__name__)
+
+
+class DuplicateDetector:
+    """MinHash + LSHで類似記事をクラスタリングし、代表記事のみを残すクラス.
+
+    配信元を除いた正規化済みタイトルの文字n-gram（シングル）からMinHashシグネチャを作り、
+    LSHのバンド単位でバケットに振り分けて候補ペアだけを比較する。
+    記事数Nに対して総当たり（O(N^2)）の比較を避けられる。
+    """
+
+    _MERSENNE_PRIME = (1 << 61) - 1
+
+    def __init__(
+        self,
+        shingle_size: int = 3,
+        num_perm: int = 64,
+        bands: int = 16,
+        similarity_threshold: float = 0.6,
+        seed: int = 1,
+    ) -> None:
+        """初期化.
+
+        Args:
+            shingle_size: シングルの文字数
+            num_perm: MinHashのハッシュ関数の数
+            bands: LSHのバンド数（num_permを割り切れる値）
+            similarity_threshold: 同一ニュースとみなす推定Jaccard係数の閾値
+            seed: ハッシュ関数の係数生成用シード
+
+        Raises:
+            ValueError: num_permがbandsで割り切れない場合
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_permはbandsで割り切れる必要があります")
+
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.similarity_threshold = similarity_threshold
+
+        rng = random.Random(seed)
+        self._hash_params: List[Tuple[int, int]] = [
+            (rng.randrange(1, self._MERSENNE_PRIME), rng.randrange(0, self._MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def deduplicate(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+        """類似記事をクラスタリングし、クラスタごとに代表記事を1件残す.
+
+        代表記事は関連性スコアが最も高い記事（同点の場合は先に現れた記事）。
+        除外した記事のURLは代表記事のduplicate_urlsに追加し、代表記事を通知した
+        時点でまとめて通知済みにする（除外した記事が後の実行で再び候補にならない）。
+
+        Args:
+            articles: 記事のリスト
+
+        Returns:
+            代表記事のリスト（入力の順序を維持）
+        """
+        if len(articles) < 2:
+            return list(articles)
+
+        signatures = [self._signature(article) for article in articles]
+
+        # LSHバケットに振り分け
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+        for index, signature in enumerate(signatures):
+            for band in range(self.bands):
+                start = band * self.rows
+                key = (band, tuple(signature[start : start + self.rows]))
+                buckets[key].append(index)
+
+        # 同じバケットに入った候補ペアのみ類似度を検証してUnion-Find
+        parent = list(range(len(articles)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        checked = set()
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for pos, i in enumerate(members):
+                for j in members[pos + 1 :]:
+                    if (i, j) in checked:
+                        continue
+                    checked.add((i, j))
+                    if self._similarity(signatures[i], signatures[j]) >= (
+                        self.similarity_threshold
+                    ):
+                        parent[find(j)] = find(i)
+
+        # クラスタごとに代表記事を選択
+        representatives: Dict[int, int] = {}
+        for index, article in enumerate(articles):
+            root = find(index)
+            current = representatives.get(root)
+            if current is None or (article.relevance_score or 0.0) > (
+                articles[current].relevance_score or 0.0
+            ):
+                representatives[root] = index
+
+        kept_indices = sorted(representatives.values())
+        kept = [articles[i] for i in kept_indices]
+
+        for index, article in enumerate(articles):
+            representative = articles[representatives[find(index)]]
+            if representative is not article:
+                for url in [article.get_url_string(), *article.duplicate_urls]:
+                    if url not in representative.duplicate_urls:
+                        representative.duplicate_urls.append(url)
+                logger.debug(
+                    f"類似記事を除外: {article.title[:30]}... "
+                    f"(代表: {representative.title[:30]}...)"
+                )
+
+        logger.info(
+            f"類似記事クラスタリング: before={len(articles)}件, "
+            f"clusters={len(kept)}件, candidates={len(checked)}ペア"
+        )
+        return kept
+
+    def _shingles(self, text: str) -> set[str]:
+        """テキストを文字n-gramの集合に変換.
+
+        Args:
+            text: 正規化済みテキスト
+
+        Returns:
+            シングルの集合
+        """
+        if len(text) <= self.shingle_size:
+            return {text}
+        return {
+            text[i : i + self.shingle_size]
+            for i in range(len(text) - self.shingle_size + 1)
+        }
+
+    def _story_title(self, article: NewsArticle) -> str:
+        """配信元を除いた正規化済みタイトルを取得.
+
+        Google Newsのタイトルは「記事タイトル - 配信元」の形式のため、
+        末尾の配信元を取り除いてから比較する。
+
+        Args:
+            article: ニュース記事
+
+        Returns:
+            正規化済みタイトル
+        """
+        title, separator, _source = article.title.rpartition(" - ")
+        if not separator:
+            return article.get_normalized_title()
+        return normalize_text(title)
+
+    def _signature(self, article: NewsArticle) -> List[int]:
+        """記事のMinHashシグネチャを計算.
+
+        Args:
+            article: ニュース記事
+
+        Returns:
+            MinHashシグネチャ
+        """
+        hashes = [
+            zlib.crc32(shingle.encode("utf-8"))
+            for shingle in self._shingles(self._story_title(article))
+        ]
+        prime = self._MERSENNE_PRIME
+        return [min((a * h + b) % prime for h in hashes) for a, b in self._hash_params]
+
+    def _similarity(self, signature1: List[int], signature2: List[int]) -> float:
+        """シグネチャからJaccard係数を推定.
+
+        Args:
+            signature1: MinHashシグネチャ
+            signature2: MinHashシグネチャ
+
+        Returns:
+            推定Jaccard係数（0.0〜1.0）
+        """
+        matches = sum(1 for h1, h2 in zip(signature1, signature2) if h1 == h2)
+        return matches / self.num_perm
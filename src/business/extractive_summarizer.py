@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""LLMを使わない抽出型要約のビジネスロジック."""
+
+import re
+from typing import List
+
+from src.models.news_article import NewsArticle
+from src.utils.html_cleaner import clean_description
+from src.utils.text_normalizer import normalize_text
+
+# 文末（句点・感嘆符・疑問符）または改行で文を区切る
+_SENTENCE_PATTERN = re.compile(r"[^。！？!?\n]+[。！？!?]?")
+
+
+class ExtractiveSummarizer:
+    """説明文から重要な文を抜き出して要約を作るクラス.
+
+    各文をタイトルとの文字bigramの重なりと文の位置でスコアリングし、
+    上位の文を元の順序で並べる。モデルを使わないため即座に結果を返せる。
+    """
+
+    def __init__(self, max_sentences: int = 2, max_chars: int = 150) -> None:
+        """初期化.
+
+        Args:
+            max_sentences: 要約に含める最大文数
+            max_chars: 要約の最大文字数
+        """
+        self.max_sentences = max_sentences
+        self.max_chars = max_chars
+
+    def summarize(self, article: NewsArticle) -> str:
+        """記事の抽出型要約を作成.
+
+        Args:
+            article: ニュース記事
+
+        Returns:
+            要約文（説明文に本文が無い場合は配信元を除いたタイトル）
+        """
+        story_title, separator, _source = article.title.rpartition(" - ")
+        if not separator:
+            story_title = article.title
+
+        sentences = self._split_sentences(
+            clean_description(article.description, article.title)
+        )
+        if not sentences:
+            return self._truncate(story_title.strip())
+
+        title_bigrams = self._bigrams(normalize_text(story_title))
+        scored = []
+        for position, sentence in enumerate(sentences):
+            bigrams = self._bigrams(normalize_text(sentence))
+            overlap = len(bigrams & title_bigrams) / len(bigrams) if bigrams else 0.0
+            # リード文ほど要点を含みやすいため位置でも加点する
+            score = overlap + 1.0 / (position + 1)
+            scored.append((score, position))
+
+        ranked = sorted(scored, key=lambda item: (-item[0], item[1]))
+        selected = sorted(position for _score, position in ranked[: self.max_sentences])
+        return self._truncate("".join(sentences[position] for position in selected))
+
+    def _split_sentences(self, text: str) -> List[str]:
+        """テキストを文に分割.
+
+        Args:
+            text: テキスト
+
+        Returns:
+            空白を除いた文のリスト
+        """
+        return [
+            sentence.strip()
+            for sentence in _SENTENCE_PATTERN.findall(text)
+            if sentence.strip()
+        ]
+
+    @staticmethod
+    def _bigrams(text: str) -> set[str]:
+        """テキストを文字bigramの集合に変換.
+
+        Args:
+            text: 正規化済みテキスト
+
+        Returns:
+            文字bigramの集合
+        """
+        return {text[i : i + 2] for i in range(len(text) - 1)}
+
+    def _truncate(self, text: str) -> str:
+        """最大文字数に収まるように切り詰める.
+
+        Args:
+            text: テキスト
+
+        Returns:
+            切り詰めたテキスト
+        """
+        if len(text) <= self.max_chars:
+            return text
+        return text[: self.max_chars - 3] + "..."
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""LINE Messaging APIで通知する通知チャンネル."""
+
+from typing import Dict, List, Optional, Tuple
+
+from src.business.outbox_dispatcher import OutboxDispatcher
+from src.infrastructure.line_client import LineClient
+from src.infrastructure.notification_channel import NotificationChannel
+from src.models.notification import Notification
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LineChannel(NotificationChannel):
+    """LINE Messaging APIで通知するチャンネル.
+
+    記事のURLと並び順が完全に一致する通知をグループにまとめ、送信先が複数の
+    グループはマルチキャストで1回（500人ごと）だけ送信する。要約文は
+    グループ内で最初の通知のものを使う。
+    送信コストが送信先の数ではなく、異なる内容の数に比例するようになる。
+
+    アウトボックスを使う場合は、リクエストをアウトボックスに保存できた時点で
+    送信成功とし、送信に失敗したものはディスパッチャーが再送する。
+    リトライはLineClient・ディスパッチャー側で行う。
+    """
+
+    def __init__(
+        self, line_client: LineClient, outbox_dispatcher: Optional[OutboxDispatcher] = None
+    ) -> None:
+        """初期化.
+
+        Args:
+            line_client: LINEクライアント
+            outbox_dispatcher: アウトボックス経由で送信する場合のディスパッチャー（オプション）
+        """
+        super().__init__("line")
+        self.line_client = line_client
+        self.outbox_dispatcher = outbox_dispatcher
+
+    def send(self, notifications: List[Notification]) -> Dict[str, Exception]:
+        """同じ内容の通知をまとめて送信.
+
+        Args:
+            notifications: 通知のリスト
+
+        Returns:
+            送信に失敗した通知先の名前 -> 例外の辞書（一部の記事だけ送信できた場合は
+            送信済みの記事を持つDeliveryError）
+        """
+        groups: Dict[Tuple[str, ...], List[Notification]] = {}
+        for notification in notifications:
+            groups.setdefault(self._content_key(notification), []).append(notification)
+
+        logger.info(
+            f"LINE通知送信開始: notifications={len(notifications)}件, 送信内容={len(groups)}種類"
+        )
+
+        errors: Dict[str, Exception] = {}
+        for group in groups.values():
+            target_names = list(dict.fromkeys(n.target_name for n in group))
+            try:
+                self._send_group(group, target_names)
+            except Exception as e:
+                logger.error(f"通知送信エラー: targets={'、'.join(target_names)} - {e}")
+                for target_name in target_names:
+                    errors[target_name] = e
+
+        if self.outbox_dispatcher is not None:
+            self.outbox_dispatcher.dispatch_due()
+        return errors
+
+    def send_notification(self, notification: Notification) -> None:
+        """通知を1件送信.
+
+        Args:
+            notification: 通知データ
+
+        Raises:
+            Exception: 送信に失敗した場合
+        """
+        errors = self.send([notification])
+        if errors:
+            raise errors[notification.target_name]
+
+    def _send_group(self, group: List[Notification], target_names: List[str]) -> None:
+        """同じ内容の通知のグループを送信.
+
+        Args:
+            group: 同じ内容の通知のリスト
+            target_names: グループの通知先の名前のリスト
+
+        Raises:
+            OSError: アウトボックスへの書き込みに失敗した場合
+            DeliveryError: 直接送信で送信に失敗した場合（送信済みの記事を保持する）
+        """
+        articles = group[0].articles
+        user_ids = list(dict.fromkeys(n.line_user_id for n in group))
+        label = "、".join(target_names)
+        # 複数の受信者に送るメッセージには、他の受信者の通知先の名前を含めない
+        message_label = label if len(user_ids) == 1 else ""
+
+        if self.outbox_dispatcher is not None:
+            news_requests = self.line_client.build_news_requests(user_ids, articles, message_label)
+            self.outbox_dispatcher.enqueue(news_requests, target_names)
+            logger.info(
+                f"通知をアウトボックスに保存: targets={label}, recipients={len(user_ids)}人, "
+                f"articles={len(articles)}件, requests={len(news_requests)}件"
+            )
+            return
+
+        if len(user_ids) == 1:
+            delivered = self.line_client.send_news_notification(
+                user_id=user_ids[0], articles=articles, target_name=message_label
+            )
+        else:
+            delivered = self.line_client.multicast_news_notification(
+                user_ids=user_ids, articles=articles, target_name=message_label
+            )
+        logger.info(
+            f"通知送信完了: targets={label}, recipients={len(user_ids)}人, "
+            f"articles={len(delivered)}件"
+        )
+
+    @staticmethod
+    def _content_key(notification: Notification) -> Tuple[str, ...]:
+        """通知内容の同一性を判定するキーを作成.
+
+        Args:
+            notification: 通知データ
+
+        Returns:
+            記事URLのタプル
+        """
+        return tuple(article.get_url_string() for article in notification.articles)
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 """ニュース関連性分析ビジネスロジック."""
 
-from typing import List
+import heapq
+from typing import Callable, List, Literal, Optional, Tuple
 
+from src.business.bm25_scorer import BM25Scorer
 from src.models.news_article import NewsArticle
 from src.utils.logger import get_logger
 
@@ -12,35 +14,145 @@ logger = get_logger(__name__)
 class NewsAnalyzer:
     """ニュース関連性分析クラス."""
 
-    def __init__(self) -> None:
-        """初期化."""
-        pass
+    def __init__(self, bm25_scorer: Optional[BM25Scorer] = None) -> None:
+        """初期化.
+
+        Args:
+            bm25_scorer: BM25スコアラー（scoring_method="bm25"使用時に必須）
+        """
+        self.bm25_scorer = bm25_scorer
 
     def analyze_relevance(
-        self, articles: List[NewsArticle], keywords: List[str]
+        self,
+        articles: List[NewsArticle],
+        keywords: List[str],
+        scoring_method: Literal["keyword", "bm25"] = "keyword",
     ) -> List[NewsArticle]:
         """記事の関連性を分析しスコアを付与.
 
         Args:
             articles: 記事のリスト
             keywords: キーワードのリスト
+            scoring_method: スコア算出方式（keyword: キーワード一致率, bm25: BM25F）
 
         Returns:
             関連性スコア付きの記事のリスト（スコア降順）
-        """
-        logger.info(f"関連性分析開始: articles={len(articles)}件, keywords={keywords}")
 
-        for article in articles:
-            score = self._calculate_relevance_score(article, keywords)
-            article.relevance_score = score
+        Raises:
+            ValueError: bm25指定時にBM25スコアラーが設定されていない場合
+        """
+        self.score_relevance(articles, keywords, scoring_method=scoring_method)
 
         # スコア降順でソート
         sorted_articles = sorted(
             articles, key=lambda x: x.relevance_score or 0.0, reverse=True
         )
+        return sorted_articles
+
+    def score_relevance(
+        self,
+        articles: List[NewsArticle],
+        keywords: List[str],
+        scoring_method: Literal["keyword", "bm25"] = "keyword",
+    ) -> List[NewsArticle]:
+        """記事の関連性スコアを付与（並び替えは行わない）.
+
+        Args:
+            articles: 記事のリスト
+            keywords: キーワードのリスト
+            scoring_method: スコア算出方式（keyword: キーワード一致率, bm25: BM25F）
+
+        Returns:
+            関連性スコア付きの記事のリスト（入力の順序のまま）
+
+        Raises:
+            ValueError: bm25指定時にBM25スコアラーが設定されていない場合
+        """
+        logger.info(
+            f"関連性分析開始: articles={len(articles)}件, keywords={keywords}, "
+            f"method={scoring_method}"
+        )
+
+        if scoring_method == "bm25":
+            if self.bm25_scorer is None:
+                raise ValueError("BM25スコアラーが設定されていません")
+            scores = self.bm25_scorer.score_articles(articles, keywords)
+            for article, score in zip(articles, scores):
+                article.relevance_score = score
+        else:
+            for article in articles:
+                score = self._calculate_relevance_score(article, keywords)
+                article.relevance_score = score
 
         logger.info("関連性分析完了")
-        return sorted_articles
+        return articles
+
+    def select_top_articles(
+        self,
+        articles: List[NewsArticle],
+        max_articles: int,
+        threshold: float = 0.0,
+        token_budget: Optional[int] = None,
+        token_estimator: Optional[Callable[[NewsArticle], int]] = None,
+    ) -> List[NewsArticle]:
+        """関連性スコア上位の記事を選択.
+
+        閾値未満およびスコア0の記事を除外しながら、サイズmax_articlesのヒープで
+        上位記事を1パスで選択する（全件ソートは行わない）。
+        token_budgetが指定された場合は、スコア順に見積もりトークン数を積み上げ、
+        予算に収まる記事だけを残す。
+
+        Args:
+            articles: 関連性スコア付きの記事のリスト
+            max_articles: 選択する記事数の上限
+            threshold: 関連性スコアの下限（この値以上を選択）
+            token_budget: 要約に使うLLMトークン数の上限（オプション）
+            token_estimator: 記事1件の要約に必要なトークン数を返す関数
+
+        Returns:
+            選択された記事のリスト（スコア降順）
+
+        Raises:
+            ValueError: token_budget指定時にtoken_estimatorが無い場合
+        """
+        if token_budget is not None and token_estimator is None:
+            raise ValueError("token_budget指定時はtoken_estimatorが必須です")
+
+        # (スコア, -入力順) の最小ヒープ。同点の場合は先に現れた記事を優先
+        heap: List[Tuple[float, int, NewsArticle]] = []
+        for index, article in enumerate(articles):
+            score = article.relevance_score or 0.0
+            if score <= 0.0 or score < threshold:
+                continue
+            item = (score, -index, article)
+            if len(heap) < max_articles:
+                heapq.heappush(heap, item)
+            elif item[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, item)
+
+        candidates = [item[2] for item in sorted(heap, key=lambda x: x[:2], reverse=True)]
+
+        selected = candidates
+        if token_budget is not None and token_estimator is not None:
+            selected = []
+            used_tokens = 0
+            for article in candidates:
+                tokens = token_estimator(article)
+                if used_tokens + tokens > token_budget:
+                    logger.debug(
+                        f"トークン予算超過のためスキップ: {article.title[:30]}... "
+                        f"(tokens={tokens})"
+                    )
+                    continue
+                used_tokens += tokens
+                selected.append(article)
+            logger.info(f"トークン予算: used={used_tokens}/{token_budget}")
+
+        logger.info(
+            f"上位記事選択: threshold={threshold}, max_articles={max_articles}, "
+            f"before={len(articles)}件, after={len(selected)}件"
+        )
+        return selected
 
     def _calculate_relevance_score(
         self, article: NewsArticle, keywords: List[str]
@@ -54,13 +166,10 @@ class NewsAnalyzer:
         Returns:
             関連性スコア（0.0〜1.0）
         """
-        # タイトルと説明文を結合
-        text = f"{article.title} {article.description}".lower()
-
-        # キーワードマッチング
+        # キーワードマッチング（正規化済みのタイトルと説明文を使用）
         matched_count = 0
         for keyword in keywords:
-            if keyword.lower() in text:
+            if article.contains_keyword(keyword):
                 matched_count += 1
 
         # スコア計算（マッチしたキーワード数 / 総キーワード数）
@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 """ニュース収集ビジネスロジック."""
 
-from typing import List
+from datetime import datetime
+from typing import Collection, List, Optional
 
 from src.infrastructure.cache_manager import CacheManager
 from src.infrastructure.google_news_client import GoogleNewsClient
 from src.models.news_article import NewsArticle
-from src.utils.date_helper import is_today_jst
+from src.utils.date_helper import UTC, get_today_start_jst
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,48 +28,75 @@ class NewsCollector:
         self.google_news_client = google_news_client
         self.cache_manager = cache_manager
 
-    def collect_news(self, keywords: List[str]) -> List[NewsArticle]:
+    def collect_news(
+        self,
+        keywords: List[str],
+        window_start: Optional[datetime] = None,
+        window_end: Optional[datetime] = None,
+        shared_keywords: Collection[str] = (),
+    ) -> List[NewsArticle]:
         """キーワードに基づいてニュースを収集.
 
         Args:
             keywords: 検索キーワードのリスト
+            window_start: 収集対象とする公開日時の下限（省略時は当日0時JST）
+            window_end: 収集対象とする公開日時の上限（省略時は現在時刻）
+            shared_keywords: 他の通知先と取得結果を共有するキーワード
 
         Returns:
-            収集したニュース記事のリスト（当日分のみ、未通知のみ）
+            収集したニュース記事のリスト（収集期間内のみ、未通知のみ）
         """
         logger.info(f"ニュース収集開始: keywords={keywords}")
 
-        # Google Newsからニュースを取得
-        all_articles = self.google_news_client.fetch_news_for_keywords(keywords)
-
-        # 当日のニュースのみフィルタリング
-        today_articles = self._filter_today_articles(all_articles)
-        logger.info(f"当日のニュース: {len(today_articles)}件")
-
-        # 未通知のニュースのみフィルタリング
-        new_articles = self._filter_unnotified_articles(today_articles)
+        # 収集期間は実行ごとに1回だけ計算する
+        if window_start is None:
+            window_start = get_today_start_jst()
+        if window_end is None:
+            window_end = datetime.now(UTC)
+
+        # Google Newsからニュースを取得（通知済みURLは記事データに変換する前に除外）
+        all_articles = self.google_news_client.fetch_news_for_keywords(
+            keywords, is_known_url=self.cache_manager.is_notified, shared_keywords=shared_keywords
+        )
+
+        # 収集期間内のニュースのみフィルタリング
+        window_articles = self._filter_articles_in_window(
+            all_articles, window_start, window_end
+        )
+        logger.info(
+            f"収集期間内のニュース: {len(window_articles)}件 "
+            f"({window_start.isoformat()} 〜 {window_end.isoformat()})"
+        )
+
+        # 未通知のニュースのみフィルタリング（URL表記の揺れに対する念のための確認）
+        new_articles = self._filter_unnotified_articles(window_articles)
         logger.info(f"未通知のニュース: {len(new_articles)}件")
 
         return new_articles
 
-    def _filter_today_articles(self, articles: List[NewsArticle]) -> List[NewsArticle]:
-        """当日のニュースのみフィルタリング.
+    def _filter_articles_in_window(
+        self, articles: List[NewsArticle], window_start: datetime, window_end: datetime
+    ) -> List[NewsArticle]:
+        """公開日時が収集期間内のニュースのみフィルタリング.
 
         Args:
             articles: 記事のリスト
+            window_start: 公開日時の下限（この時刻以降を対象）
+            window_end: 公開日時の上限（この時刻以前を対象）
 
         Returns:
-            当日の記事のみのリスト
+            収集期間内の記事のみのリスト
         """
-        today_articles = []
+        # 公開日時は取り込み時にUTCへ正規化済みのため、そのまま比較できる
+        window_articles = []
         for article in articles:
-            if is_today_jst(article.published_date):
-                today_articles.append(article)
+            if window_start <= article.published_date <= window_end:
+                window_articles.append(article)
             else:
                 logger.debug(
-                    f"当日以外の記事をスキップ: {article.title} ({article.published_date})"
+                    f"収集期間外の記事をスキップ: {article.title} ({article.published_date})"
                 )
-        return today_articles
+        return window_articles
 
     def _filter_unnotified_articles(
         self, articles: List[NewsArticle]
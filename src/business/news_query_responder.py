@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""LINEのメッセージで受け付けたニュース検索に応答するビジネスロジック."""
+
+import re
+from typing import Any, Dict, List, Literal, Optional
+
+from src.infrastructure.article_store import ArticleStore
+from src.infrastructure.flex_renderer import render_flex_message, render_text_message
+from src.infrastructure.keyword_config_loader import KeywordConfigLoader
+from src.models.news_article import NewsArticle
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 検索語から取り除く定型の言い回し（「AIの最新ニュース」「最新 AI」など）
+_FILLER_PATTERN = re.compile(
+    r"(について|を教えて|教えて|の最新|最新の|最新|ニュース|[?？!！。、])"
+)
+
+HELP_KEYWORDS = frozenset({"help", "ヘルプ", "使い方"})
+
+HELP_TEXT = (
+    "キーワードを送信すると、保存済みのニュースから最新の記事をお知らせします。\n"
+    "例: 「AI」「生成AI 規制」「最新」（キーワードなしで最新の記事）"
+)
+
+NOT_REGISTERED_TEXT = "ニュース検索は、通知先に登録されているユーザーのみ利用できます。"
+
+SearchScope = Literal["targets", "all"]
+
+
+class NewsQueryResponder:
+    """記事ストアの要約済み記事から、メッセージのキーワードに一致する記事で応答するクラス.
+
+    応答の経路ではニュースの取得やLLMの呼び出しを行わず、記事ストアの検索のみで
+    応答メッセージを組み立てる。
+
+    記事ストアはすべての通知先で共有されるため、検索範囲（search_scope）が
+    "targets"の場合は、送信者がキーワード設定の通知先に登録されていれば
+    その通知先に送信済みの記事だけを検索し、登録されていない送信者には応答しない。
+    "all"の場合は保存済みのすべての記事を検索する（キーワードの無いメッセージには、
+    送信者が通知先に登録されていればその通知先に送信済みの記事で応答する）。
+    """
+
+    def __init__(
+        self,
+        article_store: ArticleStore,
+        max_results: int = 5,
+        config_loader: Optional[KeywordConfigLoader] = None,
+        search_scope: SearchScope = "targets",
+    ) -> None:
+        """初期化.
+
+        Args:
+            article_store: 記事ストア
+            max_results: 応答する最大記事数（カルーセル1件に収まる数）
+            config_loader: 送信者の通知先を調べるキーワード設定のローダー（オプション）
+            search_scope: 検索範囲（targets: 送信者の通知先に送信済みの記事、all: すべての記事）
+        """
+        self.article_store = article_store
+        self.max_results = max_results
+        self.config_loader = config_loader
+        self.search_scope = search_scope
+
+    def build_reply(self, text: str, line_user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """受信したメッセージへの応答メッセージを作成.
+
+        Args:
+            text: 受信したテキストメッセージ
+            line_user_id: 送信者のLINE User ID（オプション）
+
+        Returns:
+            応答メッセージのJSON用辞書のリスト
+        """
+        if text.strip().lower() in HELP_KEYWORDS:
+            return [render_text_message(HELP_TEXT)]
+
+        query = self.parse_query(text)
+        target_names = self._get_target_names(line_user_id)
+
+        if self.search_scope == "targets":
+            if not target_names:
+                logger.info(f"通知先に登録されていない送信者の検索を拒否: user_id={line_user_id}")
+                return [render_text_message(NOT_REGISTERED_TEXT)]
+            articles = self.article_store.search(
+                query, limit=self.max_results, target_names=target_names
+            )
+            logger.info(f"ニュース検索: query='{query}', targets={target_names}, 一致={len(articles)}件")
+            return self._render(query, articles, latest_title="あなたへの最新ニュース")
+
+        if not query and target_names:
+            articles = self.article_store.search(
+                "", limit=self.max_results, target_names=target_names
+            )
+            if articles:
+                return self._render(query, articles, latest_title="あなたへの最新ニュース")
+
+        articles = self.article_store.search(query, limit=self.max_results)
+        logger.info(f"ニュース検索: query='{query}', 一致={len(articles)}件")
+        return self._render(query, articles, latest_title="最新ニュース")
+
+    def _get_target_names(self, line_user_id: Optional[str]) -> List[str]:
+        """送信者が送信先の通知先の名前を取得.
+
+        Args:
+            line_user_id: 送信者のLINE User ID（オプション）
+
+        Returns:
+            通知先の名前のリスト（登録されていない場合は空のリスト）
+        """
+        if not line_user_id or self.config_loader is None:
+            return []
+        return [target.name for target in self.config_loader.get_config().get_targets_by_user(line_user_id)]
+
+    @staticmethod
+    def _render(query: str, articles: List[NewsArticle], latest_title: str) -> List[Dict[str, Any]]:
+        """検索結果の応答メッセージを作成.
+
+        Args:
+            query: 検索語
+            articles: 検索結果の記事のリスト
+            latest_title: 検索語が無い場合の見出し
+
+        Returns:
+            応答メッセージのJSON用辞書のリスト
+        """
+        if not articles:
+            if not query:
+                return [render_text_message("お知らせできるニュースはまだありません。")]
+            return [render_text_message(f"「{query}」に一致するニュースは見つかりませんでした。")]
+
+        title = f"「{query}」の最新ニュース" if query else latest_title
+        return [render_flex_message(articles, title, alt_text=f"{title}: {len(articles)}件")]
+
+    @staticmethod
+    def parse_query(text: str) -> str:
+        """メッセージから検索語を取り出す.
+
+        Args:
+            text: 受信したテキストメッセージ
+
+        Returns:
+            空白区切りの検索語（キーワードが無い場合は空文字列）
+        """
+        return " ".join(_FILLER_PATTERN.sub(" ", text).split())
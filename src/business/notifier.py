@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
 """通知ビジネスロジック."""
 
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
+from src.business.line_channel import LineChannel
+from src.business.outbox_dispatcher import OutboxDispatcher
 from src.infrastructure.cache_manager import CacheManager
-from src.infrastructure.line_client import LineClient
+from src.infrastructure.line_client import DeliveryError, LineClient
+from src.infrastructure.notification_channel import NotificationChannel
 from src.models.news_article import NewsArticle
 from src.models.notification import Notification
 from src.utils.logger import get_logger
@@ -15,15 +20,25 @@ logger = get_logger(__name__)
 class Notifier:
     """通知管理クラス."""
 
-    def __init__(self, line_client: LineClient, cache_manager: CacheManager) -> None:
+    def __init__(
+        self,
+        line_client: LineClient,
+        cache_manager: CacheManager,
+        outbox_dispatcher: Optional[OutboxDispatcher] = None,
+    ) -> None:
         """初期化.
 
         Args:
             line_client: LINEクライアント
             cache_manager: キャッシュマネージャー
+            outbox_dispatcher: アウトボックス経由で送信する場合のディスパッチャー（オプション）
         """
         self.line_client = line_client
         self.cache_manager = cache_manager
+        self.line_channel = LineChannel(line_client, outbox_dispatcher)
+        self.channel_latencies: Dict[str, float] = {}
+        self.channel_failures: Dict[str, Dict[str, Tuple[List[NewsArticle], Exception]]] = {}
+        self._pending: List[Tuple[Notification, List[NotificationChannel]]] = []
 
     def send_notification(
         self, target_name: str, line_user_id: str, articles: List[NewsArticle]
@@ -49,19 +64,182 @@ class Notifier:
 
         try:
             # LINE通知を送信
-            self.line_client.send_news_notification(
+            delivered = self.line_client.send_news_notification(
                 user_id=line_user_id, articles=articles, target_name=target_name
             )
+        except DeliveryError as e:
+            # 送信できた記事だけを通知済みにする
+            self._mark_notified(e.delivered_articles)
+            logger.error(f"通知送信エラー: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"通知送信エラー: {e}")
+            raise
+
+        self._mark_notified(delivered)
+        logger.info(f"通知送信完了: {len(delivered)}件")
+
+    def queue_notification(
+        self,
+        target_name: str,
+        line_user_id: str,
+        articles: List[NewsArticle],
+        channels: Optional[List[NotificationChannel]] = None,
+    ) -> None:
+        """通知を送信待ちに追加（flushでまとめて送信する）.
+
+        Args:
+            target_name: 通知先の名前
+            line_user_id: LINE User ID
+            articles: 通知する記事のリスト
+            channels: 送信する通知チャンネルのリスト（省略時はLINEのみ）
+        """
+        if not articles:
+            logger.info("通知する記事がありません")
+            return
+
+        self._pending.append(
+            (
+                self.create_notification(target_name, line_user_id, articles),
+                channels or [self.line_channel],
+            )
+        )
+
+    def flush(self) -> Dict[str, Exception]:
+        """送信待ちの通知をチャンネルごとにまとめて並行して送信.
+
+        チャンネルごとに独立して送信・リトライするため、遅いチャンネルが他の
+        チャンネルの送信を待たせない。チャンネルごとの所要時間はログに出力し、
+        channel_latenciesに保持する。
+
+        配信の結果はチャンネルごとに判定する。いずれかのチャンネルで送信できた
+        通知先は完了とし、送信できた記事を通知済みとする（LINEのアウトボックスを
+        使う場合は保存できた時点）。一部のチャンネルだけが失敗した場合は、
+        そのチャンネルで送信できなかった記事をchannel_failuresに保持する。
+
+        Returns:
+            すべてのチャンネルで送信に失敗した通知先の名前 -> 例外の辞書
+        """
+        pending, self._pending = self._pending, []
+        self.channel_failures = {}
+        if not pending:
+            return {}
+
+        channel_notifications: Dict[int, Tuple[NotificationChannel, List[Notification]]] = {}
+        for notification, channels in pending:
+            for channel in channels:
+                channel_notifications.setdefault(id(channel), (channel, []))[1].append(
+                    notification
+                )
 
-            # 通知済みURLをキャッシュに追加
-            urls = [article.get_url_string() for article in articles]
-            self.cache_manager.add_notified_urls(urls)
+        logger.info(
+            f"通知送信開始: notifications={len(pending)}件, "
+            f"channels={len(channel_notifications)}件"
+        )
+
+        self.channel_latencies = {}
+        channel_errors: Dict[int, Dict[str, Exception]] = {}
+        with ThreadPoolExecutor(max_workers=len(channel_notifications)) as executor:
+            futures = {
+                channel_id: executor.submit(self._send_to_channel, channel, notifications)
+                for channel_id, (channel, notifications) in channel_notifications.items()
+            }
+            for channel_id, future in futures.items():
+                channel_errors[channel_id] = future.result()
+
+        # 通知先ごとに、チャンネル -> (送信した記事, 失敗した場合の例外)をまとめる
+        outcomes: Dict[str, List[Tuple[NotificationChannel, List[NewsArticle], Optional[Exception]]]] = {}
+        for notification, channels in pending:
+            for channel in channels:
+                outcomes.setdefault(notification.target_name, []).append(
+                    (
+                        channel,
+                        notification.articles,
+                        channel_errors[id(channel)].get(notification.target_name),
+                    )
+                )
+
+        errors: Dict[str, Exception] = {}
+        for target_name, results in outcomes.items():
+            failures = [(channel, articles, e) for channel, articles, e in results if e is not None]
+            for _channel, articles, failure in results:
+                if failure is None:
+                    self._mark_notified(articles)
+                elif isinstance(failure, DeliveryError):
+                    # 送信できた記事だけを通知済みにする
+                    self._mark_notified(failure.delivered_articles)
+
+            if len(failures) == len(results):
+                errors[target_name] = failures[0][2]
+                continue
+            for channel, articles, failure in failures:
+                undelivered = self._undelivered_articles(articles, failure)
+                if undelivered:
+                    self.channel_failures.setdefault(target_name, {})[channel.name] = (
+                        undelivered,
+                        failure,
+                    )
+
+        return errors
+
+    @staticmethod
+    def _undelivered_articles(articles: List[NewsArticle], failure: Exception) -> List[NewsArticle]:
+        """送信に失敗したチャンネルで送信できなかった記事を求める.
+
+        Args:
+            articles: チャンネルに送信した記事のリスト
+            failure: チャンネルの送信エラー
+
+        Returns:
+            送信できなかった記事のリスト
+        """
+        if not isinstance(failure, DeliveryError):
+            return articles
+        delivered_urls = {article.get_url_string() for article in failure.delivered_articles}
+        return [article for article in articles if article.get_url_string() not in delivered_urls]
+
+    def _send_to_channel(
+        self, channel: NotificationChannel, notifications: List[Notification]
+    ) -> Dict[str, Exception]:
+        """1つのチャンネルに通知を送信し、所要時間を記録.
 
-            logger.info(f"通知送信完了: {len(articles)}件")
+        Args:
+            channel: 通知チャンネル
+            notifications: 通知のリスト
 
+        Returns:
+            送信に失敗した通知先の名前 -> 例外の辞書
+        """
+        started = time.perf_counter()
+        try:
+            errors = channel.send(notifications)
         except Exception as e:
-            logger.error(f"通知送信エラー: {e}")
-            raise
+            logger.error(f"通知チャンネルの送信エラー: channel={channel.name} - {e}")
+            errors = {notification.target_name: e for notification in notifications}
+
+        elapsed = time.perf_counter() - started
+        self.channel_latencies[channel.name] = elapsed
+        logger.info(
+            f"チャンネル送信完了: channel={channel.name}, notifications={len(notifications)}件, "
+            f"失敗={len(errors)}件, 所要時間={elapsed:.2f}秒"
+        )
+        return errors
+
+    def _mark_notified(self, articles: List[NewsArticle]) -> None:
+        """送信できた記事を通知済みとしてキャッシュに追加.
+
+        Args:
+            articles: 送信できた記事のリスト
+        """
+        if articles:
+            # 類似記事として除外した記事も同じニュースとして通知済みにする
+            self.cache_manager.add_notified_urls(
+                [
+                    url
+                    for article in articles
+                    for url in [article.get_url_string(), *article.duplicate_urls]
+                ]
+            )
 
     def send_error_notification(self, line_user_id: str, error_message: str) -> None:
         """エラー通知を送信.
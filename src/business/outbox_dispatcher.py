@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""アウトボックスに保存した通知の送信・再送ビジネスロジック."""
+
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.infrastructure.line_client import LineClient
+from src.infrastructure.outbox_manager import OutboxManager
+from src.infrastructure.resilience import CircuitOpenError, RetryPolicy, is_transient_error
+from src.models.news_article import NewsArticle
+from src.models.outbox_entry import OutboxEntry
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class OutboxDispatcher:
+    """アウトボックスの通知をリトライキー付きで送信するクラス.
+
+    送信前にリクエストをアウトボックスへ永続化し、送信に成功したものだけを削除する。
+    一時的な障害で失敗したものは指数バックオフで次回の送信時刻をずらして残し、
+    同じ実行中のdrainまたは次回以降の実行で同じリトライキーのまま再送する。
+    再送を諦めてfailedディレクトリに移動したエントリーはpop_failed_entriesで取り出し、
+    記事が届かなかったことを通知先に知らせる。
+    """
+
+    def __init__(
+        self,
+        line_client: LineClient,
+        outbox_manager: OutboxManager,
+        base_delay: float = 30.0,
+        max_delay: float = 3600.0,
+        max_age_hours: float = 24.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """初期化.
+
+        Args:
+            line_client: LINEクライアント
+            outbox_manager: アウトボックスマネージャー
+            base_delay: 再送間隔の基準（秒）
+            max_delay: 再送間隔の上限（秒）
+            max_age_hours: 再送を諦めるまでの時間（LINEがリトライキーを保持する24時間以内）
+            clock: 現在日時を返す関数
+            sleep: 待機関数
+        """
+        self.line_client = line_client
+        self.outbox_manager = outbox_manager
+        self.retry_policy = RetryPolicy(base_delay=base_delay, max_delay=max_delay)
+        self.max_age = timedelta(hours=max_age_hours)
+        self._clock = clock
+        self._sleep = sleep
+        self._failed_entries: List[OutboxEntry] = []
+
+    def enqueue(
+        self,
+        news_requests: List[Tuple[str, Dict[str, Any], List[NewsArticle]]],
+        target_names: List[str],
+    ) -> List[OutboxEntry]:
+        """送信するリクエストをアウトボックスに保存.
+
+        すべてのリクエストを保存できた場合のみ保存したとみなし、途中で書き込みに
+        失敗した場合は保存済みのエントリーを削除する（記事は未通知のまま次回に送信する）。
+
+        Args:
+            news_requests: (エンドポイント名, リクエストボディ, 含まれる記事)のリスト
+            target_names: 通知先の名前のリスト
+
+        Returns:
+            保存したエントリーのリスト
+
+        Raises:
+            OSError: アウトボックスへの書き込みに失敗した場合
+        """
+        now = self._clock()
+        entries = []
+        for endpoint, payload, articles in news_requests:
+            entry = OutboxEntry(
+                retry_key=str(uuid.uuid4()),
+                endpoint=endpoint,
+                payload=payload,
+                target_names=target_names,
+                article_urls=[article.get_url_string() for article in articles],
+                created_at=now,
+                next_attempt_at=now,
+            )
+            try:
+                self.outbox_manager.save(entry)
+            except OSError:
+                for saved in entries:
+                    self.outbox_manager.remove(saved)
+                raise
+            entries.append(entry)
+
+        logger.debug(f"アウトボックスに追加: {len(entries)}件, targets={target_names}")
+        return entries
+
+    def deliver(self, entry: OutboxEntry) -> bool:
+        """エントリーを1回送信.
+
+        成功した場合はアウトボックスから削除する。一時的な障害の場合は次回の送信時刻を
+        更新して残し、それ以外のエラーや期限切れの場合はfailedディレクトリに移動する。
+
+        Args:
+            entry: 送信待ちエントリー
+
+        Returns:
+            送信に成功した場合True
+        """
+        now = self._clock()
+        if now - entry.created_at > self.max_age:
+            logger.error(
+                f"再送期限切れのため送信を中止: retry_key={entry.retry_key}, "
+                f"targets={entry.target_names}, attempts={entry.attempts}回"
+            )
+            entry.last_error = (
+                f"再送期限切れ（最後のエラー: {entry.last_error}）" if entry.last_error else "再送期限切れ"
+            )
+            self._give_up(entry)
+            return False
+
+        entry.attempts += 1
+        try:
+            self.line_client.send_request(entry.endpoint, entry.payload, entry.retry_key)
+        except Exception as e:
+            entry.last_error = str(e)
+            if not (is_transient_error(e) or isinstance(e, CircuitOpenError)):
+                logger.error(
+                    f"通知送信エラー（再送不可）: retry_key={entry.retry_key}, "
+                    f"targets={entry.target_names} - {e}"
+                )
+                self._give_up(entry)
+                return False
+
+            delay = self.retry_policy.get_delay(entry.attempts, e)
+            entry.next_attempt_at = now + timedelta(seconds=delay)
+            self.outbox_manager.save(entry)
+            logger.warning(
+                f"通知送信エラー（{delay:.0f}秒後に再送）: retry_key={entry.retry_key}, "
+                f"attempts={entry.attempts}回 - {e}"
+            )
+            return False
+
+        self.outbox_manager.remove(entry)
+        logger.info(
+            f"アウトボックスから送信完了: targets={entry.target_names}, "
+            f"articles={len(entry.article_urls)}件, attempts={entry.attempts}回"
+        )
+        return True
+
+    def _give_up(self, entry: OutboxEntry) -> None:
+        """エントリーの再送を諦めてfailedディレクトリに移動.
+
+        Args:
+            entry: 送信を中止するエントリー
+        """
+        self.outbox_manager.move_to_failed(entry)
+        self._failed_entries.append(entry)
+
+    def pop_failed_entries(self) -> List[OutboxEntry]:
+        """前回の呼び出し以降に再送を諦めたエントリーを取り出す.
+
+        Returns:
+            送信を中止したエントリーのリスト
+        """
+        failed_entries, self._failed_entries = self._failed_entries, []
+        return failed_entries
+
+    def dispatch_due(self) -> int:
+        """送信時刻を迎えたエントリーを古い順に送信.
+
+        Returns:
+            アウトボックスに残っているエントリーの件数
+        """
+        now = self._clock()
+        for entry in self.outbox_manager.list_entries():
+            if entry.next_attempt_at <= now:
+                self.deliver(entry)
+        return len(self.outbox_manager.list_entries())
+
+    def drain(self, max_wait_seconds: float) -> int:
+        """アウトボックスが空になるか待機時間の上限に達するまで再送を繰り返す.
+
+        Args:
+            max_wait_seconds: 再送のために待機する時間の上限（秒）
+
+        Returns:
+            アウトボックスに残っているエントリーの件数（次回の実行で再送する）
+        """
+        give_up_at = self._clock() + timedelta(seconds=max_wait_seconds)
+        while True:
+            if self.dispatch_due() == 0:
+                return 0
+
+            entries = self.outbox_manager.list_entries()
+            next_attempt_at = min(entry.next_attempt_at for entry in entries)
+            if next_attempt_at > give_up_at:
+                logger.warning(f"未送信の通知を次回の実行で再送します: {len(entries)}件")
+                return len(entries)
+
+            wait = (next_attempt_at - self._clock()).total_seconds()
+            if wait > 0:
+                self._sleep(wait)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""キーワードの取得頻度を産出実績に応じて調整するビジネスロジック."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.infrastructure.keyword_stats_manager import KeywordStatsManager
+from src.models.news_article import NewsArticle
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PollingScheduler:
+    """キーワードごとの取得間隔を決めるスケジューラー.
+
+    新着記事が続けて得られないキーワードほど取得間隔（実行回数単位）を
+    指数的に延ばし、新着記事が得られたら毎回取得に戻す。
+    """
+
+    def __init__(
+        self,
+        stats_manager: KeywordStatsManager,
+        hot_threshold: int = 2,
+        max_interval: int = 16,
+    ) -> None:
+        """初期化.
+
+        Args:
+            stats_manager: キーワード実績マネージャー
+            hot_threshold: 毎回取得を続ける「新着なし」の連続回数の上限
+            max_interval: 取得間隔（実行回数）の上限
+        """
+        self.stats_manager = stats_manager
+        self.hot_threshold = hot_threshold
+        self.max_interval = max_interval
+
+    def get_interval(self, consecutive_empty: int) -> int:
+        """新着なしの連続回数から取得間隔を算出.
+
+        Args:
+            consecutive_empty: 新着記事が無かった連続回数
+
+        Returns:
+            取得間隔（1なら毎回取得）
+        """
+        if consecutive_empty < self.hot_threshold:
+            return 1
+        exponent = consecutive_empty - self.hot_threshold + 1
+        return min(2**exponent, self.max_interval)
+
+    def select_keywords(self, target_name: str, keywords: List[str]) -> List[str]:
+        """今回の実行で取得するキーワードを選択.
+
+        Args:
+            target_name: 通知先の名前
+            keywords: 通知先のキーワードのリスト
+
+        Returns:
+            今回取得するキーワードのリスト
+        """
+        due_keywords = []
+        for keyword in keywords:
+            stats = self.stats_manager.get_stats(target_name, keyword)
+            interval = self.get_interval(stats["consecutive_empty"])
+            if stats["skipped_runs"] + 1 >= interval:
+                due_keywords.append(keyword)
+                logger.info(
+                    f"キーワード取得: {keyword} (interval={interval}, "
+                    f"empty_streak={stats['consecutive_empty']}, "
+                    f"last_new={stats['last_new_at']})"
+                )
+            else:
+                stats["skipped_runs"] += 1
+                logger.info(
+                    f"キーワードをスキップ: {keyword} (interval={interval}, "
+                    f"次回取得まで残り{interval - stats['skipped_runs']}回, "
+                    f"last_new={stats['last_new_at']})"
+                )
+
+        self.stats_manager.save()
+        logger.info(
+            f"取得キーワード選択: target={target_name}, "
+            f"due={len(due_keywords)}/{len(keywords)}件"
+        )
+        return due_keywords
+
+    def get_oldest_last_polled_at(
+        self, target_name: str, keywords: List[str]
+    ) -> Optional[datetime]:
+        """キーワードのうち最も古い最終取得時刻を取得.
+
+        スキップしていたキーワードの取りこぼしを防ぐため、収集期間の開始時刻の
+        算出に使用する。
+
+        Args:
+            target_name: 通知先の名前
+            keywords: キーワードのリスト
+
+        Returns:
+            最も古い最終取得時刻、いずれも未取得の場合はNone
+        """
+        polled_times = [
+            polled_at
+            for keyword in keywords
+            if (polled_at := self.stats_manager.get_last_polled_at(target_name, keyword))
+            is not None
+        ]
+        return min(polled_times) if polled_times else None
+
+    def record_results(
+        self,
+        target_name: str,
+        polled_keywords: List[str],
+        new_articles: List[NewsArticle],
+        polled_at: datetime,
+        window_start: datetime,
+    ) -> None:
+        """取得結果からキーワードごとの実績を更新.
+
+        新着記事はローカルのキーワードマッチングで各キーワードに割り当てる。
+        収集期間の重なりで前回までに数えた記事が再び得られても、新着としては数えない。
+
+        Args:
+            target_name: 通知先の名前
+            polled_keywords: 今回取得したキーワードのリスト
+            new_articles: 今回得られた未通知の記事のリスト
+            polled_at: 実行の開始時刻
+            window_start: 今回の収集期間の開始時刻（これより前に公開された記事の記録は破棄する）
+        """
+        for keyword in polled_keywords:
+            stats = self.stats_manager.get_stats(target_name, keyword)
+            counted_urls = self._get_counted_urls(stats, window_start)
+            new_count = 0
+            for article in new_articles:
+                url = article.get_url_string()
+                if url in counted_urls or not article.contains_keyword(keyword):
+                    continue
+                counted_urls[url] = article.published_date.isoformat()
+                new_count += 1
+
+            stats["fetch_count"] += 1
+            stats["new_article_count"] += new_count
+            stats["skipped_runs"] = 0
+            stats["last_polled_at"] = polled_at.isoformat()
+            if new_count > 0:
+                stats["consecutive_empty"] = 0
+                stats["last_new_at"] = polled_at.isoformat()
+            else:
+                stats["consecutive_empty"] += 1
+
+            yield_rate = stats["new_article_count"] / stats["fetch_count"]
+            logger.info(
+                f"キーワード実績: {keyword} new={new_count}件, "
+                f"yield={yield_rate:.2f}件/回, "
+                f"next_interval={self.get_interval(stats['consecutive_empty'])}"
+            )
+
+        self.stats_manager.save()
+
+    @staticmethod
+    def _get_counted_urls(stats: Dict[str, Any], window_start: datetime) -> Dict[str, str]:
+        """新着として数えた記事のURLを取得し、収集期間より前に公開された記事を破棄.
+
+        Args:
+            stats: キーワードの実績
+            window_start: 今回の収集期間の開始時刻
+
+        Returns:
+            記事URL -> 公開日時（ISO形式）の辞書（変更は実績に反映される）
+        """
+        counted_urls: Dict[str, str] = stats.setdefault("counted_urls", {})
+        for url in [
+            url
+            for url, published in counted_urls.items()
+            if datetime.fromisoformat(published) < window_start
+        ]:
+            del counted_urls[url]
+        return counted_urls
@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
 """ニュース要約ビジネスロジック."""
 
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, List, Optional, Set
 
+from src.business.extractive_summarizer import ExtractiveSummarizer
+from src.infrastructure.article_store import ArticleStore
 from src.infrastructure.llm_client import LLMClient
 from src.models.news_article import NewsArticle
+from src.utils.html_cleaner import clean_description
 from src.utils.logger import get_logger
+from src.utils.token_counter import estimate_tokens, truncate_to_tokens
 
 logger = get_logger(__name__)
 
@@ -13,46 +20,146 @@ logger = get_logger(__name__)
 class Summarizer:
     """ニュース要約クラス."""
 
-    def __init__(self, llm_client: LLMClient) -> None:
+    # 要約出力に見込むトークン数
+    EXPECTED_OUTPUT_TOKENS = 200
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        max_input_tokens: int = 512,
+        fallback_summarizer: Optional[ExtractiveSummarizer] = None,
+        clock: Callable[[], float] = time.monotonic,
+        article_store: Optional[ArticleStore] = None,
+    ) -> None:
         """初期化.
 
         Args:
             llm_client: LLMクライアント
+            max_input_tokens: 要約対象テキスト1件あたりの最大入力トークン数
+            fallback_summarizer: LLMで要約できない場合の抽出型要約（省略時はデフォルト設定）
+            clock: 現在時刻（秒）を返す関数（期限の判定に使用）
+            article_store: 要約を保存・再利用する記事ストア（オプション）
         """
         self.llm_client = llm_client
-
-    def summarize_articles(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+        self.max_input_tokens = max_input_tokens
+        self.fallback_summarizer = fallback_summarizer or ExtractiveSummarizer()
+        self._clock = clock
+        self.article_store = article_store
+
+        # プロンプトの定型部分（システム指示と入力部分の枠）のトークン数
+        template = llm_client.prompt_template
+        self.prompt_overhead_tokens = estimate_tokens(
+            template.system_instruction
+        ) + estimate_tokens(template.render(""))
+
+    def summarize_articles(
+        self, articles: List[NewsArticle], deadline: Optional[float] = None
+    ) -> List[NewsArticle]:
         """記事のリストを要約.
 
+        期限を過ぎた場合はLLMの応答を待たずに打ち切り、残りの記事は
+        抽出型要約で埋める。記事ストアがある場合は、同じプロンプトテンプレートで
+        要約済みの記事はLLMを呼び出さずに保存済みの要約を使い、要約した記事を保存する。
+
         Args:
             articles: 記事のリスト
+            deadline: 要約を打ち切る時刻（clockと同じ基準。Noneの場合は無制限）
 
         Returns:
             要約付きの記事のリスト
 
         Note:
-            要約に失敗した記事はsummaryがNoneのまま
+            LLMでの要約に失敗した記事、期限を過ぎた記事は抽出型要約になり、
+            summary_sourceが"extractive"になる
         """
         logger.info(f"要約生成開始: articles={len(articles)}件")
 
+        reused_urls = self._apply_stored_summaries(articles)
         summarized_count = 0
-        failed_count = 0
+        degraded_count = 0
+        total_input_tokens = 0
+        deadline_exceeded = False
+
+        # 期限がある場合は別スレッドで呼び出し、残り時間だけ応答を待つ
+        executor = ThreadPoolExecutor(max_workers=1) if deadline is not None else None
+        try:
+            for article in articles:
+                if article.get_url_string() in reused_urls:
+                    continue
+                remaining = None if deadline is None else deadline - self._clock()
+                if deadline_exceeded or (remaining is not None and remaining <= 0):
+                    deadline_exceeded = True
+                    self._apply_fallback(article)
+                    degraded_count += 1
+                    continue
+
+                try:
+                    text = self._build_input_text(article)
+                    input_tokens = estimate_tokens(text)
+                    total_input_tokens += input_tokens
+                    logger.info(
+                        f"要約入力: tokens={input_tokens} "
+                        f"(整形前={estimate_tokens(self._build_raw_text(article))}) "
+                        f"{article.title[:30]}..."
+                    )
+                    if executor is None:
+                        summary = self.llm_client.summarize(text)
+                    else:
+                        future = executor.submit(self.llm_client.summarize, text)
+                        summary = future.result(timeout=remaining)
+                    article.summary = summary
+                    article.summary_source = "llm"
+                    summarized_count += 1
+                    logger.debug(f"要約成功: {article.title[:30]}...")
+                except FutureTimeoutError:
+                    logger.warning(
+                        f"要約の期限を超過したため残りの記事は簡易要約にします: "
+                        f"{article.title[:30]}..."
+                    )
+                    deadline_exceeded = True
+                    self._apply_fallback(article)
+                    degraded_count += 1
+                except Exception as e:
+                    logger.warning(f"要約失敗のため簡易要約にします: {article.title[:30]}... - {e}")
+                    self._apply_fallback(article)
+                    degraded_count += 1
+        finally:
+            if executor is not None:
+                # 応答待ちのLLM呼び出しは待たない（HTTPのタイムアウトで終了する）
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(
+            f"要約生成完了: 成功={summarized_count}件, 簡易要約={degraded_count}件, "
+            f"再利用={len(reused_urls)}件, 入力トークン合計={total_input_tokens}"
+        )
+        if self.article_store is not None:
+            self.article_store.save_articles(
+                articles, summary_template=self.llm_client.prompt_template.cache_key
+            )
+        return articles
+
+    def _apply_stored_summaries(self, articles: List[NewsArticle]) -> Set[str]:
+        """記事ストアに保存済みのLLMの要約を記事に設定.
+
+        Args:
+            articles: 記事のリスト
+
+        Returns:
+            保存済みの要約を設定した記事のURLの集合
+        """
+        if self.article_store is None or not articles:
+            return set()
 
+        summaries = self.article_store.get_summaries(
+            [article.get_url_string() for article in articles],
+            self.llm_client.prompt_template.cache_key,
+        )
         for article in articles:
-            try:
-                # タイトルと説明文を結合して要約
-                text = f"{article.title}\n\n{article.description}"
-                summary = self.llm_client.summarize(text)
+            summary = summaries.get(article.get_url_string())
+            if summary is not None:
                 article.summary = summary
-                summarized_count += 1
-                logger.debug(f"要約成功: {article.title[:30]}...")
-            except Exception as e:
-                logger.warning(f"要約失敗: {article.title[:30]}... - {e}")
-                article.summary = None
-                failed_count += 1
-
-        logger.info(f"要約生成完了: 成功={summarized_count}件, 失敗={failed_count}件")
-        return articles
+                article.summary_source = "llm"
+        return set(summaries)
 
     def summarize_article(self, article: NewsArticle) -> NewsArticle:
         """単一記事を要約.
@@ -69,11 +176,80 @@ class Summarizer:
         logger.info(f"要約生成: {article.title[:50]}...")
 
         try:
-            text = f"{article.title}\n\n{article.description}"
+            text = self._build_input_text(article)
             summary = self.llm_client.summarize(text)
             article.summary = summary
+            article.summary_source = "llm"
             logger.info("要約生成成功")
             return article
         except Exception as e:
             logger.error(f"要約生成失敗: {e}")
             raise
+
+    def _apply_fallback(self, article: NewsArticle) -> None:
+        """抽出型要約を記事に設定.
+
+        Args:
+            article: ニュース記事
+        """
+        article.summary = self.fallback_summarizer.summarize(article)
+        article.summary_source = "extractive"
+
+    def estimate_request_tokens(self, article: NewsArticle) -> int:
+        """記事1件の要約にかかるLLMトークン数を概算.
+
+        Args:
+            article: ニュース記事
+
+        Returns:
+            入力（プロンプト込み）と出力の概算トークン数の合計
+        """
+        return (
+            estimate_tokens(self._build_input_text(article))
+            + self.prompt_overhead_tokens
+            + self.EXPECTED_OUTPUT_TOKENS
+        )
+
+    def estimate_max_request_tokens(self, article: NewsArticle) -> int:
+        """本文を取得する前提で、記事1件の要約にかかるLLMトークン数の上限を概算.
+
+        本文の長さは取得するまで分からないため、最大入力トークン数を使って見積もる。
+
+        Args:
+            article: ニュース記事
+
+        Returns:
+            入力（プロンプト込み）と出力の概算トークン数の合計の上限
+        """
+        return max(
+            self.estimate_request_tokens(article),
+            self.max_input_tokens + self.prompt_overhead_tokens + self.EXPECTED_OUTPUT_TOKENS,
+        )
+
+    def _build_input_text(self, article: NewsArticle) -> str:
+        """LLMに渡す要約対象テキストを作成.
+
+        記事ページの本文があれば本文を、なければHTMLとタイトル・配信元の重複を
+        取り除いた説明文を使い、最大入力トークン数に収まるように切り詰める。
+
+        Args:
+            article: ニュース記事
+
+        Returns:
+            タイトルと本文（または整形済み説明文）を結合したテキスト
+        """
+        content = article.body or clean_description(article.description, article.title)
+        text = f"{article.title}\n\n{content}" if content else article.title
+        return truncate_to_tokens(text, self.max_input_tokens)
+
+    @staticmethod
+    def _build_raw_text(article: NewsArticle) -> str:
+        """整形前の要約対象テキストを作成（入力トークン削減量のログ用）.
+
+        Args:
+            article: ニュース記事
+
+        Returns:
+            タイトルと説明文をそのまま結合したテキスト
+        """
+        return f"{article.title}\n\n{article.description}"
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""記事URLのリダイレクト先・抽出済み本文・取得失敗のキャッシュ管理モジュール."""
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ArticleCacheManager:
+    """リダイレクト元URL -> 正規URL、正規URL -> 本文をTTL付きで永続化するマネージャー.
+
+    同じ記事が別のリダイレクトURLで配信されても、正規URLの本文を再利用できる。
+    取得に失敗したURLと記事URLを復元できないリンクは短い有効期間で記録し、
+    その間は実行ごとに取得し直さない。
+    """
+
+    def __init__(
+        self, cache_file: str, ttl_hours: float = 72.0, failure_ttl_hours: float = 1.0
+    ) -> None:
+        """初期化.
+
+        Args:
+            cache_file: キャッシュファイルのパス
+            ttl_hours: キャッシュの有効期間（時間）
+            failure_ttl_hours: 取得失敗の記録の有効期間（時間）
+        """
+        self.cache_file = Path(cache_file)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = timedelta(hours=ttl_hours)
+        self.failure_ttl = timedelta(hours=failure_ttl_hours)
+        self._lock = threading.Lock()
+        data = self._load_cache()
+        self._redirects: Dict[str, Dict[str, Any]] = data.get("redirects", {})
+        self._bodies: Dict[str, Dict[str, Any]] = data.get("bodies", {})
+        self._failures: Dict[str, Dict[str, Any]] = data.get("failures", {})
+        self._purge_expired()
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """キャッシュファイルから読み込み.
+
+        Returns:
+            キャッシュデータ
+        """
+        if not self.cache_file.exists():
+            logger.info(f"記事キャッシュファイルが存在しないため新規作成します: {self.cache_file}")
+            return {}
+
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            logger.info(
+                f"記事キャッシュを読み込みました: "
+                f"redirects={len(data.get('redirects', {}))}件, "
+                f"bodies={len(data.get('bodies', {}))}件"
+            )
+            return data
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"記事キャッシュファイルの読み込みに失敗しました: {e}")
+            return {}
+
+    def save(self) -> None:
+        """キャッシュファイルに保存."""
+        with self._lock:
+            data = {
+                "redirects": dict(self._redirects),
+                "bodies": dict(self._bodies),
+                "failures": dict(self._failures),
+            }
+        try:
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            logger.debug(f"記事キャッシュを保存しました: bodies={len(data['bodies'])}件")
+        except IOError as e:
+            logger.error(f"記事キャッシュファイルの保存に失敗しました: {e}")
+
+    def _purge_expired(self) -> None:
+        """有効期限切れのエントリを削除."""
+        for entries, ttl in (
+            (self._redirects, self.ttl),
+            (self._bodies, self.ttl),
+            (self._failures, self.failure_ttl),
+        ):
+            for key in [key for key, entry in entries.items() if self._is_expired(entry, ttl)]:
+                del entries[key]
+
+    def _is_expired(self, entry: Dict[str, Any], ttl: Optional[timedelta] = None) -> bool:
+        """エントリが有効期限切れかどうか判定.
+
+        Args:
+            entry: キャッシュのエントリ
+            ttl: 有効期間（省略時は本文・リダイレクト先の有効期間）
+
+        Returns:
+            有効期限切れ、または取得日時が不正な場合True
+        """
+        try:
+            fetched_at = datetime.fromisoformat(entry["fetched_at"])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return datetime.now(timezone.utc) - fetched_at > (self.ttl if ttl is None else ttl)
+
+    def get_canonical_url(self, url: str) -> Optional[str]:
+        """リダイレクト元URLの正規URLを取得.
+
+        Args:
+            url: リダイレクト元URL
+
+        Returns:
+            正規URL、キャッシュに無い場合はNone
+        """
+        with self._lock:
+            entry = self._redirects.get(url)
+            if entry is None or self._is_expired(entry):
+                return None
+            return entry["canonical_url"]
+
+    def get_body(self, canonical_url: str) -> Optional[str]:
+        """正規URLの本文を取得.
+
+        Args:
+            canonical_url: 正規URL
+
+        Returns:
+            本文（抽出できなかった場合は空文字列）、キャッシュに無い場合はNone
+        """
+        with self._lock:
+            entry = self._bodies.get(canonical_url)
+            if entry is None or self._is_expired(entry):
+                return None
+            return entry["text"]
+
+    def set_article(self, url: str, canonical_url: str, text: str) -> None:
+        """リダイレクト先と本文を登録.
+
+        Args:
+            url: リダイレクト元URL
+            canonical_url: 正規URL
+            text: 抽出した本文（抽出できなかった場合は空文字列）
+        """
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._redirects[url] = {"canonical_url": canonical_url, "fetched_at": fetched_at}
+            self._bodies[canonical_url] = {"text": text, "fetched_at": fetched_at}
+            self._failures.pop(url, None)
+
+    def is_failed(self, url: str) -> bool:
+        """記事URLの取得失敗が記録されているか判定.
+
+        Args:
+            url: 記事URL（リダイレクト元URL）
+
+        Returns:
+            有効期間内に取得に失敗している場合True
+        """
+        with self._lock:
+            entry = self._failures.get(url)
+            return entry is not None and not self._is_expired(entry, self.failure_ttl)
+
+    def set_failure(self, url: str, reason: str) -> None:
+        """記事URLの取得失敗を記録.
+
+        Args:
+            url: 記事URL（リダイレクト元URL）
+            reason: 取得しなかった・失敗した理由
+        """
+        with self._lock:
+            self._failures[url] = {
+                "reason": reason,
+                "fetched_at": datetime.now(timezone.utc).isoformat(),
+            }
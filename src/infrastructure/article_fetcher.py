@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""記事ページの本文を取得するクライアント."""
+
+import base64
+import binascii
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.infrastructure.article_cache_manager import ArticleCacheManager
+from src.infrastructure.rate_limiter import RateLimiter
+from src.utils.html_cleaner import extract_main_text
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_CHARSET_PATTERN = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+GOOGLE_NEWS_HOST = "news.google.com"
+_GOOGLE_NEWS_ARTICLE_PATTERN = re.compile(r"^/(?:rss/)?articles/([A-Za-z0-9_-]+)")
+# 旧形式の記事IDはprotobufで、先頭のフィールドに記事URLがそのまま入っている
+_GOOGLE_NEWS_TOKEN_PREFIX = b"\x08\x13\x22"
+
+
+def is_google_news_url(url: str) -> bool:
+    """Google NewsのURLかどうかを判定.
+
+    Args:
+        url: URL
+
+    Returns:
+        news.google.comのURLの場合True
+    """
+    return (urlparse(url).hostname or "").lower() == GOOGLE_NEWS_HOST
+
+
+def decode_google_news_url(url: str) -> Optional[str]:
+    """Google NewsのリダイレクトURLから記事のURLを取り出す.
+
+    Google NewsのRSSのリンク（/rss/articles/<記事ID>）はブラウザ向けの中間ページを返し、
+    HTTPのリダイレクトでは記事ページに到達しない。旧形式の記事IDはbase64urlで
+    記事URLを含むためオフラインで復元する。新形式（"AU_yqL"で始まるID）は
+    Googleへの問い合わせが必要なため復元しない。
+
+    Args:
+        url: 記事URL
+
+    Returns:
+        記事のURL（Google News以外のURLはそのまま）、復元できない場合はNone
+    """
+    if not is_google_news_url(url):
+        return url
+
+    match = _GOOGLE_NEWS_ARTICLE_PATTERN.match(urlparse(url).path)
+    if match is None:
+        return None
+
+    token = match.group(1)
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (binascii.Error, ValueError):
+        return None
+    if not data.startswith(_GOOGLE_NEWS_TOKEN_PREFIX):
+        return None
+
+    # URLの長さ（varint）を読み取る
+    position = len(_GOOGLE_NEWS_TOKEN_PREFIX)
+    length = 0
+    shift = 0
+    while position < len(data):
+        byte = data[position]
+        position += 1
+        length |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            break
+    else:
+        return None
+
+    if len(data) - position < length:
+        return None
+    article_url = data[position:position + length].decode("utf-8", errors="replace")
+    if not article_url.startswith(("http://", "https://")) or is_google_news_url(article_url):
+        return None
+    return article_url
+
+
+class ArticleFetcher:
+    """リダイレクトを解決して記事ページを取得し、本文を抽出するクライアント.
+
+    接続プール付きのセッションを複数スレッドで共有して並行に取得する。
+    リダイレクト先（正規URL）と本文はArticleCacheManagerにキャッシュし、
+    取得済みのページは再取得しない。Google NewsのリンクはURLの記事IDから
+    記事ページのURLを復元し、復元できないものは取得しない（説明文で要約する）。
+    取得に失敗したURLと復元できないリンクはキャッシュの有効期間（短め）の間、取得し直さない。
+    """
+
+    USER_AGENT = "Mozilla/5.0 (compatible; news-notification-system/0.1)"
+    MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+    def __init__(
+        self,
+        cache: ArticleCacheManager,
+        max_workers: int = 4,
+        timeout: float = 10.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        """初期化.
+
+        Args:
+            cache: 記事キャッシュマネージャー
+            max_workers: 並行して取得するページ数の上限
+            timeout: 1ページあたりのタイムアウト（秒）
+            rate_limiter: ホストごとのレートリミッター（オプション）
+            session: HTTPセッション（省略時は接続プール付きのセッションを作成）
+        """
+        self.cache = cache
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.session = session or self._create_session(max_workers)
+
+    @classmethod
+    def _create_session(cls, pool_size: int) -> requests.Session:
+        """接続プール付きのHTTPセッションを作成.
+
+        Args:
+            pool_size: ホストごとの接続プールの大きさ
+
+        Returns:
+            HTTPセッション
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = cls.USER_AGENT
+        return session
+
+    def fetch_bodies(self, urls: List[str]) -> Dict[str, str]:
+        """記事URLの本文をまとめて取得.
+
+        Args:
+            urls: 記事URL（リダイレクトURLを含む）のリスト
+
+        Returns:
+            記事URL -> 本文の辞書（本文を取得できなかったURLは含まない）
+        """
+        bodies: Dict[str, Optional[str]] = {}
+        pending = []
+        failed_count = 0
+        for url in dict.fromkeys(urls):
+            body = self._get_cached_body(url)
+            if body is not None:
+                bodies[url] = body
+            elif self.cache.is_failed(url):
+                bodies[url] = None
+                failed_count += 1
+            else:
+                pending.append(url)
+
+        cache_hits = len(bodies) - failed_count
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+                for url, body in zip(pending, executor.map(self._fetch_body, pending)):
+                    bodies[url] = body
+            self.cache.save()
+
+        result = {url: body for url, body in bodies.items() if body}
+        logger.info(
+            f"記事本文取得: urls={len(bodies)}件, キャッシュ={cache_hits}件, "
+            f"取得失敗のためスキップ={failed_count}件, 取得={len(pending)}件, 本文あり={len(result)}件"
+        )
+        return result
+
+    def _get_cached_body(self, url: str) -> Optional[str]:
+        """キャッシュから本文を取得.
+
+        Args:
+            url: 記事URL
+
+        Returns:
+            本文、キャッシュに無い場合はNone
+        """
+        canonical_url = self.cache.get_canonical_url(url)
+        if canonical_url is None:
+            return None
+        return self.cache.get_body(canonical_url)
+
+    def _fetch_body(self, url: str) -> Optional[str]:
+        """リダイレクトを解決してページを取得し、本文を抽出.
+
+        Args:
+            url: 記事URL
+
+        Returns:
+            本文（抽出できなかった場合は空文字列）、取得しなかった・取得に失敗した場合はNone
+        """
+        article_url = decode_google_news_url(url)
+        if article_url is None:
+            logger.debug(f"Google Newsの記事URLを復元できないため本文を取得しません: {url}")
+            self.cache.set_failure(url, "Google Newsの記事URLを復元できません")
+            return None
+
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(article_url)
+            with self.session.get(
+                article_url, timeout=self.timeout, allow_redirects=True, stream=True
+            ) as response:
+                response.raise_for_status()
+                canonical_url = response.url
+
+                # Google Newsの中間ページ（同意画面など）は本文としてキャッシュしない
+                if is_google_news_url(canonical_url):
+                    logger.debug(f"Google Newsの中間ページのため本文を取得しません: {url}")
+                    self.cache.set_failure(url, "Google Newsの中間ページにリダイレクトされました")
+                    return None
+
+                # 別のリダイレクトURLから取得済みの記事はボディを読まずに再利用する
+                text = self.cache.get_body(canonical_url)
+                if text is None:
+                    content_type = response.headers.get("Content-Type", "")
+                    text = (
+                        extract_main_text(self._read_html(response))
+                        if "html" in content_type
+                        else ""
+                    )
+
+            self.cache.set_article(url, canonical_url, text)
+            logger.debug(f"記事本文取得: {canonical_url} ({len(text)}文字)")
+            return text
+        except requests.RequestException as e:
+            logger.warning(f"記事ページの取得に失敗: {url} - {e}")
+            self.cache.set_failure(url, str(e))
+            return None
+
+    def _read_html(self, response: requests.Response) -> str:
+        """レスポンスボディを上限サイズまで読み込み、文字列にデコード.
+
+        Args:
+            response: ストリーミング中のレスポンス
+
+        Returns:
+            HTML文字列
+        """
+        content = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            content.extend(chunk)
+            if len(content) >= self.MAX_PAGE_BYTES:
+                break
+
+        # Content-Typeに文字コードが無い場合、requestsはISO-8859-1とみなすためmetaタグを優先する
+        encoding = response.encoding
+        if encoding is None or encoding.lower() == "iso-8859-1":
+            match = _CHARSET_PATTERN.search(content[:4096])
+            encoding = match.group(1).decode("ascii") if match else "utf-8"
+
+        try:
+            return bytes(content).decode(encoding, errors="replace")
+        except LookupError:
+            return bytes(content).decode("utf-8", errors="replace")
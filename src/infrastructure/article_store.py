@@ -0,0 +1,434 @@
+# -*- coding: utf-8 -*-
+"""要約済み記事と通知先ごとの配信状態をSQLiteに保存・検索するモジュール."""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Literal, Optional
+
+from src.models.news_article import NewsArticle
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DeliveryStatus = Literal["sent", "deferred", "dropped"]
+
+# スキーマを変更した場合は上げる（古いスキーマのデータベースは作り直す）
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    summary TEXT,
+    summary_source TEXT,
+    summary_template TEXT,
+    relevance_score REAL,
+    published_date TEXT NOT NULL,
+    stored_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published_date ON articles (published_date);
+
+CREATE TABLE IF NOT EXISTS deliveries (
+    url TEXT NOT NULL,
+    target_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (url, target_name)
+);
+"""
+
+# タイトル・説明文・要約の全文検索インデックス（articlesと同期するトリガー付き）
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, description, summary, content='articles', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, description, summary)
+    VALUES (new.id, new.title, new.description, COALESCE(new.summary, ''));
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description, summary)
+    VALUES ('delete', old.id, old.title, old.description, COALESCE(old.summary, ''));
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description, summary)
+    VALUES ('delete', old.id, old.title, old.description, COALESCE(old.summary, ''));
+    INSERT INTO articles_fts (rowid, title, description, summary)
+    VALUES (new.id, new.title, new.description, COALESCE(new.summary, ''));
+END;
+"""
+
+_COLUMNS = "url, title, description, summary, summary_source, relevance_score, published_date"
+
+# trigramトークナイザーで検索できる最短の語の長さ（これより短い語はLIKEで検索する）
+_FTS_MIN_TERM_LENGTH = 3
+
+# 1回のクエリで指定するパラメーター数の上限（SQLiteの上限より小さく抑える）
+_MAX_QUERY_PARAMS = 500
+
+
+def _format_datetime(value: datetime) -> str:
+    """日時を並び替え可能な文字列に変換.
+
+    Args:
+        value: 日時（タイムゾーン情報付き）
+
+    Returns:
+        UTCのISO 8601形式（秒単位）の文字列
+    """
+    return value.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+def _escape_like(term: str) -> str:
+    """LIKE句のワイルドカード文字をエスケープ.
+
+    Args:
+        term: 検索語
+
+    Returns:
+        エスケープ済みの検索語
+    """
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _quote_fts(term: str) -> str:
+    """検索語をFTS5のフレーズとして引用.
+
+    Args:
+        term: 検索語
+
+    Returns:
+        二重引用符で囲んだ検索語（演算子として解釈されない）
+    """
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _chunks(values: List[str]) -> Iterator[List[str]]:
+    """パラメーター数の上限ごとにリストを分割.
+
+    Args:
+        values: 値のリスト
+
+    Yields:
+        分割したリスト
+    """
+    for start in range(0, len(values), _MAX_QUERY_PARAMS):
+        yield values[start : start + _MAX_QUERY_PARAMS]
+
+
+class ArticleStore:
+    """要約済みの記事と通知先ごとの配信状態をSQLiteデータベースに保存するストア.
+
+    通知処理（バッチ）が書き込み、Webhookサーバーが読み出す。別プロセスからの
+    読み書きが互いを待たないよう、WALモードで開く。
+    タイトル・説明文・要約にはFTS5（trigram）の全文検索インデックスを作成し、
+    キーワード検索はインデックスで行う。FTS5を使えないSQLiteではLIKEで検索する。
+    """
+
+    def __init__(self, db_file: str) -> None:
+        """初期化.
+
+        Args:
+            db_file: データベースファイルのパス（":memory:"の場合はメモリ上に作成）
+        """
+        if db_file != ":memory:":
+            Path(db_file).parent.mkdir(parents=True, exist_ok=True)
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._migrate()
+        self._conn.executescript(_SCHEMA)
+        self.fts_enabled = self._create_fts_index()
+        logger.info(f"記事ストアを開きました: {db_file} (全文検索={'FTS5' if self.fts_enabled else 'LIKE'})")
+
+    def _migrate(self) -> None:
+        """スキーマのバージョンが古いデータベースを作り直す.
+
+        記事ストアは直近の記事のキャッシュのため、移行せずに作り直し、
+        以降の実行で再び蓄積する。
+        """
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == SCHEMA_VERSION:
+            return
+
+        tables = {
+            row[0] for row in self._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        if "articles" in tables:
+            logger.warning(
+                f"記事ストアのスキーマが古いため作り直します: version={version} -> {SCHEMA_VERSION}"
+            )
+            self._conn.executescript(
+                "DROP TABLE IF EXISTS articles_fts; DROP TABLE IF EXISTS articles; "
+                "DROP TABLE IF EXISTS deliveries;"
+            )
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _create_fts_index(self) -> bool:
+        """全文検索インデックスを作成.
+
+        Returns:
+            FTS5の全文検索インデックスを使える場合True
+        """
+        try:
+            exists = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'"
+            ).fetchone()
+            self._conn.executescript(_FTS_SCHEMA)
+            if not exists:
+                # インデックス作成前に保存された記事を索引に登録する
+                with self._conn:
+                    self._conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5（trigram）を使えないため、記事の検索はLIKEで行います: {e}")
+            return False
+
+    def save_articles(
+        self,
+        articles: List[NewsArticle],
+        stored_at: Optional[datetime] = None,
+        summary_template: Optional[str] = None,
+    ) -> int:
+        """記事をまとめて保存（同じURLの記事は上書き）.
+
+        要約の無い記事で上書きする場合は、保存済みの要約を残す。
+
+        Args:
+            articles: 記事のリスト
+            stored_at: 保存日時（省略時は現在日時）
+            summary_template: LLMの要約に使ったプロンプトテンプレートのキー
+                （LLMで要約した記事にのみ記録し、要約の再利用の判定に使う）
+
+        Returns:
+            保存した記事数
+        """
+        if not articles:
+            return 0
+
+        stored = _format_datetime(stored_at or datetime.now(timezone.utc))
+        rows = [
+            (
+                article.get_url_string(),
+                article.title,
+                article.description,
+                article.summary,
+                article.summary_source,
+                article.relevance_score,
+                _format_datetime(article.published_date),
+                summary_template if article.summary_source == "llm" else None,
+                stored,
+            )
+            for article in articles
+        ]
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    f"""
+                    INSERT INTO articles ({_COLUMNS}, summary_template, stored_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (url) DO UPDATE SET
+                        title = excluded.title,
+                        description = excluded.description,
+                        summary = COALESCE(excluded.summary, articles.summary),
+                        summary_source = CASE WHEN excluded.summary IS NULL
+                            THEN articles.summary_source ELSE excluded.summary_source END,
+                        summary_template = CASE WHEN excluded.summary IS NULL
+                            THEN articles.summary_template ELSE excluded.summary_template END,
+                        relevance_score = COALESCE(excluded.relevance_score, articles.relevance_score),
+                        published_date = excluded.published_date,
+                        stored_at = excluded.stored_at
+                    """,
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.error(f"記事ストアへの保存に失敗しました: {e}")
+            return 0
+
+        logger.debug(f"記事ストアに保存しました: {len(rows)}件")
+        return len(rows)
+
+    def get_summaries(self, urls: List[str], summary_template: str) -> Dict[str, str]:
+        """同じプロンプトテンプレートでLLMが要約した保存済みの要約をまとめて取得.
+
+        Args:
+            urls: 記事URLのリスト
+            summary_template: プロンプトテンプレートのキー
+
+        Returns:
+            記事URL -> 要約文の辞書（要約が無い記事は含まない）
+        """
+        summaries: Dict[str, str] = {}
+        with self._lock:
+            for chunk in _chunks(list(dict.fromkeys(urls))):
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"""
+                    SELECT url, summary FROM articles
+                    WHERE url IN ({placeholders}) AND summary_source = 'llm'
+                        AND summary_template = ? AND summary IS NOT NULL AND summary != ''
+                    """,
+                    [*chunk, summary_template],
+                ).fetchall()
+                summaries.update({row["url"]: row["summary"] for row in rows})
+        return summaries
+
+    def record_deliveries(
+        self,
+        target_name: str,
+        urls: List[str],
+        status: DeliveryStatus,
+        updated_at: Optional[datetime] = None,
+    ) -> int:
+        """通知先への記事の配信状態をまとめて記録.
+
+        Args:
+            target_name: 通知先の名前
+            urls: 記事URLのリスト
+            status: 配信状態（sent: 送信済み、deferred: 後回し、dropped: 破棄）
+            updated_at: 記録日時（省略時は現在日時）
+
+        Returns:
+            記録した件数
+        """
+        if not urls:
+            return 0
+
+        updated = _format_datetime(updated_at or datetime.now(timezone.utc))
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    """
+                    INSERT INTO deliveries (url, target_name, status, updated_at) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (url, target_name) DO UPDATE SET
+                        status = excluded.status, updated_at = excluded.updated_at
+                    """,
+                    [(url, target_name, status, updated) for url in urls],
+                )
+        except sqlite3.Error as e:
+            logger.error(f"配信状態の記録に失敗しました: {e}")
+            return 0
+        return len(urls)
+
+    def get_delivery_states(self, url: str) -> Dict[str, str]:
+        """記事の通知先ごとの配信状態を取得.
+
+        Args:
+            url: 記事URL
+
+        Returns:
+            通知先の名前 -> 配信状態の辞書
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT target_name, status FROM deliveries WHERE url = ?", (url,)
+            ).fetchall()
+        return {row["target_name"]: row["status"] for row in rows}
+
+    def search(
+        self, query: str, limit: int = 10, target_names: Optional[List[str]] = None
+    ) -> List[NewsArticle]:
+        """キーワードを含む記事を新しい順に検索.
+
+        空白で区切った語をすべて含む記事（タイトル・説明文・要約のいずれか）を返す。
+        英字の大文字・小文字は区別しない。3文字以上の語は全文検索インデックスで、
+        2文字以下の語（trigramで検索できない語）はLIKEで絞り込む。
+
+        Args:
+            query: 検索語（空の場合は最新の記事を返す）
+            limit: 最大件数
+            target_names: 指定した場合は、これらの通知先に送信済みの記事のみを返す
+
+        Returns:
+            記事のリスト（公開日時の新しい順）
+        """
+        terms = query.split()
+        fts_terms = (
+            [term for term in terms if len(term) >= _FTS_MIN_TERM_LENGTH] if self.fts_enabled else []
+        )
+        like_terms = [term for term in terms if term not in fts_terms]
+
+        conditions = []
+        params: List[Any] = []
+        if fts_terms:
+            conditions.append("id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)")
+            params.append(" ".join(_quote_fts(term) for term in fts_terms))
+        for term in like_terms:
+            conditions.append(
+                "(title || ' ' || description || ' ' || COALESCE(summary, '')) LIKE ? ESCAPE '\\'"
+            )
+            params.append(f"%{_escape_like(term)}%")
+        if target_names is not None:
+            placeholders = ", ".join("?" * len(target_names))
+            conditions.append(
+                f"url IN (SELECT url FROM deliveries WHERE status = 'sent' "
+                f"AND target_name IN ({placeholders}))"
+            )
+            params.extend(target_names)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM articles {where} ORDER BY published_date DESC LIMIT ?",
+                params,
+            ).fetchall()
+        return [self._to_article(row) for row in rows]
+
+    def count(self) -> int:
+        """保存済みの記事数を取得.
+
+        Returns:
+            記事数
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def purge(self, before: datetime) -> int:
+        """指定日時より前に公開された記事と、その配信状態を削除.
+
+        Args:
+            before: 削除する公開日時の上限（この日時より前の記事を削除）
+
+        Returns:
+            削除した記事数
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM articles WHERE published_date < ?", (_format_datetime(before),)
+            )
+            self._conn.execute("DELETE FROM deliveries WHERE url NOT IN (SELECT url FROM articles)")
+        if cursor.rowcount:
+            logger.info(f"記事ストアから古い記事を削除しました: {cursor.rowcount}件")
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """データベースを閉じる."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_article(row: sqlite3.Row) -> NewsArticle:
+        """データベースの行を記事に変換.
+
+        Args:
+            row: articlesテーブルの行
+
+        Returns:
+            NewsArticle
+        """
+        return NewsArticle(
+            title=row["title"],
+            url=row["url"],
+            published_date=datetime.fromisoformat(row["published_date"]),
+            description=row["description"],
+            summary=row["summary"],
+            summary_source=row["summary_source"],
+            relevance_score=row["relevance_score"],
+        )
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""BM25スコアリング用のコーパス統計を管理するモジュール."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CorpusStatsManager:
+    """文書数・文書頻度・フィールド長などのコーパス統計を永続化するマネージャー.
+
+    統計は実行ごとに新しい文書分だけ加算される（インクリメンタル更新）。
+    同じ記事が複数回の実行や複数の通知先で再取得されても二重に数えないよう、
+    集計済み文書のキーと、その文書を数えた語を保持する。別の通知先の
+    キーワードなど、後から追跡を始めた語は集計済みの文書でもその語の分だけ加算する。
+
+    文書キーは公開日時からTRACKING_DAYS日間保持し、それより古い文書は
+    再取得されても二重に数えないよう集計の対象外とする。
+    """
+
+    TRACKING_DAYS = 14
+
+    def __init__(self, stats_file: str) -> None:
+        """初期化.
+
+        Args:
+            stats_file: 統計ファイルのパス
+        """
+        self.stats_file = Path(stats_file)
+        self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+        self._document_count = 0
+        self._field_length_totals: Dict[str, int] = {}
+        # term -> [文書頻度, 統計開始以降の文書数]
+        self._term_stats: Dict[str, List[int]] = {}
+        # 集計済み文書キー -> (公開日時, その文書を数えた語の集合)
+        self._counted_documents: Dict[str, Tuple[datetime, Set[str]]] = {}
+        self._load_stats()
+
+    def _load_stats(self) -> None:
+        """統計ファイルから統計を読み込み."""
+        if not self.stats_file.exists():
+            logger.info(f"コーパス統計ファイルが存在しないため新規作成します: {self.stats_file}")
+            return
+
+        try:
+            with open(self.stats_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._document_count = int(data.get("document_count", 0))
+            self._field_length_totals = {
+                k: int(v) for k, v in data.get("field_length_totals", {}).items()
+            }
+            self._term_stats = {
+                k: [int(v[0]), int(v[1])] for k, v in data.get("term_stats", {}).items()
+            }
+            self._counted_documents = self._parse_counted_documents(
+                data.get("counted_documents", {})
+            )
+            logger.info(f"コーパス統計を読み込みました: documents={self._document_count}件")
+        except (json.JSONDecodeError, IOError, ValueError, TypeError, IndexError) as e:
+            logger.warning(f"コーパス統計ファイルの読み込みに失敗しました: {e}")
+
+    def _parse_counted_documents(self, data: object) -> Dict[str, Tuple[datetime, Set[str]]]:
+        """統計ファイルの集計済み文書を読み込み.
+
+        Args:
+            data: 統計ファイルのcounted_documents（旧形式は文書キーのリスト）
+
+        Returns:
+            集計済み文書キー -> (公開日時, その文書を数えた語の集合)の辞書
+        """
+        if isinstance(data, list):
+            # 旧形式は追跡中のすべての語で数えたものとみなす
+            now = datetime.now(timezone.utc)
+            return {key: (now, set(self._term_stats)) for key in data}
+        if not isinstance(data, dict):
+            raise ValueError("counted_documentsの形式が不正です")
+        return {
+            key: (datetime.fromisoformat(value["published_at"]), set(value["terms"]))
+            for key, value in data.items()
+        }
+
+    def _save_stats(self) -> None:
+        """統計ファイルに統計を保存."""
+        try:
+            with open(self.stats_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "document_count": self._document_count,
+                        "field_length_totals": self._field_length_totals,
+                        "term_stats": self._term_stats,
+                        "counted_documents": {
+                            key: {"published_at": published_at.isoformat(), "terms": sorted(terms)}
+                            for key, (published_at, terms) in self._counted_documents.items()
+                        },
+                    },
+                    f,
+                    ensure_ascii=False,
+                    indent=2,
+                )
+            logger.debug(f"コーパス統計を保存しました: documents={self._document_count}件")
+        except IOError as e:
+            logger.error(f"コーパス統計ファイルの保存に失敗しました: {e}")
+
+    def add_documents(
+        self,
+        document_keys: List[str],
+        field_lengths: List[Dict[str, int]],
+        document_terms: List[Set[str]],
+        terms: List[str],
+        published_dates: Optional[List[datetime]] = None,
+        now: Optional[datetime] = None,
+    ) -> None:
+        """未集計の文書と、文書ごとに未集計の語を統計に加算.
+
+        Args:
+            document_keys: 文書を一意に識別するキー（URLなど）のリスト
+            field_lengths: 文書ごとのフィールド長
+            document_terms: 文書ごとに出現した語の集合
+            terms: 統計を追跡する語のリスト
+            published_dates: 文書ごとの公開日時（省略時は現在日時とみなす）
+            now: 現在日時（省略時はシステム時刻）
+        """
+        now = now or datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=self.TRACKING_DAYS)
+
+        for term in terms:
+            self._term_stats.setdefault(term, [0, 0])
+
+        added = 0
+        backfilled = 0
+        for i, key in enumerate(document_keys):
+            published_at = published_dates[i] if published_dates is not None else now
+            if published_at < cutoff:
+                # 文書キーを保持していない期間の文書は、集計済みか判定できないため数えない
+                continue
+
+            record = self._counted_documents.get(key)
+            is_known = record is not None
+            if record is None:
+                record = (published_at, set())
+                self._counted_documents[key] = record
+                self._document_count += 1
+                added += 1
+                for field, length in field_lengths[i].items():
+                    self._field_length_totals[field] = (
+                        self._field_length_totals.get(field, 0) + length
+                    )
+
+            counted_terms = record[1]
+            new_terms = [term for term in terms if term not in counted_terms]
+            if is_known and new_terms:
+                backfilled += 1
+            for term in new_terms:
+                counted_terms.add(term)
+                stats = self._term_stats[term]
+                stats[1] += 1
+                if term in document_terms[i]:
+                    stats[0] += 1
+
+        # 保持期間を過ぎた文書キーを破棄
+        expired = [
+            key for key, (published_at, _terms) in self._counted_documents.items() if published_at < cutoff
+        ]
+        for key in expired:
+            del self._counted_documents[key]
+
+        if added or backfilled or expired:
+            self._save_stats()
+            logger.info(
+                f"コーパス統計を更新: added={added}件, 語の追加集計={backfilled}件, "
+                f"total={self._document_count}件"
+            )
+
+    def get_document_count(self) -> int:
+        """集計済みの文書数を取得.
+
+        Returns:
+            文書数
+        """
+        return self._document_count
+
+    def get_average_field_length(self, field: str) -> float:
+        """フィールドの平均長を取得.
+
+        Args:
+            field: フィールド名
+
+        Returns:
+            平均長（文書が無い場合は0.0）
+        """
+        if self._document_count == 0:
+            return 0.0
+        return self._field_length_totals.get(field, 0) / self._document_count
+
+    def get_term_stats(self, term: str) -> Tuple[int, int]:
+        """語の文書頻度を取得.
+
+        Args:
+            term: 語
+
+        Returns:
+            (文書頻度, 追跡開始以降の文書数) のタプル
+        """
+        stats = self._term_stats.get(term)
+        if stats is None:
+            return 0, 0
+        return stats[0], stats[1]
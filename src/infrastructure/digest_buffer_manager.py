@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""ダイジェスト送信まで要約済み記事を蓄積するバッファのマネージャー."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from src.models.news_article import NewsArticle
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DigestBufferManager:
+    """通知先ごとの蓄積記事と蓄積開始日時を永続化するマネージャー."""
+
+    def __init__(self, buffer_file: str) -> None:
+        """初期化.
+
+        Args:
+            buffer_file: バッファファイルのパス
+        """
+        self.buffer_file = Path(buffer_file)
+        self.buffer_file.parent.mkdir(parents=True, exist_ok=True)
+        self._buffers: Dict[str, Dict[str, Any]] = self._load_buffers()
+
+    def _load_buffers(self) -> Dict[str, Dict[str, Any]]:
+        """バッファファイルから読み込み.
+
+        Returns:
+            通知先名 -> バッファ（articles / started_at）の辞書
+        """
+        if not self.buffer_file.exists():
+            logger.info(f"ダイジェストバッファが存在しないため新規作成します: {self.buffer_file}")
+            return {}
+
+        try:
+            with open(self.buffer_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            buffers = data.get("buffers", {})
+            logger.info(f"ダイジェストバッファを読み込みました: {len(buffers)}件")
+            return buffers
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"ダイジェストバッファの読み込みに失敗しました: {e}")
+            return {}
+
+    def _save_buffers(self) -> None:
+        """バッファファイルに保存."""
+        try:
+            with open(self.buffer_file, "w", encoding="utf-8") as f:
+                json.dump({"buffers": self._buffers}, f, ensure_ascii=False, indent=2)
+            logger.debug(f"ダイジェストバッファを保存しました: {len(self._buffers)}件")
+        except IOError as e:
+            logger.error(f"ダイジェストバッファの保存に失敗しました: {e}")
+
+    def add_articles(
+        self, target_name: str, articles: List[NewsArticle], added_at: datetime
+    ) -> int:
+        """要約済みの記事をバッファに追加（蓄積済みのURLは追加しない）.
+
+        Args:
+            target_name: 通知先の名前
+            articles: 要約済みの記事のリスト
+            added_at: 追加日時（バッファが空の場合は蓄積開始日時になる）
+
+        Returns:
+            追加後の蓄積記事数
+        """
+        if not articles:
+            return len(self._buffers.get(target_name, {}).get("articles", []))
+
+        buffer = self._buffers.setdefault(
+            target_name, {"articles": [], "started_at": added_at.isoformat()}
+        )
+        stored = buffer["articles"]
+        stored_urls = {article["url"] for article in stored}
+        for article in articles:
+            if article.get_url_string() not in stored_urls:
+                stored.append(article.model_dump(mode="json"))
+                stored_urls.add(article.get_url_string())
+        self._save_buffers()
+        return len(stored)
+
+    def replace_articles(
+        self, target_name: str, articles: List[NewsArticle], replaced_at: datetime
+    ) -> None:
+        """バッファの記事を置き換え（蓄積開始日時は引き継ぐ）.
+
+        Args:
+            target_name: 通知先の名前
+            articles: 蓄積する記事のリスト
+            replaced_at: 置き換え日時（バッファが空だった場合は蓄積開始日時になる）
+        """
+        if not articles:
+            self.clear(target_name)
+            return
+
+        buffer = self._buffers.setdefault(
+            target_name, {"articles": [], "started_at": replaced_at.isoformat()}
+        )
+        buffer["articles"] = [article.model_dump(mode="json") for article in articles]
+        self._save_buffers()
+
+    def get_articles(self, target_name: str) -> List[NewsArticle]:
+        """バッファに蓄積された記事を取得.
+
+        Args:
+            target_name: 通知先の名前
+
+        Returns:
+            蓄積された記事のリスト（追加順）
+        """
+        articles = []
+        for data in self._buffers.get(target_name, {}).get("articles", []):
+            try:
+                articles.append(NewsArticle.model_validate(data))
+            except ValidationError as e:
+                logger.warning(f"ダイジェストバッファの記事を読み込めません: {e}")
+        return articles
+
+    def get_started_at(self, target_name: str) -> Optional[datetime]:
+        """バッファの蓄積開始日時（空のバッファに最初の記事を追加した日時）を取得.
+
+        Args:
+            target_name: 通知先の名前
+
+        Returns:
+            蓄積開始日時、バッファが空の場合はNone
+        """
+        value = self._buffers.get(target_name, {}).get("started_at")
+        return datetime.fromisoformat(value) if value else None
+
+    def clear(self, target_name: str) -> None:
+        """送信済みの記事をバッファから削除.
+
+        Args:
+            target_name: 通知先の名前
+        """
+        if self._buffers.pop(target_name, None) is not None:
+            self._save_buffers()
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""LINE Flex Messageを直接JSON用の辞書として組み立てるレンダラー.
+
+SDKのモデル（FlexBox・FlexTextなど）を経由せず、バリデーションなしで
+送信用のJSONと同じ構造の辞書・バイト列を作成する。
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+from src.models.news_article import NewsArticle
+from src.utils.date_helper import format_datetime_jst
+
+# カルーセル1件あたりの最大バブル数と、1リクエストあたりの最大メッセージ数（Messaging APIの上限）
+MAX_BUBBLES_PER_CAROUSEL = 10
+MAX_MESSAGES_PER_REQUEST = 5
+
+TITLE_MAX_CHARS = 60
+SUMMARY_MAX_CHARS = 150
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """最大文字数を超える場合に末尾を「...」にする.
+
+    Args:
+        text: テキスト
+        max_chars: 最大文字数
+
+    Returns:
+        切り詰めたテキスト
+    """
+    return text[:max_chars] + "..." if len(text) > max_chars else text
+
+
+def render_bubble(article: NewsArticle, index: int) -> Dict[str, Any]:
+    """1記事分のバブルを作成.
+
+    Args:
+        article: ニュース記事
+        index: 記事番号
+
+    Returns:
+        バブルのJSON用辞書
+    """
+    summary = _truncate(article.summary or article.description, SUMMARY_MAX_CHARS)
+    if article.is_summary_degraded():
+        summary = f"【簡易要約】{summary}"
+
+    # 構造は固定のため、辞書リテラルに値だけを埋め込む
+    return {
+        "type": "bubble",
+        "header": {
+            "type": "box",
+            "layout": "vertical",
+            "contents": [
+                {"type": "text", "text": f"📰 ニュース #{index}", "size": "sm", "color": "#1DB446"}
+            ],
+        },
+        "body": {
+            "type": "box",
+            "layout": "vertical",
+            "contents": [
+                {
+                    "type": "text",
+                    "text": _truncate(article.title, TITLE_MAX_CHARS),
+                    "size": "lg",
+                    "weight": "bold",
+                    "wrap": True,
+                },
+                {
+                    "type": "box",
+                    "layout": "vertical",
+                    "contents": [
+                        {
+                            "type": "text",
+                            "text": summary,
+                            "size": "sm",
+                            "color": "#666666",
+                            "wrap": True,
+                        },
+                        {
+                            "type": "text",
+                            "text": format_datetime_jst(article.published_date),
+                            "size": "xs",
+                            "color": "#999999",
+                            "margin": "md",
+                        },
+                    ],
+                    "spacing": "sm",
+                    "margin": "md",
+                },
+            ],
+        },
+        "footer": {
+            "type": "box",
+            "layout": "vertical",
+            "contents": [
+                {
+                    "type": "button",
+                    "style": "primary",
+                    "action": {
+                        "type": "uri",
+                        "label": "記事を読む",
+                        "uri": article.get_url_string(),
+                    },
+                }
+            ],
+            "spacing": "sm",
+        },
+    }
+
+
+def _alt_text_prefix(target_name: str) -> str:
+    """代替テキストの先頭に付ける通知先の名前を作成.
+
+    Args:
+        target_name: 通知先の名前
+
+    Returns:
+        "通知先の名前: "（名前が空の場合は空文字列）
+    """
+    return f"{target_name}: " if target_name else ""
+
+
+def render_flex_message(
+    articles: List[NewsArticle], target_name: str, start_index: int = 1, alt_text: str = ""
+) -> Dict[str, Any]:
+    """記事のカルーセルのFlex Messageを作成.
+
+    Args:
+        articles: 記事のリスト（先頭から最大10件をバブルにする）
+        target_name: 通知先の名前（空文字列の場合は代替テキストに含めない）
+        start_index: 最初のバブルの記事番号
+        alt_text: 代替テキスト（省略時は通知先の名前と記事数）
+
+    Returns:
+        Flex MessageのJSON用辞書
+    """
+    return {
+        "type": "flex",
+        "altText": alt_text or f"{_alt_text_prefix(target_name)}{len(articles)}件の新着ニュース",
+        "contents": {
+            "type": "carousel",
+            "contents": [
+                render_bubble(article, index)
+                for index, article in enumerate(
+                    articles[:MAX_BUBBLES_PER_CAROUSEL], start=start_index
+                )
+            ],
+        },
+    }
+
+
+def render_flex_messages(
+    articles: List[NewsArticle], target_name: str
+) -> List[Tuple[Dict[str, Any], List[NewsArticle]]]:
+    """10件を超える記事を複数のカルーセルに分けてFlex Messageを作成.
+
+    Args:
+        articles: 記事のリスト
+        target_name: 通知先の名前（空文字列の場合は代替テキストに含めない）
+
+    Returns:
+        (Flex MessageのJSON用辞書, そのカルーセルに含まれる記事)のリスト
+    """
+    chunks = [
+        articles[start : start + MAX_BUBBLES_PER_CAROUSEL]
+        for start in range(0, len(articles), MAX_BUBBLES_PER_CAROUSEL)
+    ]
+    if len(chunks) <= 1:
+        return [(render_flex_message(articles, target_name), articles)]
+
+    messages = []
+    for page, chunk in enumerate(chunks, start=1):
+        alt_text = (
+            f"{_alt_text_prefix(target_name)}{len(articles)}件の新着ニュース ({page}/{len(chunks)})"
+        )
+        start_index = (page - 1) * MAX_BUBBLES_PER_CAROUSEL + 1
+        messages.append(
+            (render_flex_message(chunk, target_name, start_index, alt_text), chunk)
+        )
+    return messages
+
+
+def render_text_message(text: str) -> Dict[str, Any]:
+    """テキストメッセージを作成.
+
+    Args:
+        text: 本文
+
+    Returns:
+        テキストメッセージのJSON用辞書
+    """
+    return {"type": "text", "text": text}
+
+
+def encode_json(payload: Dict[str, Any]) -> bytes:
+    """リクエストボディ用にJSONをエンコード.
+
+    Args:
+        payload: JSON用辞書
+
+    Returns:
+        UTF-8のJSONバイト列
+    """
+    return _JSON_ENCODER.encode(payload).encode("utf-8")
@@ -2,14 +2,17 @@
 """Google News RSSからニュースを取得するクライアント."""
 
 from datetime import datetime
-from typing import List
+from typing import Callable, Collection, Dict, List, Optional, Set, Tuple
 from urllib.parse import quote
 
 import feedparser
 from pydantic import HttpUrl
 
+from src.infrastructure.google_news_query_planner import GoogleNewsQueryPlanner
+from src.infrastructure.rate_limiter import RateLimiter, RateLimitError, parse_retry_after
+from src.infrastructure.resilience import Resilience, ServiceError
 from src.models.news_article import NewsArticle
-from src.utils.date_helper import parse_rss_date
+from src.utils.date_helper import UTC, parse_feed_date
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -19,10 +22,27 @@ class GoogleNewsClient:
     """Google News RSSからニュースを取得するクライアント."""
 
     BASE_URL = "https://news.google.com/rss/search"
+    HOST = "news.google.com"
 
-    def __init__(self) -> None:
-        """初期化."""
-        pass
+    # Google News RSSが1フィードで返す記事数の上限
+    FEED_ITEM_CAP = 100
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        resilience: Optional[Resilience] = None,
+    ) -> None:
+        """初期化.
+
+        Args:
+            rate_limiter: ホストごとのレートリミッター（オプション）
+            resilience: リトライ・サーキットブレーカー（オプション）
+        """
+        self.rate_limiter = rate_limiter
+        self.resilience = resilience
+        self.query_planner = GoogleNewsQueryPlanner(url_builder=self._build_search_url)
+        # 複数の通知先で共有するキーワードの、取得済みフィード（検索URL -> フィード）
+        self._shared_feeds: Dict[str, feedparser.FeedParserDict] = {}
 
     def _build_search_url(self, keyword: str, lang: str = "ja", country: str = "JP") -> str:
         """検索URLを構築.
@@ -38,26 +58,62 @@ class GoogleNewsClient:
         encoded_keyword = quote(keyword)
         return f"{self.BASE_URL}?q={encoded_keyword}&hl={lang}&gl={country}&ceid={country}:{lang}"
 
-    def fetch_news(self, keyword: str) -> List[NewsArticle]:
+    def fetch_news(
+        self, keyword: str, skip_url: Optional[Callable[[str], bool]] = None
+    ) -> List[NewsArticle]:
         """指定キーワードでニュースを取得.
 
         Args:
-            keyword: 検索キーワード
+            keyword: 検索キーワード（OR演算子を含む検索クエリも可）
+            skip_url: RSSエントリーのリンクを受け取り、スキップする場合にTrueを返す関数。
+                該当するエントリーはNewsArticleへの変換（日付・URLの検証など）を行わない
 
         Returns:
             ニュース記事のリスト
         """
-        url = self._build_search_url(keyword)
-        logger.info(f"Google Newsからニュースを取得: keyword={keyword}")
+        articles, _entry_count = self._fetch_query(keyword, skip_url)
+        return articles
+
+    def _fetch_query(
+        self, query: str, skip_url: Optional[Callable[[str], bool]] = None, share: bool = False
+    ) -> Tuple[List[NewsArticle], int]:
+        """検索クエリでRSSフィードを取得して記事に変換.
+
+        Args:
+            query: 検索クエリ
+            skip_url: スキップするリンクの場合にTrueを返す関数（オプション）
+            share: 取得したフィードを保持し、同じクエリでは再利用する場合True
+
+        Returns:
+            (ニュース記事のリスト, フィードのエントリー数) のタプル
+        """
+        url = self._build_search_url(query)
 
         try:
-            feed = feedparser.parse(url)
+            feed = self._shared_feeds.get(url) if share else None
+            if feed is not None:
+                logger.info(f"取得済みのフィードを再利用: keyword={query}")
+            else:
+                logger.info(f"Google Newsからニュースを取得: keyword={query}")
+                if self.resilience is not None:
+                    feed = self.resilience.call(lambda: self._download_feed(url))
+                else:
+                    feed = self._download_feed(url)
+                if share:
+                    self._shared_feeds[url] = feed
 
             if feed.bozo:
                 logger.warning(f"RSSフィードのパースで問題が発生: {feed.bozo_exception}")
 
             articles = []
+            skipped_count = 0
+            feed_links: Set[str] = set()
             for entry in feed.entries:
+                link = entry.get("link", "")
+                if link in feed_links or (skip_url is not None and skip_url(link)):
+                    skipped_count += 1
+                    continue
+                feed_links.add(link)
                 try:
                     article = self._parse_entry(entry)
                     articles.append(article)
@@ -65,13 +121,54 @@ class GoogleNewsClient:
                     logger.warning(f"記事のパースに失敗: {e}, entry={entry.get('title', 'N/A')}")
                     continue
 
-            logger.info(f"{len(articles)}件のニュースを取得しました")
-            return articles
+            logger.info(
+                f"{len(articles)}件のニュースを取得しました（既知のためスキップ: {skipped_count}件）"
+            )
+            return articles, len(feed.entries)
 
         except Exception as e:
             logger.error(f"Google Newsからのニュース取得に失敗: {e}")
             raise
 
+    def _download_feed(self, url: str) -> feedparser.FeedParserDict:  # type: ignore
+        """RSSフィードをダウンロードしてパース.
+
+        feedparserは通信エラーやHTTPエラーでも例外を送出しないため、
+        リトライ・サーキットブレーカーで扱えるよう例外に変換する。
+
+        Args:
+            url: フィードのURL
+
+        Returns:
+            パース済みのフィード
+
+        Raises:
+            RateLimitError: レート制限（HTTP 429）を受けた場合
+            ServiceError: HTTP 5xxの場合
+            OSError: 通信エラーの場合（feedparserのURLErrorなど）
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self.HOST)
+
+        feed = feedparser.parse(url)
+
+        status = feed.get("status")
+        if status == 429:
+            retry_after = parse_retry_after(feed.get("headers"))
+            if self.rate_limiter is not None:
+                self.rate_limiter.register_retry_after(self.HOST, retry_after)
+            raise RateLimitError(
+                "Google Newsのレート制限に達しました (HTTP 429)", retry_after
+            )
+        if isinstance(status, int) and status >= 500:
+            raise ServiceError(f"Google Newsがエラーを返しました (HTTP {status})", status)
+
+        error = feed.get("bozo_exception")
+        if not feed.entries and isinstance(error, OSError):
+            raise error
+
+        return feed
+
     def _parse_entry(self, entry: feedparser.FeedParserDict) -> NewsArticle:  # type: ignore
         """RSSエントリーをNewsArticleに変換.
 
@@ -92,11 +189,11 @@ class GoogleNewsClient:
         if not title or not link:
             raise ValueError("titleまたはlinkが不足しています")
 
-        # 日付をパース
-        published_date = parse_rss_date(published)
+        # feedparserがパース済みの日時を優先して使い、UTCに揃える
+        published_date = parse_feed_date(entry.get("published_parsed"), published)
         if published_date is None:
             # パースできない場合は現在時刻を使用
-            published_date = datetime.now()
+            published_date = datetime.now(UTC)
             logger.warning(f"日付のパースに失敗したため現在時刻を使用: {published}")
 
         return NewsArticle(
@@ -106,29 +203,86 @@ class GoogleNewsClient:
             description=description,
         )
 
-    def fetch_news_for_keywords(self, keywords: List[str]) -> List[NewsArticle]:
+    def fetch_news_for_keywords(
+        self,
+        keywords: List[str],
+        is_known_url: Optional[Callable[[str], bool]] = None,
+        shared_keywords: Collection[str] = (),
+    ) -> List[NewsArticle]:
         """複数のキーワードでニュースを取得.
 
+        キーワードはOR検索クエリにまとめて取得する。まとめたクエリの結果が
+        フィードの記事数上限に達した場合は取りこぼしの可能性があるため、
+        そのグループのキーワードを1件ずつ取得し直す。
+
+        shared_keywordsに含まれるキーワード（複数の通知先が設定しているもの）は
+        まとめずに1件ずつ取得してフィードを保持し、このクライアントで同じキーワードを
+        取得する他の通知先はリクエストせずに再利用する。
+
+        RSSエントリーのリンクは、今回の実行で取得済みのURLおよびis_known_url
+        （通知済みキャッシュなど）と先に照合し、新しいエントリーだけを
+        NewsArticleに変換する。
+
         Args:
             keywords: 検索キーワードのリスト
+            is_known_url: URLが既知（通知済みなど）の場合にTrueを返す関数（オプション）
+            shared_keywords: 取得したフィードを通知先の間で共有するキーワード
 
         Returns:
-            ニュース記事のリスト（重複除去済み）
+            ニュース記事のリスト（重複除去済み、既知のURLを除く）
         """
-        all_articles = []
-        seen_urls = set()
+        all_articles: List[NewsArticle] = []
+        seen_urls: Set[str] = set()
+
+        def skip_url(link: str) -> bool:
+            if link in seen_urls:
+                return True
+            return is_known_url is not None and is_known_url(link)
 
-        for keyword in keywords:
+        def collect(query: str, share: bool = False) -> int:
+            articles, entry_count = self._fetch_query(query, skip_url=skip_url, share=share)
+            for article in articles:
+                url = article.get_url_string()
+                if url not in seen_urls:
+                    all_articles.append(article)
+                    seen_urls.add(url)
+            return entry_count
+
+        request_count = 0
+        shared = [keyword for keyword in dict.fromkeys(keywords) if keyword in shared_keywords]
+        for keyword in shared:
             try:
-                articles = self.fetch_news(keyword)
-                for article in articles:
-                    url = article.get_url_string()
-                    if url not in seen_urls:
-                        all_articles.append(article)
-                        seen_urls.add(url)
+                if self._build_search_url(keyword) not in self._shared_feeds:
+                    request_count += 1
+                collect(keyword, share=True)
             except Exception as e:
                 logger.error(f"キーワード '{keyword}' のニュース取得に失敗: {e}")
-                continue
 
-        logger.info(f"合計{len(all_articles)}件のニュースを取得しました（重複除去済み）")
+        grouped = [keyword for keyword in keywords if keyword not in shared_keywords]
+        for group in self.query_planner.plan(grouped):
+            if len(group) > 1:
+                try:
+                    request_count += 1
+                    entry_count = collect(self.query_planner.build_query(group))
+                    if entry_count < self.FEED_ITEM_CAP:
+                        continue
+                    logger.info(
+                        f"まとめた検索結果が上限({self.FEED_ITEM_CAP}件)に達したため"
+                        f"キーワードごとに再取得: {group}"
+                    )
+                except Exception as e:
+                    logger.warning(f"まとめた検索に失敗したためキーワードごとに取得: {group} - {e}")
+
+            for keyword in group:
+                try:
+                    request_count += 1
+                    collect(keyword)
+                except Exception as e:
+                    logger.error(f"キーワード '{keyword}' のニュース取得に失敗: {e}")
+                    continue
+
+        logger.info(
+            f"合計{len(all_articles)}件のニュースを取得しました"
+            f"（重複除去済み、リクエスト: {request_count}件）"
+        )
         return all_articles
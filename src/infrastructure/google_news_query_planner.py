@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Google News検索クエリの組み立てを計画するモジュール."""
+
+from typing import Callable, List
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GoogleNewsQueryPlanner:
+    """複数キーワードをOR検索クエリにまとめてリクエスト数を減らすプランナー.
+
+    キーワードを先頭から順に詰め込み、検索URLの長さと1クエリあたりの
+    キーワード数の上限を超えない範囲でグループ化する。
+    """
+
+    def __init__(
+        self,
+        url_builder: Callable[[str], str],
+        max_url_length: int = 2000,
+        max_keywords_per_query: int = 5,
+    ) -> None:
+        """初期化.
+
+        Args:
+            url_builder: 検索クエリから検索URLを構築する関数
+            max_url_length: 検索URLの最大長
+            max_keywords_per_query: 1クエリにまとめるキーワード数の上限
+        """
+        self.url_builder = url_builder
+        self.max_url_length = max_url_length
+        self.max_keywords_per_query = max_keywords_per_query
+
+    @staticmethod
+    def build_query(keywords: List[str]) -> str:
+        """キーワードのリストからOR検索クエリを構築.
+
+        Args:
+            keywords: キーワードのリスト
+
+        Returns:
+            検索クエリ（キーワードが1件の場合はそのまま）
+        """
+        if len(keywords) == 1:
+            return keywords[0]
+        terms = [f'"{keyword}"' if " " in keyword else keyword for keyword in keywords]
+        return " OR ".join(terms)
+
+    def plan(self, keywords: List[str]) -> List[List[str]]:
+        """キーワードを検索クエリ単位のグループに分割.
+
+        Args:
+            keywords: キーワードのリスト
+
+        Returns:
+            キーワードのグループのリスト（1グループが1リクエストに対応）
+        """
+        groups: List[List[str]] = []
+        current: List[str] = []
+
+        for keyword in dict.fromkeys(keywords):
+            candidate = current + [keyword]
+            fits = (
+                len(candidate) <= self.max_keywords_per_query
+                and len(self.url_builder(self.build_query(candidate)))
+                <= self.max_url_length
+            )
+            if fits or not current:
+                current = candidate
+            else:
+                groups.append(current)
+                current = [keyword]
+
+        if current:
+            groups.append(current)
+
+        logger.info(
+            f"検索クエリ計画: keywords={len(keywords)}件 -> requests={len(groups)}件"
+        )
+        return groups
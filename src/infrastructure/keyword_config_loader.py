@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""キーワード設定ファイルの読み込みと、変更時の再読み込みを行うモジュール."""
+
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+import yaml
+
+from src.models.keyword_config import KeywordConfig
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def load_keyword_config_file(config_file: Path) -> KeywordConfig:
+    """キーワード設定ファイルを1回だけ読み込み.
+
+    Args:
+        config_file: キーワード設定ファイルのパス
+
+    Returns:
+        キーワード設定
+
+    Raises:
+        Exception: 読み込みまたは検証に失敗した場合
+    """
+    logger.info(f"キーワード設定ファイルを読み込み: {config_file}")
+    with open(config_file, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    config = KeywordConfig(**data)
+    logger.info(f"通知先: {len(config.notification_targets)}件")
+    return config
+
+
+class KeywordConfigLoader:
+    """キーワード設定ファイルを読み込み、ファイルが変更されたら読み込み直すローダー.
+
+    get_configを呼び出すたびにファイルの更新日時とサイズを確認し、変わっていれば
+    再読み込みする。変更の無い通知先は前回の設定から引き継ぐ。再読み込みに失敗した場合は、前回読み込めた設定を使い続ける。
+    常駐するプロセスでも再起動せずに設定の変更が反映される。
+    """
+
+    def __init__(self, config_file: str) -> None:
+        """初期化.
+
+        Args:
+            config_file: キーワード設定ファイルのパス
+        """
+        self.config_file = Path(config_file)
+        self._lock = threading.Lock()
+        self._config: Optional[KeywordConfig] = None
+        self._signature: Optional[Tuple[int, int]] = None
+
+    def get_config(self) -> KeywordConfig:
+        """最新のキーワード設定を取得.
+
+        Returns:
+            キーワード設定
+
+        Raises:
+            Exception: 初回の読み込みに失敗した場合
+        """
+        with self._lock:
+            try:
+                signature = self._stat()
+            except OSError as e:
+                if self._config is None:
+                    raise
+                logger.warning(f"キーワード設定ファイルを確認できないため前回の設定を使います: {e}")
+                return self._config
+
+            if self._config is not None and signature == self._signature:
+                return self._config
+
+            try:
+                config = self._load()
+            except Exception as e:
+                if self._config is None:
+                    logger.error(f"キーワード設定ファイルの読み込みに失敗: {e}")
+                    raise
+                logger.error(f"キーワード設定ファイルの再読み込みに失敗したため前回の設定を使います: {e}")
+                # 同じ内容のファイルで再読み込みを繰り返さない
+                self._signature = signature
+                return self._config
+
+            if self._config is not None:
+                config.reuse_index(self._config)
+                self._log_changes(self._config, config)
+            self._config = config
+            self._signature = signature
+            return config
+
+    def _stat(self) -> Tuple[int, int]:
+        """ファイルの変更を判定する値を取得.
+
+        Returns:
+            (更新日時（ナノ秒）, ファイルサイズ)
+
+        Raises:
+            OSError: ファイルを参照できない場合
+        """
+        stat = self.config_file.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> KeywordConfig:
+        """キーワード設定ファイルを読み込み.
+
+        Returns:
+            キーワード設定
+
+        Raises:
+            Exception: 読み込みまたは検証に失敗した場合
+        """
+        return load_keyword_config_file(self.config_file)
+
+    @staticmethod
+    def _log_changes(previous: KeywordConfig, current: KeywordConfig) -> None:
+        """再読み込みで追加・削除・変更された通知先をログに出力.
+
+        Args:
+            previous: 変更前の設定
+            current: 変更後の設定
+        """
+        previous_names = {target.name for target in previous.notification_targets}
+        current_names = {target.name for target in current.notification_targets}
+        changed = [
+            target.name
+            for target in current.notification_targets
+            if target.name in previous_names and previous.get_target_by_name(target.name) is not target
+        ]
+        logger.info(
+            f"キーワード設定を再読み込みしました: "
+            f"追加={sorted(current_names - previous_names)}, "
+            f"削除={sorted(previous_names - current_names)}, 変更={changed}"
+        )
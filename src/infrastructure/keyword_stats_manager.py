@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""キーワードごとの取得実績（新着記事の産出量）を管理するモジュール."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class KeywordStatsManager:
+    """通知先・キーワードごとの取得実績を永続化するマネージャー.
+
+    実績は以下の項目を持つ:
+        fetch_count: 取得した回数
+        new_article_count: 取得で得た新着記事の累計
+        consecutive_empty: 新着記事が無かった連続回数
+        skipped_runs: 前回取得してからスキップした実行回数
+        last_polled_at: 最後に取得した実行の開始時刻
+        last_new_at: 最後に新着記事を得た実行の開始時刻
+        counted_urls: 新着として数えた記事のURL -> 公開日時（収集期間内のもののみ保持）
+    """
+
+    def __init__(self, stats_file: str) -> None:
+        """初期化.
+
+        Args:
+            stats_file: 実績ファイルのパス
+        """
+        self.stats_file = Path(stats_file)
+        self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+        self._stats: Dict[str, Dict[str, Dict[str, Any]]] = self._load_stats()
+
+    def _load_stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """実績ファイルから読み込み.
+
+        Returns:
+            通知先名 -> キーワード -> 実績の辞書
+        """
+        if not self.stats_file.exists():
+            logger.info(f"キーワード実績ファイルが存在しないため新規作成します: {self.stats_file}")
+            return {}
+
+        try:
+            with open(self.stats_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            stats = data.get("targets", {})
+            logger.info(f"キーワード実績を読み込みました: targets={len(stats)}件")
+            return stats
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"キーワード実績ファイルの読み込みに失敗しました: {e}")
+            return {}
+
+    def save(self) -> None:
+        """実績ファイルに保存."""
+        try:
+            with open(self.stats_file, "w", encoding="utf-8") as f:
+                json.dump({"targets": self._stats}, f, ensure_ascii=False, indent=2)
+            logger.debug("キーワード実績を保存しました")
+        except IOError as e:
+            logger.error(f"キーワード実績ファイルの保存に失敗しました: {e}")
+
+    def get_stats(self, target_name: str, keyword: str) -> Dict[str, Any]:
+        """キーワードの実績を取得（存在しない場合は初期値で作成）.
+
+        Args:
+            target_name: 通知先の名前
+            keyword: キーワード
+
+        Returns:
+            実績の辞書（変更は save() で永続化される）
+        """
+        target_stats = self._stats.setdefault(target_name, {})
+        return target_stats.setdefault(
+            keyword,
+            {
+                "fetch_count": 0,
+                "new_article_count": 0,
+                "consecutive_empty": 0,
+                "skipped_runs": 0,
+                "last_polled_at": None,
+                "last_new_at": None,
+                "counted_urls": {},
+            },
+        )
+
+    def get_last_polled_at(self, target_name: str, keyword: str) -> Optional[datetime]:
+        """キーワードを最後に取得した実行の開始時刻を取得.
+
+        Args:
+            target_name: 通知先の名前
+            keyword: キーワード
+
+        Returns:
+            最後に取得した実行の開始時刻、未取得の場合はNone
+        """
+        value = self._stats.get(target_name, {}).get(keyword, {}).get("last_polled_at")
+        return datetime.fromisoformat(value) if value else None
@@ -1,47 +1,113 @@
 # -*- coding: utf-8 -*-
 """LINE Messaging APIを使用した通知クライアント."""
 
-from typing import List
-
-from linebot.v3 import WebhookHandler
-from linebot.v3.messaging import (
-    ApiClient,
-    Configuration,
-    FlexBubble,
-    FlexButton,
-    FlexCarousel,
-    FlexContainer,
-    FlexMessage,
-    MessagingApi,
-    PushMessageRequest,
-    URIAction,
-)
-from linebot.v3.messaging.models import FlexBox, FlexText
+import base64
+import hashlib
+import hmac
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
 
+from src.infrastructure.flex_renderer import (
+    MAX_MESSAGES_PER_REQUEST,
+    encode_json,
+    render_flex_messages,
+    render_text_message,
+)
+from src.infrastructure.quota_manager import QuotaManager
+from src.infrastructure.rate_limiter import RateLimiter, RateLimitError, parse_retry_after
+from src.infrastructure.resilience import Resilience
 from src.models.news_article import NewsArticle
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def verify_signature(channel_secret: str, body: bytes, signature: str) -> bool:
+    """Webhookのリクエストボディの署名（X-Line-Signature）を検証.
+
+    Args:
+        channel_secret: LINEチャンネルシークレット
+        body: リクエストボディ
+        signature: X-Line-Signatureヘッダーの値
+
+    Returns:
+        署名が正しい場合True
+    """
+    digest = hmac.new(channel_secret.encode("utf-8"), body, hashlib.sha256).digest()
+    return hmac.compare_digest(base64.b64encode(digest).decode("ascii"), signature)
+
+
+class DeliveryError(Exception):
+    """通知の一部または全部を送信できなかったことを表す例外."""
+
+    def __init__(self, message: str, delivered_articles: List[NewsArticle]) -> None:
+        """初期化.
+
+        Args:
+            message: エラーメッセージ
+            delivered_articles: 失敗するまでに送信できた記事のリスト
+        """
+        super().__init__(message)
+        self.delivered_articles = delivered_articles
+
+
 class LineClient:
-    """LINE Messaging APIクライアント."""
+    """LINE Messaging APIクライアント.
+
+    メッセージはflex_rendererで組み立てたJSONを、SDKのモデルを経由せず
+    そのままMessaging APIに送信する。10件を超える記事は複数のカルーセルに分け、
+    1リクエストに最大5メッセージ（50件）ずつまとめて送信する。
+    """
+
+    HOST = "api.line.me"
+    API_BASE_URL = "https://api.line.me/v2/bot/message"
+
+    # マルチキャスト1回あたりの最大送信先数（Messaging APIの上限）
+    MULTICAST_MAX_RECIPIENTS = 500
+
+    # 冪等な再送のためのリクエストヘッダー
+    RETRY_KEY_HEADER = "X-Line-Retry-Key"
 
-    def __init__(self, channel_access_token: str) -> None:
+    # 送信メッセージ数を記録するチャンネル名
+    QUOTA_CHANNEL = "line"
+
+    def __init__(
+        self,
+        channel_access_token: str,
+        rate_limiter: Optional[RateLimiter] = None,
+        resilience: Optional[Resilience] = None,
+        timeout: float = 10.0,
+        quota_manager: Optional[QuotaManager] = None,
+    ) -> None:
         """初期化.
 
         Args:
             channel_access_token: LINEチャンネルアクセストークン
+            rate_limiter: ホストごとのレートリミッター（オプション）
+            resilience: リトライ・サーキットブレーカー（オプション）
+            timeout: APIリクエストのタイムアウト（秒）
+            quota_manager: 送信メッセージ数の記録先（オプション）
         """
         self.channel_access_token = channel_access_token
-        configuration = Configuration(access_token=channel_access_token)
-        self.api_client = ApiClient(configuration)
-        self.messaging_api = MessagingApi(self.api_client)
+        self.rate_limiter = rate_limiter
+        self.resilience = resilience
+        self.quota_manager = quota_manager
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "Authorization": f"Bearer {channel_access_token}",
+                "Content-Type": "application/json",
+            }
+        )
         logger.info("LINE Client初期化完了")
 
     def send_news_notification(
         self, user_id: str, articles: List[NewsArticle], target_name: str
-    ) -> None:
+    ) -> List[NewsArticle]:
         """ニュース記事をFlex Messageで通知.
 
         Args:
@@ -49,21 +115,130 @@ class LineClient:
             articles: 通知する記事のリスト
             target_name: 通知先の名前
 
+        Returns:
+            送信できた記事のリスト
+
         Raises:
-            Exception: 通知に失敗した場合
+            DeliveryError: 送信に失敗した場合（送信済みの記事を保持する）
         """
         if not articles:
             logger.warning("通知する記事がありません")
-            return
+            return []
 
-        try:
-            flex_message = self._create_flex_message(articles, target_name)
-            request = PushMessageRequest(to=user_id, messages=[flex_message])
-            self.messaging_api.push_message(request)
-            logger.info(f"LINE通知送信成功: user_id={user_id}, articles={len(articles)}件")
-        except Exception as e:
-            logger.error(f"LINE通知送信エラー: {e}")
-            raise
+        delivered = self._send_news([user_id], articles, target_name)
+        logger.info(f"LINE通知送信成功: user_id={user_id}, articles={len(delivered)}件")
+        return delivered
+
+    def multicast_news_notification(
+        self, user_ids: List[str], articles: List[NewsArticle], target_name: str
+    ) -> List[NewsArticle]:
+        """同じニュース記事を複数のユーザーにマルチキャストで通知.
+
+        Flex Messageは1回だけ作成し、送信先を上限数ごとに分けて送信する。
+
+        Args:
+            user_ids: LINE User IDのリスト
+            articles: 通知する記事のリスト
+            target_name: 通知先の名前（代替テキストに使用。空文字列の場合は含めない）
+
+        Returns:
+            送信できた記事のリスト
+
+        Raises:
+            DeliveryError: 送信に失敗した場合（送信済みの記事を保持する）
+        """
+        if not articles or not user_ids:
+            logger.warning("通知する記事または送信先がありません")
+            return []
+
+        delivered = self._send_news(user_ids, articles, target_name)
+        logger.info(
+            f"LINEマルチキャスト送信成功: recipients={len(user_ids)}人, "
+            f"articles={len(delivered)}件"
+        )
+        return delivered
+
+    def build_news_requests(
+        self, user_ids: List[str], articles: List[NewsArticle], target_name: str
+    ) -> List[Tuple[str, Dict[str, Any], List[NewsArticle]]]:
+        """記事のカルーセルをできるだけ少ないリクエストにまとめて組み立てる.
+
+        送信先が1人の場合はプッシュ、複数の場合はマルチキャスト（500人ごと）の
+        リクエストにする。
+
+        Args:
+            user_ids: LINE User IDのリスト
+            articles: 通知する記事のリスト
+            target_name: 通知先の名前
+
+        Returns:
+            (エンドポイント名, リクエストボディ, 含まれる記事)のリスト
+        """
+        messages = render_flex_messages(articles, target_name)
+        news_requests: List[Tuple[str, Dict[str, Any], List[NewsArticle]]] = []
+
+        for start in range(0, len(messages), MAX_MESSAGES_PER_REQUEST):
+            batch = messages[start : start + MAX_MESSAGES_PER_REQUEST]
+            payload_messages = [message for message, _articles in batch]
+            batch_articles = [article for _message, chunk in batch for article in chunk]
+            if len(user_ids) == 1:
+                news_requests.append(
+                    ("push", {"to": user_ids[0], "messages": payload_messages}, batch_articles)
+                )
+            else:
+                for offset in range(0, len(user_ids), self.MULTICAST_MAX_RECIPIENTS):
+                    recipients = user_ids[offset : offset + self.MULTICAST_MAX_RECIPIENTS]
+                    news_requests.append(
+                        (
+                            "multicast",
+                            {"to": recipients, "messages": payload_messages},
+                            batch_articles,
+                        )
+                    )
+        return news_requests
+
+    def _send_news(
+        self, user_ids: List[str], articles: List[NewsArticle], target_name: str
+    ) -> List[NewsArticle]:
+        """記事のカルーセルをまとめて送信.
+
+        記事は、その記事を含むリクエストが全送信先に送信できた時点で送信済みとする。
+
+        Args:
+            user_ids: LINE User IDのリスト
+            articles: 通知する記事のリスト
+            target_name: 通知先の名前
+
+        Returns:
+            送信できた記事のリスト
+
+        Raises:
+            DeliveryError: 送信に失敗した場合（送信済みの記事を保持する）
+        """
+        news_requests = self.build_news_requests(user_ids, articles, target_name)
+        delivered: List[NewsArticle] = []
+
+        for index, (endpoint, payload, batch_articles) in enumerate(news_requests):
+            try:
+                self.send_request(endpoint, payload)
+            except Exception as e:
+                logger.error(
+                    f"LINE通知送信エラー: 送信済み={len(delivered)}/{len(articles)}件 - {e}"
+                )
+                raise DeliveryError(str(e), delivered) from e
+
+            # マルチキャストを分割した場合は、同じ記事の最後のリクエストで送信済みとする
+            is_last_for_batch = (
+                index + 1 == len(news_requests)
+                or news_requests[index + 1][2] is not batch_articles
+            )
+            if is_last_for_batch:
+                delivered.extend(batch_articles)
+
+        logger.debug(
+            f"LINE送信: articles={len(articles)}件, requests={len(news_requests)}回"
+        )
+        return delivered
 
     def send_error_notification(self, user_id: str, error_message: str) -> None:
         """エラーメッセージを通知.
@@ -76,96 +251,103 @@ class LineClient:
             Exception: 通知に失敗した場合
         """
         try:
-            from linebot.v3.messaging import TextMessage
-
-            request = PushMessageRequest(
-                to=user_id,
-                messages=[TextMessage(text=f"❌ エラーが発生しました\n\n{error_message}")],
-            )
-            self.messaging_api.push_message(request)
+            message = render_text_message(f"❌ エラーが発生しました\n\n{error_message}")
+            self.send_request("push", {"to": user_id, "messages": [message]})
             logger.info(f"エラー通知送信成功: user_id={user_id}")
         except Exception as e:
             logger.error(f"エラー通知送信失敗: {e}")
             raise
 
-    def _create_flex_message(
-        self, articles: List[NewsArticle], target_name: str
-    ) -> FlexMessage:
-        """Flex Messageを作成.
+    def reply_message(self, reply_token: str, messages: List[Dict[str, Any]]) -> None:
+        """Webhookで受け取ったメッセージに応答メッセージを送信.
+
+        応答トークンは1回しか使えず、有効期限も短いため、リトライせずに送信する。
+        応答メッセージは送信メッセージ数に数えない。
 
         Args:
-            articles: 記事のリスト
-            target_name: 通知先の名前
+            reply_token: Webhookイベントの応答トークン
+            messages: メッセージのJSON用辞書のリスト（最大5件）
 
-        Returns:
-            FlexMessage
+        Raises:
+            RateLimitError: LINE APIのレート制限に達した場合
+            requests.RequestException: その他の通信エラー・APIエラーの場合
         """
-        # カルーセル形式で最大10件まで
-        bubbles = []
-        for i, article in enumerate(articles[:10]):
-            bubble = self._create_bubble(article, i + 1)
-            bubbles.append(bubble)
-
-        carousel = FlexCarousel(contents=bubbles)
-
-        return FlexMessage(
-            alt_text=f"{target_name}: {len(articles)}件の新着ニュース", contents=carousel
+        body = encode_json(
+            {"replyToken": reply_token, "messages": messages[:MAX_MESSAGES_PER_REQUEST]}
         )
+        self._send("reply", body)
+        logger.info(f"LINE応答メッセージ送信成功: messages={len(messages)}件")
 
-    def _create_bubble(self, article: NewsArticle, index: int) -> FlexBubble:
-        """1記事分のFlex Bubbleを作成.
+    def send_request(
+        self, endpoint: str, payload: Dict[str, Any], retry_key: Optional[str] = None
+    ) -> None:
+        """リトライ・サーキットブレーカーを適用してメッセージ送信APIを呼び出す.
+
+        リトライキー（X-Line-Retry-Key）を付けて送信するため、同じキーで再送しても
+        LINE側で重複して配信されない。既に受理済みのキーで送信した場合（HTTP 409）は
+        送信成功として扱う。新たに受理された場合は送信先の人数を送信メッセージ数として記録する。
 
         Args:
-            article: ニュース記事
-            index: 記事番号
+            endpoint: エンドポイント名（push / multicast）
+            payload: リクエストボディ
+            retry_key: リトライキー（省略時は新しく発行する）
 
-        Returns:
-            FlexBubble
+        Raises:
+            CircuitOpenError: サーキットブレーカーが開いている場合
+            RateLimitError: LINE APIのレート制限に達した場合
+            requests.RequestException: その他の通信エラー・APIエラーの場合
         """
-        # タイトル（最大60文字）
-        title = article.title[:60] + "..." if len(article.title) > 60 else article.title
+        body = encode_json(payload)
+        retry_key = retry_key or str(uuid.uuid4())
+        if self.resilience is not None:
+            accepted = self.resilience.call(lambda: self._send(endpoint, body, retry_key))
+        else:
+            accepted = self._send(endpoint, body, retry_key)
 
-        # 要約（最大150文字）
-        summary = article.summary or article.description
-        summary = summary[:150] + "..." if len(summary) > 150 else summary
+        if accepted and self.quota_manager is not None:
+            recipients = payload["to"]
+            self.quota_manager.record(
+                self.QUOTA_CHANNEL,
+                1 if isinstance(recipients, str) else len(recipients),
+                datetime.now(timezone.utc),
+            )
 
-        # 公開日時
-        from src.utils.date_helper import format_datetime_jst
+    def _send(self, endpoint: str, body: bytes, retry_key: Optional[str] = None) -> bool:
+        """レート制限を考慮してメッセージ送信APIを呼び出す.
 
-        published = format_datetime_jst(article.published_date)
+        Args:
+            endpoint: エンドポイント名（push / multicast / reply）
+            body: JSONエンコード済みのリクエストボディ
+            retry_key: リトライキー（応答メッセージでは指定しない）
 
-        header = FlexBox(
-            layout="vertical",
-            contents=[
-                FlexText(text=f"📰 ニュース #{index}", size="sm", color="#1DB446")
-            ],
-        )
+        Returns:
+            新たに受理された場合True、同じリトライキーで受理済みだった場合False
 
-        body = FlexBox(
-            layout="vertical",
-            contents=[
-                FlexText(text=title, size="lg", weight="bold", wrap=True),
-                FlexBox(
-                    layout="vertical",
-                    margin="md",
-                    spacing="sm",
-                    contents=[
-                        FlexText(text=summary, size="sm", color="#666666", wrap=True),
-                        FlexText(text=published, size="xs", color="#999999", margin="md"),
-                    ],
-                ),
-            ],
-        )
+        Raises:
+            RateLimitError: LINE APIのレート制限に達した場合
+            requests.RequestException: その他の通信エラー・APIエラーの場合
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self.HOST)
 
-        footer = FlexBox(
-            layout="vertical",
-            spacing="sm",
-            contents=[
-                FlexButton(
-                    style="primary",
-                    action=URIAction(label="記事を読む", uri=article.get_url_string()),
-                )
-            ],
+        response = self.session.post(
+            f"{self.API_BASE_URL}/{endpoint}",
+            data=body,
+            headers={self.RETRY_KEY_HEADER: retry_key} if retry_key else None,
+            timeout=self.timeout,
         )
-
-        return FlexBubble(header=header, body=body, footer=footer)
+        if response.status_code == 409:
+            # 同じリトライキーのリクエストは受理済み（前回の送信は届いている）
+            logger.info(f"LINE送信は受理済みです: retry_key={retry_key}")
+            return False
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response.headers)
+            if self.rate_limiter is not None:
+                self.rate_limiter.register_retry_after(self.HOST, retry_after)
+            raise RateLimitError("LINE APIのレート制限に達しました (HTTP 429)", retry_after)
+        if response.status_code >= 400:
+            raise requests.HTTPError(
+                f"LINE APIエラー (HTTP {response.status_code}): {response.text}",
+                response=response,
+            )
+        return True
@@ -2,11 +2,16 @@
 """LLM API（Gemini/Ollama）を使用した要約生成クライアント."""
 
 from abc import ABC, abstractmethod
-from typing import Literal
+from typing import Literal, Optional
 
 import requests
 from google import genai
+from google.genai import errors as genai_errors
+from google.genai import types as genai_types
 
+from src.infrastructure.rate_limiter import RateLimiter, RateLimitError, parse_retry_after
+from src.infrastructure.resilience import Resilience
+from src.models.prompt_template import SUMMARY_PROMPT_TEMPLATE, PromptTemplate
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,6 +20,8 @@ logger = get_logger(__name__)
 class LLMClient(ABC):
     """LLMクライアントの抽象基底クラス."""
 
+    prompt_template: PromptTemplate = SUMMARY_PROMPT_TEMPLATE
+
     @abstractmethod
     def summarize(self, text: str) -> str:
         """テキストを要約.
@@ -34,15 +41,34 @@ class LLMClient(ABC):
 class GeminiClient(LLMClient):
     """Google Gemini APIを使用した要約クライアント."""
 
-    def __init__(self, api_key: str, model: str = "gemini-pro") -> None:
+    HOST = "generativelanguage.googleapis.com"
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-pro",
+        rate_limiter: Optional[RateLimiter] = None,
+        resilience: Optional[Resilience] = None,
+        prompt_template: PromptTemplate = SUMMARY_PROMPT_TEMPLATE,
+        use_context_cache: bool = False,
+    ) -> None:
         """初期化.
 
         Args:
             api_key: Gemini APIキー
             model: 使用するモデル名
+            rate_limiter: ホストごとのレートリミッター（オプション）
+            resilience: リトライ・サーキットブレーカー（オプション）
+            prompt_template: 要約用のプロンプトテンプレート
+            use_context_cache: システム指示をコンテキストキャッシュに登録して使うか
         """
         self.api_key = api_key
         self.model_name = model
+        self.rate_limiter = rate_limiter
+        self.resilience = resilience
+        self.prompt_template = prompt_template
+        self.use_context_cache = use_context_cache
+        self._cached_content_name: Optional[str] = None
         self.client = genai.Client(api_key=api_key)
         logger.info(f"Gemini Client初期化完了: model={model}")
 
@@ -58,38 +84,124 @@ class GeminiClient(LLMClient):
         Raises:
             Exception: 要約に失敗した場合
         """
-        prompt = f"""以下のニュース記事を日本語で簡潔に要約してください。
-        3〜5文程度で、重要なポイントを含めてまとめてください。
-
-        記事:
-        {text}
-
-        要約:"""
+        prompt = self.prompt_template.render(text)
 
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name, contents=prompt
-            )
-            summary = response.text.strip()
+            if self.resilience is not None:
+                summary = self.resilience.call(lambda: self._generate(prompt))
+            else:
+                summary = self._generate(prompt)
             logger.debug(f"Geminiで要約生成成功: length={len(summary)}")
             return summary
         except Exception as e:
             logger.error(f"Gemini要約生成エラー: {e}")
             raise
 
+    def _get_generate_config(self) -> genai_types.GenerateContentConfig:
+        """共通のシステム指示を指定した生成設定を取得.
 
-class OllamaClient(LLMClient):
-    """Ollama APIを使用した要約クライアント."""
+        コンテキストキャッシュが有効な場合は、初回にシステム指示をキャッシュに登録し、
+        以降はキャッシュを参照する。登録できない場合（モデルの最小トークン数未満など）は
+        system_instructionで毎回渡す。
+
+        Returns:
+            生成設定
+        """
+        if self.use_context_cache and self._cached_content_name is None:
+            try:
+                cache = self.client.caches.create(
+                    model=self.model_name,
+                    config=genai_types.CreateCachedContentConfig(
+                        display_name=self.prompt_template.cache_key,
+                        system_instruction=self.prompt_template.system_instruction,
+                        ttl="3600s",
+                    ),
+                )
+                self._cached_content_name = cache.name
+                logger.info(f"Geminiコンテキストキャッシュ作成: {cache.name}")
+            except Exception as e:
+                logger.warning(f"Geminiコンテキストキャッシュを使用できません: {e}")
+                self.use_context_cache = False
+
+        if self._cached_content_name is not None:
+            return genai_types.GenerateContentConfig(
+                cached_content=self._cached_content_name
+            )
+        return genai_types.GenerateContentConfig(
+            system_instruction=self.prompt_template.system_instruction
+        )
+
+    def _generate(self, prompt: str) -> str:
+        """Gemini APIで文章を生成.
+
+        Args:
+            prompt: 記事ごとの入力
+
+        Returns:
+            生成された文章
+
+        Raises:
+            RateLimitError: レート制限（HTTP 429）を受けた場合
+            Exception: その他のAPIエラーの場合
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self.HOST)
+        try:
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=prompt,
+                config=self._get_generate_config(),
+            )
+        except genai_errors.APIError as e:
+            if e.code == 429:
+                retry_after = parse_retry_after(getattr(e.response, "headers", None))
+                if self.rate_limiter is not None:
+                    self.rate_limiter.register_retry_after(self.HOST, retry_after)
+                raise RateLimitError(
+                    "Gemini APIのレート制限に達しました (HTTP 429)", retry_after
+                ) from e
+            if self._cached_content_name is not None and e.code in (400, 403, 404):
+                # キャッシュの期限切れなど。以降はsystem_instructionで渡す
+                logger.warning(f"Geminiコンテキストキャッシュを破棄: {e}")
+                self._cached_content_name = None
+                self.use_context_cache = False
+                return self._generate(prompt)
+            raise
+        return response.text.strip()
 
-    def __init__(self, api_url: str, model: str = "llama2") -> None:
+
+class OllamaClient(LLMClient):
+    """Ollama APIを使用した要約クライアント.
+
+    システム指示をsystemとして分けて渡し、keep_aliveでモデルをロードしたままにする。
+    プロンプトの先頭が毎回同じになるため、Ollama側で共通部分のKVキャッシュが再利用される。
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        model: str = "llama2",
+        rate_limiter: Optional[RateLimiter] = None,
+        resilience: Optional[Resilience] = None,
+        prompt_template: PromptTemplate = SUMMARY_PROMPT_TEMPLATE,
+        keep_alive: str = "10m",
+    ) -> None:
         """初期化.
 
         Args:
             api_url: Ollama APIのURL
             model: 使用するモデル名
+            rate_limiter: ホストごとのレートリミッター（オプション）
+            resilience: リトライ・サーキットブレーカー（オプション）
+            prompt_template: 要約用のプロンプトテンプレート
+            keep_alive: 最後の呼び出しの後にモデルをメモリに保持する時間
         """
         self.api_url = api_url.rstrip("/")
         self.model_name = model
+        self.rate_limiter = rate_limiter
+        self.resilience = resilience
+        self.prompt_template = prompt_template
+        self.keep_alive = keep_alive
         logger.info(f"Ollama Client初期化完了: url={api_url}, model={model}")
 
     def summarize(self, text: str) -> str:
@@ -104,27 +216,13 @@ class OllamaClient(LLMClient):
         Raises:
             Exception: 要約に失敗した場合
         """
-        prompt = f"""以下のニュース記事を日本語で簡潔に要約してください。
-3〜5文程度で、重要なポイントを含めてまとめてください。
-
-記事:
-{text}
-
-要約:"""
+        prompt = self.prompt_template.render(text)
 
         try:
-            response = requests.post(
-                f"{self.api_url}/api/generate",
-                json={
-                    "model": self.model_name,
-                    "prompt": prompt,
-                    "stream": False,
-                },
-                timeout=30,
-            )
-            response.raise_for_status()
-            result = response.json()
-            summary = result.get("response", "").strip()
+            if self.resilience is not None:
+                summary = self.resilience.call(lambda: self._generate(prompt))
+            else:
+                summary = self._generate(prompt)
 
             if not summary:
                 raise ValueError("Ollamaからの応答が空です")
@@ -135,6 +233,43 @@ class OllamaClient(LLMClient):
             logger.error(f"Ollama要約生成エラー: {e}")
             raise
 
+    def _generate(self, prompt: str) -> str:
+        """Ollama APIで文章を生成.
+
+        Args:
+            prompt: 記事ごとの入力
+
+        Returns:
+            生成された文章
+
+        Raises:
+            RateLimitError: レート制限（HTTP 429）を受けた場合
+            requests.RequestException: 通信エラー・HTTPエラーの場合
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self.api_url)
+        response = requests.post(
+            f"{self.api_url}/api/generate",
+            json={
+                "model": self.model_name,
+                "system": self.prompt_template.system_instruction,
+                "prompt": prompt,
+                "stream": False,
+                "keep_alive": self.keep_alive,
+            },
+            timeout=30,
+        )
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response.headers)
+            if self.rate_limiter is not None:
+                self.rate_limiter.register_retry_after(self.api_url, retry_after)
+            raise RateLimitError(
+                "Ollama APIのレート制限に達しました (HTTP 429)", retry_after
+            )
+        response.raise_for_status()
+        result = response.json()
+        return result.get("response", "").strip()
+
 
 class LLMClientFactory:
     """LLMクライアントのファクトリークラス."""
@@ -145,6 +280,9 @@ class LLMClientFactory:
         api_key: str = "",
         api_url: str = "http://localhost:11434",
         model: str = "",
+        rate_limiter: Optional[RateLimiter] = None,
+        resilience: Optional[Resilience] = None,
+        use_context_cache: bool = False,
     ) -> LLMClient:
         """LLMクライアントを生成.
 
@@ -153,6 +291,9 @@ class LLMClientFactory:
             api_key: APIキー（Gemini用）
             api_url: APIのURL（Ollama用）
             model: モデル名（オプション）
+            rate_limiter: ホストごとのレートリミッター（オプション）
+            resilience: リトライ・サーキットブレーカー（オプション）
+            use_context_cache: Geminiのコンテキストキャッシュを使うか
 
         Returns:
             LLMClient
@@ -164,9 +305,20 @@ class LLMClientFactory:
             if not api_key:
                 raise ValueError("Gemini使用時はapi_keyが必須です")
             model_name = model or "gemini-2.5-flash"
-            return GeminiClient(api_key=api_key, model=model_name)
+            return GeminiClient(
+                api_key=api_key,
+                model=model_name,
+                rate_limiter=rate_limiter,
+                resilience=resilience,
+                use_context_cache=use_context_cache,
+            )
         elif provider == "ollama":
             model_name = model or "llama2"
-            return OllamaClient(api_url=api_url, model=model_name)
+            return OllamaClient(
+                api_url=api_url,
+                model=model_name,
+                rate_limiter=rate_limiter,
+                resilience=resilience,
+            )
         else:
             raise ValueError(f"不正なLLMプロバイダー: {provider}")
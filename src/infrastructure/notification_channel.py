@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+"""通知チャンネルの基底クラスと、LINE以外のチャンネル（Slack・メール・Webhook）の実装."""
+
+import functools
+import smtplib
+from abc import ABC, abstractmethod
+from email.message import EmailMessage
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from src.infrastructure.flex_renderer import SUMMARY_MAX_CHARS, encode_json
+from src.infrastructure.line_client import DeliveryError
+from src.infrastructure.resilience import Resilience
+from src.models.news_article import NewsArticle
+from src.models.notification import Notification
+from src.utils.date_helper import format_datetime_jst
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _summary_text(article: NewsArticle) -> str:
+    """通知に載せる要約文を作成.
+
+    Args:
+        article: ニュース記事
+
+    Returns:
+        最大文字数で切り詰めた要約文（簡易要約の場合は先頭に表示）
+    """
+    summary = article.summary or article.description
+    if len(summary) > SUMMARY_MAX_CHARS:
+        summary = summary[:SUMMARY_MAX_CHARS] + "..."
+    return f"【簡易要約】{summary}" if article.is_summary_degraded() else summary
+
+
+class NotificationChannel(ABC):
+    """通知チャンネルの基底クラス.
+
+    sendには今回送信する通知がまとめて渡される。既定の実装は通知を1件ずつ
+    deliverで送信し、失敗した通知先のエラーを返す。
+    """
+
+    def __init__(self, name: str, resilience: Optional[Resilience] = None) -> None:
+        """初期化.
+
+        Args:
+            name: チャンネル名（ログ・メトリクス用）
+            resilience: リトライ・サーキットブレーカー（オプション）
+        """
+        self.name = name
+        self.resilience = resilience
+
+    def send(self, notifications: List[Notification]) -> Dict[str, Exception]:
+        """通知をまとめて送信.
+
+        Args:
+            notifications: 通知のリスト
+
+        Returns:
+            送信に失敗した通知先の名前 -> 例外の辞書
+        """
+        errors: Dict[str, Exception] = {}
+        for notification in notifications:
+            try:
+                self.deliver(notification)
+            except Exception as e:
+                logger.error(
+                    f"通知送信エラー: channel={self.name}, "
+                    f"target={notification.target_name} - {e}"
+                )
+                errors[notification.target_name] = e
+        return errors
+
+    def deliver(self, notification: Notification) -> None:
+        """リトライ・サーキットブレーカーを適用して通知を1件送信.
+
+        複数のリクエストに分けて送信するチャンネルは、送信済みのリクエストを
+        再送しないようリクエストごとにリトライするよう上書きする。
+
+        Args:
+            notification: 通知データ
+
+        Raises:
+            Exception: 送信に失敗した場合
+        """
+        self._call(functools.partial(self.send_notification, notification))
+
+    def _call(self, func: Callable[[], Any]) -> Any:
+        """リトライ・サーキットブレーカー（設定されている場合）を通して関数を呼び出す.
+
+        Args:
+            func: 呼び出す関数
+
+        Returns:
+            関数の戻り値
+
+        Raises:
+            Exception: 関数の呼び出しに失敗した場合
+        """
+        if self.resilience is not None:
+            return self.resilience.call(func)
+        return func()
+
+    @abstractmethod
+    def send_notification(self, notification: Notification) -> None:
+        """通知を1件送信.
+
+        Args:
+            notification: 通知データ
+
+        Raises:
+            Exception: 送信に失敗した場合
+        """
+        pass
+
+
+class SlackChannel(NotificationChannel):
+    """SlackのIncoming Webhookに通知するチャンネル."""
+
+    # 1メッセージあたりの記事数（Block Kitの50ブロックの上限に収まる数）
+    MAX_ARTICLES_PER_MESSAGE = 20
+
+    def __init__(
+        self,
+        name: str,
+        webhook_url: str,
+        session: Optional[requests.Session] = None,
+        resilience: Optional[Resilience] = None,
+        timeout: float = 10.0,
+    ) -> None:
+        """初期化.
+
+        Args:
+            name: チャンネル名
+            webhook_url: Incoming WebhookのURL
+            session: HTTPセッション（省略時は新規作成）
+            resilience: リトライ・サーキットブレーカー（オプション）
+            timeout: リクエストのタイムアウト（秒）
+        """
+        super().__init__(name, resilience)
+        self.webhook_url = webhook_url
+        self.session = session or requests.Session()
+        self.timeout = timeout
+
+    def send_notification(self, notification: Notification) -> None:
+        """記事の一覧をSlackに送信.
+
+        Args:
+            notification: 通知データ
+
+        Raises:
+            DeliveryError: 送信に失敗した場合（送信済みの記事を保持する）
+        """
+        self._send_chunks(notification, self._post)
+
+    def deliver(self, notification: Notification) -> None:
+        """記事の一覧をSlackに送信（メッセージごとにリトライする）.
+
+        途中のメッセージで失敗しても、送信済みのメッセージは再送しない。
+
+        Args:
+            notification: 通知データ
+
+        Raises:
+            DeliveryError: 送信に失敗した場合（送信済みの記事を保持する）
+        """
+        self._send_chunks(
+            notification, lambda payload: self._call(functools.partial(self._post, payload))
+        )
+
+    def _send_chunks(
+        self, notification: Notification, post: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """記事をメッセージに分けて順に送信.
+
+        Args:
+            notification: 通知データ
+            post: 1メッセージを送信する関数
+
+        Raises:
+            DeliveryError: 送信に失敗した場合（送信済みの記事を保持する）
+        """
+        delivered: List[NewsArticle] = []
+        for articles, payload in self._iter_payloads(notification):
+            try:
+                post(payload)
+            except Exception as e:
+                raise DeliveryError(
+                    f"Slack通知送信エラー: {len(delivered)}/{len(notification.articles)}件送信済み - {e}",
+                    delivered,
+                ) from e
+            delivered.extend(articles)
+        logger.info(f"Slack通知送信成功: channel={self.name}, articles={len(delivered)}件")
+
+    def _iter_payloads(
+        self, notification: Notification
+    ) -> Iterator[Tuple[List[NewsArticle], Dict[str, Any]]]:
+        """記事を1メッセージの上限ごとに分け、メッセージを作成.
+
+        Args:
+            notification: 通知データ
+
+        Yields:
+            (メッセージに含む記事のリスト, リクエストボディ)
+        """
+        articles = notification.articles
+        for start in range(0, len(articles), self.MAX_ARTICLES_PER_MESSAGE):
+            chunk = articles[start : start + self.MAX_ARTICLES_PER_MESSAGE]
+            yield chunk, self.build_payload(
+                chunk, notification.target_name, start_index=start + 1, total=len(articles)
+            )
+
+    def _post(self, payload: Dict[str, Any]) -> None:
+        """1メッセージをIncoming Webhookに送信.
+
+        Args:
+            payload: リクエストボディ
+
+        Raises:
+            requests.RequestException: 送信に失敗した場合
+        """
+        response = self.session.post(
+            self.webhook_url,
+            data=encode_json(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+
+    @staticmethod
+    def build_payload(
+        articles: List[NewsArticle], target_name: str, start_index: int = 1, total: int = 0
+    ) -> Dict[str, Any]:
+        """Block Kitのメッセージを作成.
+
+        Args:
+            articles: 記事のリスト
+            target_name: 通知先の名前
+            start_index: 最初の記事の番号
+            total: 全体の記事数（省略時は記事のリストの件数）
+
+        Returns:
+            リクエストボディ
+        """
+        title = f"{target_name}: {total or len(articles)}件の新着ニュース"
+        blocks: List[Dict[str, Any]] = [
+            {"type": "header", "text": {"type": "plain_text", "text": title}}
+        ]
+        for index, article in enumerate(articles, start=start_index):
+            blocks.append(
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": (
+                            f"*{index}. <{article.get_url_string()}|{article.title}>*\n"
+                            f"{_summary_text(article)}"
+                        ),
+                    },
+                }
+            )
+            blocks.append(
+                {
+                    "type": "context",
+                    "elements": [
+                        {"type": "plain_text", "text": format_datetime_jst(article.published_date)}
+                    ],
+                }
+            )
+        return {"text": title, "blocks": blocks}
+
+
+class WebhookChannel(NotificationChannel):
+    """任意のURLに記事の一覧をJSONでPOSTするチャンネル."""
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        session: Optional[requests.Session] = None,
+        resilience: Optional[Resilience] = None,
+        timeout: float = 10.0,
+    ) -> None:
+        """初期化.
+
+        Args:
+            name: チャンネル名
+            url: 送信先のURL
+            session: HTTPセッション（省略時は新規作成）
+            resilience: リトライ・サーキットブレーカー（オプション）
+            timeout: リクエストのタイムアウト（秒）
+        """
+        super().__init__(name, resilience)
+        self.url = url
+        self.session = session or requests.Session()
+        self.timeout = timeout
+
+    def send_notification(self, notification: Notification) -> None:
+        """記事の一覧をJSONで送信.
+
+        Args:
+            notification: 通知データ
+
+        Raises:
+            requests.RequestException: 送信に失敗した場合
+        """
+        payload = {
+            "target_name": notification.target_name,
+            "articles": [
+                article.model_dump(
+                    mode="json",
+                    include={
+                        "title",
+                        "url",
+                        "published_date",
+                        "summary",
+                        "summary_source",
+                        "relevance_score",
+                    },
+                )
+                for article in notification.articles
+            ],
+        }
+        response = self.session.post(
+            self.url,
+            data=encode_json(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        logger.info(
+            f"Webhook通知送信成功: channel={self.name}, articles={len(notification.articles)}件"
+        )
+
+
+class EmailChannel(NotificationChannel):
+    """SMTPで記事の一覧をメール送信するチャンネル."""
+
+    def __init__(
+        self,
+        name: str,
+        recipients: List[str],
+        smtp_host: str,
+        smtp_port: int = 587,
+        sender: str = "",
+        username: str = "",
+        password: str = "",
+        use_tls: bool = True,
+        resilience: Optional[Resilience] = None,
+        timeout: float = 10.0,
+    ) -> None:
+        """初期化.
+
+        Args:
+            name: チャンネル名
+            recipients: 送信先のメールアドレスのリスト
+            smtp_host: SMTPサーバーのホスト名
+            smtp_port: SMTPサーバーのポート番号
+            sender: 送信元のメールアドレス（省略時はusername）
+            username: SMTP認証のユーザー名（省略時は認証しない）
+            password: SMTP認証のパスワード
+            use_tls: STARTTLSを使うか
+            resilience: リトライ・サーキットブレーカー（オプション）
+            timeout: 接続のタイムアウト（秒）
+        """
+        super().__init__(name, resilience)
+        self.recipients = recipients
+        self.smtp_host = smtp_host
+        self.smtp_port = smtp_port
+        self.sender = sender or username
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+
+    def send_notification(self, notification: Notification) -> None:
+        """記事の一覧をメールで送信.
+
+        Args:
+            notification: 通知データ
+
+        Raises:
+            smtplib.SMTPException: 送信に失敗した場合
+            OSError: SMTPサーバーに接続できない場合
+        """
+        message = self.build_message(notification)
+        with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout) as smtp:
+            if self.use_tls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+            smtp.send_message(message)
+        logger.info(
+            f"メール通知送信成功: channel={self.name}, recipients={len(self.recipients)}件, "
+            f"articles={len(notification.articles)}件"
+        )
+
+    def build_message(self, notification: Notification) -> EmailMessage:
+        """記事の一覧のメールを作成.
+
+        Args:
+            notification: 通知データ
+
+        Returns:
+            メールメッセージ
+        """
+        lines = []
+        for index, article in enumerate(notification.articles, start=1):
+            lines.extend(
+                [
+                    f"{index}. {article.title}",
+                    _summary_text(article),
+                    f"{format_datetime_jst(article.published_date)}  {article.get_url_string()}",
+                    "",
+                ]
+            )
+
+        message = EmailMessage()
+        message["Subject"] = (
+            f"[ニュース通知] {notification.target_name}: "
+            f"{notification.get_article_count()}件の新着ニュース"
+        )
+        message["From"] = self.sender
+        message["To"] = ", ".join(self.recipients)
+        message.set_content("\n".join(lines))
+        return message
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""送信待ちメッセージ（アウトボックス）の永続化モジュール."""
+
+import os
+from pathlib import Path
+from typing import List
+
+from pydantic import ValidationError
+
+from src.models.outbox_entry import OutboxEntry
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class OutboxManager:
+    """送信待ちリクエストを1件1ファイルで保存するマネージャー.
+
+    書き込みは一時ファイルへの書き込みとfsyncの後にリネームするため、
+    途中で異常終了しても壊れたエントリーは残らない。
+    送信を諦めたエントリーはfailedディレクトリに移動して調査用に残す。
+    """
+
+    def __init__(self, outbox_dir: str) -> None:
+        """初期化.
+
+        Args:
+            outbox_dir: アウトボックスのディレクトリ
+        """
+        self.outbox_dir = Path(outbox_dir)
+        self.failed_dir = self.outbox_dir / "failed"
+        self.failed_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, entry: OutboxEntry) -> Path:
+        """エントリーのファイルパスを取得.
+
+        Args:
+            entry: 送信待ちエントリー
+
+        Returns:
+            ファイルパス
+        """
+        return self.outbox_dir / f"{entry.retry_key}.json"
+
+    def save(self, entry: OutboxEntry) -> None:
+        """エントリーを保存（既存の場合は上書き）.
+
+        Args:
+            entry: 送信待ちエントリー
+
+        Raises:
+            OSError: 書き込みに失敗した場合
+        """
+        path = self._path(entry)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(entry.model_dump_json(indent=2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def remove(self, entry: OutboxEntry) -> None:
+        """送信済みのエントリーを削除.
+
+        Args:
+            entry: 送信待ちエントリー
+        """
+        self._path(entry).unlink(missing_ok=True)
+
+    def move_to_failed(self, entry: OutboxEntry) -> None:
+        """送信を諦めたエントリーをfailedディレクトリに移動.
+
+        Args:
+            entry: 送信待ちエントリー
+        """
+        self.save(entry)
+        os.replace(self._path(entry), self.failed_dir / self._path(entry).name)
+
+    def list_entries(self) -> List[OutboxEntry]:
+        """送信待ちのエントリーを作成日時の古い順に取得.
+
+        Returns:
+            送信待ちエントリーのリスト
+        """
+        entries = []
+        for path in self.outbox_dir.glob("*.json"):
+            try:
+                entries.append(OutboxEntry.model_validate_json(path.read_text(encoding="utf-8")))
+            except (OSError, ValidationError) as e:
+                logger.warning(f"アウトボックスのエントリーを読み込めません: {path} - {e}")
+        return sorted(entries, key=lambda entry: entry.created_at)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""送信メッセージ数（通数）の利用実績を管理するモジュール."""
+
+import json
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict
+
+from src.utils.date_helper import JST
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class QuotaManager:
+    """チャンネルごと・日ごと（JST）の送信メッセージ数を永続化するマネージャー.
+
+    LINEの無料メッセージ通数は送信先の人数で数えるため、1リクエストに
+    複数のメッセージを含めても送信先1人につき1通として記録する。
+    """
+
+    # 保持する日別実績の日数（前月分の予測にも使えるよう2か月分）
+    RETENTION_DAYS = 62
+
+    def __init__(self, quota_file: str) -> None:
+        """初期化.
+
+        Args:
+            quota_file: 利用実績ファイルのパス
+        """
+        self.quota_file = Path(quota_file)
+        self.quota_file.parent.mkdir(parents=True, exist_ok=True)
+        self._usage: Dict[str, Dict[str, int]] = self._load_usage()
+        self._lock = threading.Lock()
+
+    def _load_usage(self) -> Dict[str, Dict[str, int]]:
+        """利用実績ファイルから読み込み.
+
+        Returns:
+            チャンネル名 -> 日付（YYYY-MM-DD） -> 送信数の辞書
+        """
+        if not self.quota_file.exists():
+            logger.info(f"メッセージ利用実績ファイルが存在しないため新規作成します: {self.quota_file}")
+            return {}
+
+        try:
+            with open(self.quota_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data.get("usage", {})
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"メッセージ利用実績ファイルの読み込みに失敗しました: {e}")
+            return {}
+
+    def _save_usage(self) -> None:
+        """利用実績ファイルに保存."""
+        try:
+            with open(self.quota_file, "w", encoding="utf-8") as f:
+                json.dump({"usage": self._usage}, f, ensure_ascii=False, indent=2)
+        except IOError as e:
+            logger.error(f"メッセージ利用実績ファイルの保存に失敗しました: {e}")
+
+    def record(self, channel: str, count: int, sent_at: datetime) -> None:
+        """送信したメッセージ数を記録.
+
+        Args:
+            channel: チャンネル名
+            count: 送信したメッセージ数（送信先の人数）
+            sent_at: 送信日時（タイムゾーン情報付き）
+        """
+        if count <= 0:
+            return
+
+        sent_on = sent_at.astimezone(JST).date()
+        oldest = (sent_on - timedelta(days=self.RETENTION_DAYS)).isoformat()
+        with self._lock:
+            daily = self._usage.setdefault(channel, {})
+            daily[sent_on.isoformat()] = daily.get(sent_on.isoformat(), 0) + count
+            for day in [day for day in daily if day < oldest]:
+                del daily[day]
+            self._save_usage()
+        logger.debug(f"メッセージ送信数を記録: channel={channel}, count={count}")
+
+    def get_daily_usage(self, channel: str, day: date) -> int:
+        """指定日（JST）の送信メッセージ数を取得.
+
+        Args:
+            channel: チャンネル名
+            day: 日付
+
+        Returns:
+            送信メッセージ数
+        """
+        with self._lock:
+            return self._usage.get(channel, {}).get(day.isoformat(), 0)
+
+    def get_monthly_usage(self, channel: str, day: date) -> int:
+        """指定日を含む月（JST）の送信メッセージ数を取得.
+
+        Args:
+            channel: チャンネル名
+            day: 月内の日付
+
+        Returns:
+            月初から指定日までの送信メッセージ数
+        """
+        month_prefix = day.strftime("%Y-%m-")
+        with self._lock:
+            return sum(
+                count
+                for key, count in self._usage.get(channel, {}).items()
+                if key.startswith(month_prefix) and key <= day.isoformat()
+            )
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""外部APIへのリクエスト頻度をホストごとに制御するレートリミッター."""
+
+import random
+import threading
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateLimitError(Exception):
+    """外部APIからレート制限（HTTP 429）を受けたことを表す例外."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        """初期化.
+
+        Args:
+            message: エラーメッセージ
+            retry_after: 待機すべき秒数（不明な場合はNone）
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """トークンバケット方式のレート制御.
+
+    rate（トークン/秒）でトークンが補充され、最大capacity個まで蓄えられる。
+    1リクエストにつき1トークンを消費し、不足している場合は補充を待つ。
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化.
+
+        Args:
+            rate: 1秒あたりのトークン補充数
+            capacity: バケットの容量（バースト可能なリクエスト数）
+            clock: 現在時刻（秒）を返す関数
+
+        Raises:
+            ValueError: rateまたはcapacityが0以下の場合
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rateとcapacityは正の値である必要があります")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """トークンを1つ予約し、使用可能になるまでの待ち時間を返す.
+
+        Returns:
+            待ち時間（秒）。0なら即時に使用可能
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+            # トークンを前借りし、不足分は補充にかかる時間だけ待つ
+            self._tokens -= 1.0
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._blocked_until - now)
+
+    def block_for(self, seconds: float) -> None:
+        """指定時間リクエストを停止する（Retry-Afterの反映）.
+
+        Args:
+            seconds: 停止する秒数
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+
+class RateLimiter:
+    """ホストごとのトークンバケットを管理する共有レートリミッター.
+
+    設定の無いホストへのリクエストは制限しない（Retry-Afterのみ反映する）。
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        jitter: float = 0.1,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """初期化.
+
+        Args:
+            limits: ホスト名 -> (1秒あたりのリクエスト数, バースト数) の辞書
+            jitter: 待機時に加える乱数の最大値（秒）。同時刻に集中するのを避ける
+            sleep: 待機に使う関数
+        """
+        self.jitter = jitter
+        self._sleep = sleep
+        self._buckets: Dict[str, TokenBucket] = {
+            host: TokenBucket(rate=rate, capacity=capacity)
+            for host, (rate, capacity) in (limits or {}).items()
+        }
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: str, jitter: float = 0.1) -> "RateLimiter":
+        """設定文字列からレートリミッターを生成.
+
+        Args:
+            config: 「ホスト=リクエスト数/秒:バースト数」をカンマ区切りで並べた文字列
+                （例: "news.google.com=1:3,api.line.me=10:10"）
+            jitter: 待機時に加える乱数の最大値（秒）
+
+        Returns:
+            RateLimiter
+
+        Raises:
+            ValueError: 設定文字列の形式が不正な場合
+        """
+        limits: Dict[str, Tuple[float, float]] = {}
+        for item in config.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            try:
+                host, spec = item.split("=", 1)
+                rate, _, capacity = spec.partition(":")
+                limits[host.strip()] = (float(rate), float(capacity or 1))
+            except ValueError as e:
+                raise ValueError(f"レート制限の設定が不正です: {item}") from e
+        return cls(limits=limits, jitter=jitter)
+
+    def _get_bucket(self, host: str) -> Optional[TokenBucket]:
+        """ホストのトークンバケットを取得.
+
+        Args:
+            host: ホスト名
+
+        Returns:
+            トークンバケット、制限が設定されていない場合はNone
+        """
+        with self._lock:
+            return self._buckets.get(host)
+
+    def acquire(self, host: str) -> float:
+        """ホストへのリクエスト枠を取得（必要なら待機する）.
+
+        Args:
+            host: ホスト名またはURL
+
+        Returns:
+            待機した時間（秒）
+        """
+        host = self.get_host(host)
+        bucket = self._get_bucket(host)
+        if bucket is None:
+            return 0.0
+
+        wait = bucket.reserve()
+        if wait > 0:
+            wait += random.uniform(0, self.jitter)
+            logger.debug(f"レート制限により待機: host={host}, wait={wait:.2f}秒")
+            self._sleep(wait)
+        return wait
+
+    def register_retry_after(self, host: str, seconds: Optional[float]) -> None:
+        """429応答などのRetry-Afterをホストの制限に反映.
+
+        Args:
+            host: ホスト名またはURL
+            seconds: 待機すべき秒数（不明な場合はNone。既定で1秒待つ）
+        """
+        host = self.get_host(host)
+        seconds = 1.0 if seconds is None else seconds
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                # 制限未設定のホストも、Retry-Afterの間は止めるためにバケットを作る
+                bucket = TokenBucket(rate=1000.0, capacity=1000.0)
+                self._buckets[host] = bucket
+        bucket.block_for(seconds)
+        logger.warning(f"Retry-Afterを反映: host={host}, wait={seconds:.1f}秒")
+
+    @staticmethod
+    def get_host(url_or_host: str) -> str:
+        """URLからホスト名を取り出す.
+
+        Args:
+            url_or_host: URLまたはホスト名
+
+        Returns:
+            ホスト名
+        """
+        if "://" not in url_or_host:
+            return url_or_host
+        return urlparse(url_or_host).hostname or url_or_host
+
+
+def parse_retry_after(headers: Optional[Any]) -> Optional[float]:
+    """HTTPレスポンスヘッダーからRetry-Afterの秒数を取得.
+
+    Args:
+        headers: レスポンスヘッダー（大文字小文字を区別しないマッピングなど）
+
+    Returns:
+        待機すべき秒数、ヘッダーが無いか解釈できない場合はNone
+    """
+    if not headers:
+        return None
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(str(value))
+        return max((retry_at - datetime.now(retry_at.tzinfo)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""外部サービス呼び出しのリトライとサーキットブレーカーを提供するモジュール."""
+
+import random
+import smtplib
+import socket
+import threading
+import time
+import urllib.error
+from typing import Callable, Optional, TypeVar
+
+import httpx
+import requests
+
+from src.infrastructure.rate_limiter import RateLimitError
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# 接続の失敗・切断・タイムアウトを表す例外（PermissionErrorなど他のOSErrorは含めない）
+# URLErrorはfeedparser（urllib）、httpx.TransportErrorはGeminiのSDKの通信エラー
+_NETWORK_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    socket.gaierror,
+    smtplib.SMTPServerDisconnected,
+    urllib.error.URLError,
+    httpx.TransportError,
+)
+
+
+class CircuitOpenError(Exception):
+    """サーキットブレーカーが開いているため呼び出しを行わなかったことを表す例外."""
+
+
+class ServiceError(Exception):
+    """依存サービスがHTTPのエラーステータスを返したことを表す例外.
+
+    例外を送出しないライブラリ（feedparserなど）の応答を、リトライ・
+    サーキットブレーカーで扱えるよう変換するために使う。
+    """
+
+    def __init__(self, message: str, status: int) -> None:
+        """初期化.
+
+        Args:
+            message: エラーメッセージ
+            status: HTTPステータスコード
+        """
+        super().__init__(message)
+        self.status = status
+
+
+def is_transient_error(error: Exception) -> bool:
+    """一時的な障害（リトライで回復しうるエラー）かどうか判定.
+
+    レート制限、接続エラー・タイムアウト、HTTP 5xx/429を一時的な障害とみなす。
+    HTTP 4xxや入力不正、ファイルの権限エラーなどは、リトライしても結果が
+    変わらないため対象外。
+
+    Args:
+        error: 発生した例外
+
+    Returns:
+        一時的な障害の場合True
+    """
+    if isinstance(error, RateLimitError):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+
+    # 各SDKの例外はstatus/code属性にHTTPステータスを持つ
+    for attribute in ("status", "code", "status_code"):
+        status = getattr(error, attribute, None)
+        if isinstance(status, int):
+            return status == 429 or status >= 500
+
+    return isinstance(error, _NETWORK_ERRORS)
+
+
+class RetryPolicy:
+    """指数バックオフ（フルジッター）によるリトライ方針."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        retry_on: Callable[[Exception], bool] = is_transient_error,
+    ) -> None:
+        """初期化.
+
+        Args:
+            max_attempts: 最大試行回数（初回を含む）
+            base_delay: バックオフの基準待機時間（秒）
+            max_delay: 1回あたりの最大待機時間（秒）
+            retry_on: リトライ対象のエラーの場合にTrueを返す関数
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+
+    def get_delay(self, attempt: int, error: Exception) -> float:
+        """次の試行までの待機時間を算出.
+
+        Args:
+            attempt: 失敗した試行の回数（1始まり）
+            error: 発生した例外
+
+        Returns:
+            待機時間（秒）。Retry-Afterが分かる場合はそれ以上待つ
+        """
+        backoff = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = random.uniform(0, backoff)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+class CircuitBreaker:
+    """依存サービスごとのサーキットブレーカー.
+
+    連続失敗がfailure_thresholdに達すると開いた状態（open）になり、
+    recovery_timeoutの間は呼び出しを行わず即座に失敗させる。
+    経過後は半開状態（half_open）で1件だけ試行し、成功すれば閉じる。
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化.
+
+        Args:
+            name: 依存サービスの名前（ログ用）
+            failure_threshold: 開いた状態にする連続失敗回数
+            recovery_timeout: 開いた状態を維持する時間（秒）
+            clock: 現在時刻（秒）を返す関数
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failure_count = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """現在の状態を取得.
+
+        Returns:
+            closed / open / half_open のいずれか
+        """
+        with self._lock:
+            return self._state
+
+    def before_call(self) -> None:
+        """呼び出し前に状態を確認.
+
+        Raises:
+            CircuitOpenError: 開いた状態、または半開状態で試行中の呼び出しがある場合
+        """
+        with self._lock:
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.recovery_timeout:
+                    raise CircuitOpenError(
+                        f"サーキットブレーカーが開いています: {self.name}"
+                    )
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+                logger.info(f"サーキットブレーカーを半開状態に移行: {self.name}")
+
+            if self._state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    raise CircuitOpenError(
+                        f"サーキットブレーカーの試行中です: {self.name}"
+                    )
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """呼び出しの成功を記録."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"サーキットブレーカーを閉じました: {self.name}")
+            self._state = self.CLOSED
+            self._failure_count = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """呼び出しの失敗を記録."""
+        with self._lock:
+            self._failure_count += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or (
+                self._failure_count >= self.failure_threshold
+            ):
+                if self._state != self.OPEN:
+                    logger.warning(
+                        f"サーキットブレーカーを開きました: {self.name} "
+                        f"(連続失敗={self._failure_count}回)"
+                    )
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+
+class Resilience:
+    """リトライとサーキットブレーカーを組み合わせた呼び出しラッパー."""
+
+    def __init__(
+        self,
+        circuit_breaker: CircuitBreaker,
+        retry_policy: Optional[RetryPolicy] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """初期化.
+
+        Args:
+            circuit_breaker: 依存サービスのサーキットブレーカー
+            retry_policy: リトライ方針（省略時はデフォルト設定）
+            sleep: 待機に使う関数
+        """
+        self.circuit_breaker = circuit_breaker
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._sleep = sleep
+
+    def call(self, func: Callable[[], T]) -> T:
+        """リトライとサーキットブレーカーを適用して関数を呼び出す.
+
+        サーキットブレーカーには、リトライを含めた1回の呼び出しの結果を1回分として
+        記録する（リトライ中の失敗を個別に数えない）。
+
+        Args:
+            func: 呼び出す関数
+
+        Returns:
+            関数の戻り値
+
+        Raises:
+            CircuitOpenError: サーキットブレーカーが開いている場合
+            Exception: リトライ対象外のエラー、またはリトライ上限に達した場合
+        """
+        name = self.circuit_breaker.name
+        self.circuit_breaker.before_call()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result = func()
+            except Exception as e:
+                if not is_transient_error(e):
+                    # サービス自体は応答しているため障害として数えない
+                    self.circuit_breaker.record_success()
+                    raise
+                if not self.retry_policy.retry_on(e):
+                    self.circuit_breaker.record_failure()
+                    raise
+                if attempt >= self.retry_policy.max_attempts:
+                    logger.error(f"リトライ上限に達しました: {name} ({attempt}回) - {e}")
+                    self.circuit_breaker.record_failure()
+                    raise
+                delay = self.retry_policy.get_delay(attempt, e)
+                logger.warning(
+                    f"一時的なエラーのためリトライ: {name} "
+                    f"({attempt}/{self.retry_policy.max_attempts}回目, "
+                    f"wait={delay:.2f}秒) - {e}"
+                )
+                self._sleep(delay)
+            else:
+                self.circuit_breaker.record_success()
+                return result
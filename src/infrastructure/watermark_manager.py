@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""通知先ごとの最終正常実行時刻（ウォーターマーク）を管理するモジュール."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class WatermarkManager:
+    """通知先ごとのウォーターマークを永続化するマネージャー."""
+
+    def __init__(self, watermark_file: str) -> None:
+        """初期化.
+
+        Args:
+            watermark_file: ウォーターマークファイルのパス
+        """
+        self.watermark_file = Path(watermark_file)
+        self.watermark_file.parent.mkdir(parents=True, exist_ok=True)
+        self._watermarks: Dict[str, datetime] = self._load_watermarks()
+
+    def _load_watermarks(self) -> Dict[str, datetime]:
+        """ウォーターマークファイルから読み込み.
+
+        Returns:
+            通知先名 -> ウォーターマークの辞書
+        """
+        if not self.watermark_file.exists():
+            logger.info(
+                f"ウォーターマークファイルが存在しないため新規作成します: {self.watermark_file}"
+            )
+            return {}
+
+        try:
+            with open(self.watermark_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            watermarks = {
+                name: datetime.fromisoformat(value)
+                for name, value in data.get("watermarks", {}).items()
+            }
+            logger.info(f"ウォーターマークを読み込みました: {len(watermarks)}件")
+            return watermarks
+        except (json.JSONDecodeError, IOError, ValueError) as e:
+            logger.warning(f"ウォーターマークファイルの読み込みに失敗しました: {e}")
+            return {}
+
+    def _save_watermarks(self) -> None:
+        """ウォーターマークファイルに保存."""
+        try:
+            with open(self.watermark_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "watermarks": {
+                            name: value.isoformat()
+                            for name, value in self._watermarks.items()
+                        }
+                    },
+                    f,
+                    ensure_ascii=False,
+                    indent=2,
+                )
+            logger.debug(f"ウォーターマークを保存しました: {len(self._watermarks)}件")
+        except IOError as e:
+            logger.error(f"ウォーターマークファイルの保存に失敗しました: {e}")
+
+    def get_watermark(self, target_name: str) -> Optional[datetime]:
+        """通知先のウォーターマークを取得.
+
+        Args:
+            target_name: 通知先の名前
+
+        Returns:
+            最終正常実行時刻、未実行の場合はNone
+        """
+        return self._watermarks.get(target_name)
+
+    def update_watermark(self, target_name: str, run_started_at: datetime) -> None:
+        """通知先のウォーターマークを更新.
+
+        Args:
+            target_name: 通知先の名前
+            run_started_at: 正常終了した実行の開始時刻（タイムゾーン情報付き）
+        """
+        self._watermarks[target_name] = run_started_at
+        self._save_watermarks()
+        logger.info(f"ウォーターマークを更新: target={target_name}, at={run_started_at}")
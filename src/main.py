@@ -2,46 +2,346 @@
 """ニュース収集・要約・LINE通知システムのメインエントリーポイント."""
 
 import sys
-
-import yaml
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
 
 from config.settings import settings
+from src.business.article_enricher import ArticleEnricher
+from src.business.bm25_scorer import BM25Scorer
+from src.business.channel_factory import NotificationChannelFactory
+from src.business.delivery_scheduler import DeliveryScheduler
+from src.business.digest_scheduler import DigestScheduler
+from src.business.duplicate_detector import DuplicateDetector
 from src.business.news_analyzer import NewsAnalyzer
 from src.business.news_collector import NewsCollector
 from src.business.notifier import Notifier
+from src.business.outbox_dispatcher import OutboxDispatcher
+from src.business.polling_scheduler import PollingScheduler
 from src.business.summarizer import Summarizer
+from src.infrastructure.article_cache_manager import ArticleCacheManager
+from src.infrastructure.article_fetcher import ArticleFetcher
+from src.infrastructure.article_store import ArticleStore, DeliveryStatus
 from src.infrastructure.cache_manager import CacheManager
+from src.infrastructure.corpus_stats_manager import CorpusStatsManager
+from src.infrastructure.digest_buffer_manager import DigestBufferManager
 from src.infrastructure.google_news_client import GoogleNewsClient
+from src.infrastructure.keyword_config_loader import KeywordConfigLoader
+from src.infrastructure.keyword_stats_manager import KeywordStatsManager
 from src.infrastructure.line_client import LineClient
 from src.infrastructure.llm_client import LLMClientFactory
-from src.models.keyword_config import KeywordConfig
+from src.infrastructure.notification_channel import NotificationChannel
+from src.infrastructure.outbox_manager import OutboxManager
+from src.infrastructure.quota_manager import QuotaManager
+from src.infrastructure.rate_limiter import RateLimiter
+from src.infrastructure.resilience import CircuitBreaker, Resilience, RetryPolicy
+from src.infrastructure.watermark_manager import WatermarkManager
+from src.models.delivery_plan import DeliveryDecision
+from src.models.keyword_config import KeywordConfig, NotificationTarget
+from src.models.news_article import NewsArticle
+from src.models.outbox_entry import OutboxEntry
+from src.utils.date_helper import get_today_start_jst
 from src.utils.logger import get_logger, setup_logger
 
 setup_logger("", log_file=settings.LOG_FILE, log_level=settings.LOG_LEVEL)
 logger = get_logger(__name__)
 
 
-def load_keyword_config() -> KeywordConfig:
-    """キーワード設定ファイルを読み込み.
+def get_shared_keywords(keyword_config: KeywordConfig) -> Set[str]:
+    """複数の通知先が設定しているキーワードを取得.
+
+    Args:
+        keyword_config: キーワード設定
+
+    Returns:
+        2件以上の通知先が設定しているキーワードの集合
+    """
+    return {
+        keyword
+        for keyword in keyword_config.get_all_keywords()
+        if len(keyword_config.get_targets_by_keyword(keyword)) > 1
+    }
+
+
+def get_collection_window_start(watermark: Optional[datetime]) -> datetime:
+    """ウォーターマークから収集期間の開始時刻を算出.
+
+    Google Newsへの反映遅延を考慮し、ウォーターマークから一定時間さかのぼる。
+    重複して取得した記事は通知済みキャッシュで除外される。
+
+    Args:
+        watermark: 通知先の最終正常実行時刻（未実行の場合はNone）
+
+    Returns:
+        収集期間の開始時刻（未実行の場合は当日0時JST）
+    """
+    if watermark is None:
+        return get_today_start_jst()
+    return watermark - timedelta(minutes=settings.WATERMARK_OVERLAP_MINUTES)
+
+
+def process_target(
+    target: NotificationTarget,
+    watermark: Optional[datetime],
+    run_started_at: datetime,
+    news_collector: NewsCollector,
+    polling_scheduler: PollingScheduler,
+    news_analyzer: NewsAnalyzer,
+    duplicate_detector: DuplicateDetector,
+    rate_limiter: RateLimiter,
+    llm_resiliences: Dict[str, Resilience],
+    article_enricher: ArticleEnricher,
+    article_store: ArticleStore,
+    shared_keywords: Set[str],
+) -> List[NewsArticle]:
+    """1件の通知先について収集から要約までを実行.
+
+    Args:
+        target: 通知先
+        watermark: 通知先の最終正常実行時刻（未実行の場合はNone）
+        run_started_at: 今回の実行の開始時刻（収集期間の終了時刻）
+        news_collector: ニュース収集
+        polling_scheduler: キーワード取得スケジューラー
+        news_analyzer: 関連性分析
+        duplicate_detector: 類似記事クラスタリング
+        rate_limiter: 外部APIのレートリミッター
+        llm_resiliences: LLMプロバイダーごとのリトライ・サーキットブレーカー
+        article_enricher: 記事本文の付与
+        article_store: 要約を保存・再利用する記事ストア
+        shared_keywords: 他の通知先と取得結果を共有するキーワード
 
     Returns:
-        キーワード設定
+        通知する要約済みの記事のリスト
 
     Raises:
-        Exception: 読み込みに失敗した場合
+        Exception: いずれかの処理に失敗した場合
     """
-    keywords_file_path = settings.get_absolute_path(settings.KEYWORDS_FILE)
-    logger.info(f"キーワード設定ファイルを読み込み: {keywords_file_path}")
+    # 要約の期限（通知先の処理開始から数える）
+    deadline = (
+        time.monotonic() + target.summary_deadline_seconds
+        if target.summary_deadline_seconds is not None
+        else None
+    )
+
+    # 1. 今回取得するキーワードを産出実績から選択
+    polled_keywords = polling_scheduler.select_keywords(target.name, target.keywords)
+    if not polled_keywords:
+        logger.info("今回取得するキーワードがありません")
+        return []
+
+    # スキップしていたキーワードは前回取得時点から収集する
+    since = watermark
+    last_polled_at = polling_scheduler.get_oldest_last_polled_at(
+        target.name, polled_keywords
+    )
+    if last_polled_at is not None and (since is None or last_polled_at < since):
+        since = last_polled_at
+
+    # 2. ニュース収集
+    window_start = get_collection_window_start(since)
+    articles = news_collector.collect_news(
+        polled_keywords,
+        window_start=window_start,
+        window_end=run_started_at,
+        shared_keywords=shared_keywords,
+    )
+    polling_scheduler.record_results(
+        target.name, polled_keywords, articles, polled_at=run_started_at, window_start=window_start
+    )
+
+    if not articles:
+        logger.info("新しいニュースがありません")
+        return []
+
+    # 3. 関連性分析
+    scored_articles = news_analyzer.score_relevance(
+        articles, target.keywords, scoring_method=target.scoring_method
+    )
+
+    # 4. 類似記事（同一ニュースの別配信元）を代表記事1件に集約
+    scored_articles = duplicate_detector.deduplicate(scored_articles)
+
+    # 5. LLMクライアントの作成
+    llm_client = LLMClientFactory.create(
+        provider=target.llm_provider,
+        api_key=settings.GEMINI_API_KEY,
+        api_url=settings.OLLAMA_API_URL,
+        model=settings.DEFAULT_LLM_MODEL,
+        rate_limiter=rate_limiter,
+        resilience=llm_resiliences.get(target.llm_provider),
+        use_context_cache=settings.GEMINI_CONTEXT_CACHE,
+    )
+    summarizer = Summarizer(
+        llm_client, max_input_tokens=settings.LLM_MAX_INPUT_TOKENS, article_store=article_store
+    )
 
+    # 6. 閾値・件数・トークン予算の範囲で上位記事を選択
+    selected_articles = news_analyzer.select_top_articles(
+        scored_articles,
+        max_articles=target.max_articles,
+        threshold=target.relevance_threshold,
+        token_budget=target.max_llm_tokens,
+        token_estimator=(
+            summarizer.estimate_max_request_tokens
+            if target.enrich_articles
+            else summarizer.estimate_request_tokens
+        ),
+    )
+
+    if not selected_articles:
+        logger.info("通知対象となる関連性の高いニュースがありません")
+        return []
+
+    # 7. 記事ページから本文を取得（オプション）
+    if target.enrich_articles:
+        selected_articles = article_enricher.enrich(selected_articles)
+
+    # 8. 要約生成（実際に通知する記事のみ。要約済みの記事は記事ストアの要約を再利用）
+    return summarizer.summarize_articles(selected_articles, deadline=deadline)
+
+
+def send_target_error_notification(
+    notifier: Notifier, target: NotificationTarget, error: Exception
+) -> None:
+    """通知先の処理エラーを通知先に送信.
+
+    Args:
+        notifier: 通知管理
+        target: 通知先
+        error: 発生したエラー
+    """
     try:
-        with open(keywords_file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            config = KeywordConfig(**data)
-            logger.info(f"通知先: {len(config.notification_targets)}件")
-            return config
-    except Exception as e:
-        logger.error(f"キーワード設定ファイルの読み込みに失敗: {e}")
-        raise
+        notifier.send_error_notification(
+            line_user_id=target.line_user_id,
+            error_message=f"通知先 '{target.name}' の処理中にエラーが発生しました。\n\n{str(error)}",
+        )
+    except Exception as notify_error:
+        logger.error(f"エラー通知の送信にも失敗: {notify_error}")
+
+
+def report_failed_outbox_entries(
+    outbox_dispatcher: OutboxDispatcher,
+    notifier: Notifier,
+    keyword_config: KeywordConfig,
+    article_store: ArticleStore,
+) -> None:
+    """アウトボックスで再送を諦めた通知を通知先に知らせる.
+
+    記事は通知済みとして記録されているため、記事ストアの配信状態をdroppedにし、
+    届かなかった記事の件数をエラー通知で送信する。
+
+    Args:
+        outbox_dispatcher: アウトボックスの送信
+        notifier: 通知管理
+        keyword_config: キーワード設定
+        article_store: 記事ストア
+    """
+    failures: Dict[str, List[OutboxEntry]] = {}
+    for entry in outbox_dispatcher.pop_failed_entries():
+        for target_name in entry.target_names:
+            failures.setdefault(target_name, []).append(entry)
+
+    for target_name, entries in failures.items():
+        urls = [url for entry in entries for url in entry.article_urls]
+        article_store.record_deliveries(target_name, urls, "dropped")
+        target = keyword_config.get_target_by_name(target_name)
+        if target is None:
+            logger.warning(f"送信を中止した通知の通知先が見つかりません: {target_name}")
+            continue
+        send_target_error_notification(
+            notifier,
+            target,
+            RuntimeError(
+                f"ニュース{len(urls)}件の通知を送信できませんでした（{entries[-1].last_error}）"
+            ),
+        )
+
+
+# 送信しなかった判断と、記事ストアに記録する配信状態の対応
+DELIVERY_STATUS_BY_ACTION: Dict[str, DeliveryStatus] = {"defer": "deferred", "drop": "dropped"}
+
+
+def record_unsent_decisions(article_store: ArticleStore, decisions: List[DeliveryDecision]) -> None:
+    """後回し・破棄した記事の配信状態を記事ストアに記録.
+
+    送信した記事は、送信が完了した時点でsentとして記録する。
+
+    Args:
+        article_store: 記事ストア
+        decisions: 通知先ごとの送信判断のリスト
+    """
+    for decision in decisions:
+        status = DELIVERY_STATUS_BY_ACTION.get(decision.action)
+        if status is not None:
+            article_store.record_deliveries(
+                decision.target_name,
+                [article.get_url_string() for article in decision.articles],
+                status,
+            )
+
+
+def queue_target_notifications(
+    notifier: Notifier,
+    digest_scheduler: DigestScheduler,
+    target: NotificationTarget,
+    articles: List[NewsArticle],
+    channels: List[NotificationChannel],
+) -> None:
+    """通知先の通知を送信待ちに追加し、前回チャンネルで送信できなかった記事を合わせて再送.
+
+    前回一部のチャンネルだけが失敗した記事は、そのチャンネルにだけ今回の記事と
+    まとめて送信する。
+
+    Args:
+        notifier: 通知管理
+        digest_scheduler: ダイジェストスケジューラー（チャンネルごとの再送記事を保持）
+        target: 通知先
+        articles: 今回送信する記事のリスト
+        channels: 通知先の通知チャンネルのリスト
+    """
+    shared_channels = []
+    for channel in channels:
+        held = digest_scheduler.get_held(target, channel.name)
+        if not held:
+            shared_channels.append(channel)
+            continue
+        held_urls = {article.get_url_string() for article in held}
+        logger.info(f"チャンネルに再送する記事を追加: channel={channel.name}, {len(held)}件")
+        notifier.queue_notification(
+            target_name=target.name,
+            line_user_id=target.line_user_id,
+            articles=held + [a for a in articles if a.get_url_string() not in held_urls],
+            channels=[channel],
+        )
+    if shared_channels:
+        notifier.queue_notification(
+            target_name=target.name,
+            line_user_id=target.line_user_id,
+            articles=articles,
+            channels=shared_channels,
+        )
+
+
+def create_resilience(
+    name: str, retry_policy: Optional[RetryPolicy] = None
+) -> Resilience:
+    """依存サービスごとのリトライ・サーキットブレーカーを作成.
+
+    Args:
+        name: 依存サービスの名前
+        retry_policy: リトライ方針（省略時は設定値の試行回数で一時的な障害をリトライ）
+
+    Returns:
+        Resilience
+    """
+    return Resilience(
+        circuit_breaker=CircuitBreaker(
+            name,
+            failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_SECONDS,
+        ),
+        retry_policy=retry_policy or RetryPolicy(max_attempts=settings.RETRY_MAX_ATTEMPTS),
+    )
 
 
 def main() -> None:
@@ -56,75 +356,212 @@ def main() -> None:
         settings.validate()
         logger.info("設定検証完了")
 
-        # キーワード設定の読み込み
-        keyword_config = load_keyword_config()
+        # キーワード設定の読み込み（実行中に変更された場合は次の通知先から反映する）
+        config_loader = KeywordConfigLoader(str(settings.get_absolute_path(settings.KEYWORDS_FILE)))
+        keyword_config = config_loader.get_config()
 
-        # インフラ層の初期化
-        google_news_client = GoogleNewsClient()
+        # インフラ層の初期化（外部APIのレート制限は全クライアントで共有）
+        rate_limiter = RateLimiter.from_config(
+            settings.RATE_LIMITS, jitter=settings.RATE_LIMIT_JITTER
+        )
+        google_news_client = GoogleNewsClient(
+            rate_limiter=rate_limiter, resilience=create_resilience("google_news")
+        )
         cache_manager = CacheManager(
             cache_file=str(settings.get_absolute_path(settings.CACHE_FILE))
         )
-        line_client = LineClient(channel_access_token=settings.LINE_CHANNEL_ACCESS_TOKEN)
+        # LINEの送信はリトライキーで冪等になるため、一時的な障害はすべてリトライする
+        quota_manager = QuotaManager(
+            quota_file=str(settings.get_absolute_path(settings.QUOTA_FILE))
+        )
+        line_client = LineClient(
+            channel_access_token=settings.LINE_CHANNEL_ACCESS_TOKEN,
+            rate_limiter=rate_limiter,
+            resilience=create_resilience("line"),
+            quota_manager=quota_manager,
+        )
+        llm_resiliences = {
+            provider: create_resilience(provider) for provider in ("gemini", "ollama")
+        }
+        watermark_manager = WatermarkManager(
+            watermark_file=str(settings.get_absolute_path(settings.WATERMARK_FILE))
+        )
 
         # ビジネスロジック層の初期化
         news_collector = NewsCollector(google_news_client, cache_manager)
-        news_analyzer = NewsAnalyzer()
+        polling_scheduler = PollingScheduler(
+            KeywordStatsManager(
+                stats_file=str(settings.get_absolute_path(settings.KEYWORD_STATS_FILE))
+            ),
+            max_interval=settings.POLLING_MAX_INTERVAL_RUNS,
+        )
+        corpus_stats = CorpusStatsManager(
+            stats_file=str(settings.get_absolute_path(settings.CORPUS_STATS_FILE))
+        )
+        news_analyzer = NewsAnalyzer(bm25_scorer=BM25Scorer(corpus_stats))
+        duplicate_detector = DuplicateDetector()
+        article_enricher = ArticleEnricher(
+            ArticleFetcher(
+                ArticleCacheManager(
+                    cache_file=str(settings.get_absolute_path(settings.ARTICLE_CACHE_FILE)),
+                    ttl_hours=settings.ARTICLE_CACHE_TTL_HOURS,
+                    failure_ttl_hours=settings.ARTICLE_FETCH_FAILURE_TTL_HOURS,
+                ),
+                max_workers=settings.ARTICLE_FETCH_MAX_WORKERS,
+                timeout=settings.ARTICLE_FETCH_TIMEOUT_SECONDS,
+                rate_limiter=rate_limiter,
+            )
+        )
+
+        outbox_dispatcher = OutboxDispatcher(
+            line_client,
+            OutboxManager(outbox_dir=str(settings.get_absolute_path(settings.OUTBOX_DIR))),
+            base_delay=settings.OUTBOX_RETRY_BASE_SECONDS,
+            max_age_hours=settings.OUTBOX_MAX_AGE_HOURS,
+        )
+        notifier = Notifier(line_client, cache_manager, outbox_dispatcher=outbox_dispatcher)
+        channel_factory = NotificationChannelFactory(
+            notifier.line_channel,
+            resiliences={
+                channel_type: create_resilience(channel_type)
+                for channel_type in ("slack", "email", "webhook")
+            },
+            smtp_host=settings.SMTP_HOST,
+            smtp_port=settings.SMTP_PORT,
+            smtp_sender=settings.SMTP_SENDER,
+            smtp_username=settings.SMTP_USERNAME,
+            smtp_password=settings.SMTP_PASSWORD,
+            smtp_use_tls=settings.SMTP_USE_TLS,
+        )
+        digest_scheduler = DigestScheduler(
+            DigestBufferManager(
+                buffer_file=str(settings.get_absolute_path(settings.DIGEST_BUFFER_FILE))
+            )
+        )
+
+        delivery_scheduler = DeliveryScheduler(
+            quota_manager,
+            monthly_quota=settings.LINE_MONTHLY_MESSAGE_QUOTA,
+            max_deferred_articles=settings.DELIVERY_DEFER_MAX_ARTICLES,
+        )
+
+        # 要約済みの記事と配信状態を保存する記事ストア（要約の再利用・Webhookサーバーの検索に使用）
+        article_store = ArticleStore(
+            db_file=str(settings.get_absolute_path(settings.ARTICLE_STORE_FILE))
+        )
+        article_store.purge(
+            datetime.now(timezone.utc) - timedelta(days=settings.ARTICLE_STORE_RETENTION_DAYS)
+        )
+
+        # 前回までの実行で送信できなかった通知を先に再送
+        outbox_dispatcher.dispatch_due()
+        report_failed_outbox_entries(outbox_dispatcher, notifier, keyword_config, article_store)
+
+        # 実行の開始時刻（収集期間の上限・ウォーターマークとして使用）
+        run_started_at = datetime.now(timezone.utc)
 
         # 各通知先ごとに処理
-        for target in keyword_config.notification_targets:
+        processed_targets = []
+        candidates = []
+        channels_by_name: Dict[str, List[NotificationChannel]] = {}
+        for target_name in [target.name for target in keyword_config.notification_targets]:
+            keyword_config = config_loader.get_config()
+            target = keyword_config.get_target_by_name(target_name)
+            if target is None:
+                logger.info(f"キーワード設定から削除された通知先をスキップ: {target_name}")
+                continue
             logger.info(f"\n{'=' * 60}")
             logger.info(f"通知先処理開始: {target.name}")
             logger.info(f"{'=' * 60}")
 
             try:
-                # 1. ニュース収集
-                articles = news_collector.collect_news(target.keywords)
-
-                if not articles:
-                    logger.info("新しいニュースがありません")
-                    continue
+                # チャンネル設定の誤り（SMTP未設定など）は収集・要約の前に検出する
+                channels_by_name[target.name] = channel_factory.create_for_target(target)
 
-                # 2. 関連性分析
-                analyzed_articles = news_analyzer.analyze_relevance(
-                    articles, target.keywords
+                articles = process_target(
+                    target=target,
+                    watermark=watermark_manager.get_watermark(target.name),
+                    run_started_at=run_started_at,
+                    news_collector=news_collector,
+                    polling_scheduler=polling_scheduler,
+                    news_analyzer=news_analyzer,
+                    duplicate_detector=duplicate_detector,
+                    rate_limiter=rate_limiter,
+                    llm_resiliences=llm_resiliences,
+                    article_enricher=article_enricher,
+                    article_store=article_store,
+                    shared_keywords=get_shared_keywords(keyword_config),
                 )
 
-                # 10件に制限（開発用）
-                analyzed_articles = analyzed_articles[:10]
+                # ダイジェストモードでは送信するタイミングまで記事を蓄積する
+                if target.is_digest_mode():
+                    articles = digest_scheduler.collect(target, articles, run_started_at)
+                else:
+                    articles = digest_scheduler.merge_deferred(target, articles)
+                candidates.append((target, articles))
+                processed_targets.append(target)
 
-                # 3. LLMクライアントの作成
-                llm_client = LLMClientFactory.create(
-                    provider=target.llm_provider,
-                    api_key=settings.GEMINI_API_KEY,
-                    api_url=settings.OLLAMA_API_URL,
-                    model=settings.DEFAULT_LLM_MODEL,
-                )
-                summarizer = Summarizer(llm_client)
-
-                # 4. 要約生成
-                summarized_articles = summarizer.summarize_articles(analyzed_articles)
+            except Exception as e:
+                logger.error(f"通知先 '{target.name}' の処理中にエラー発生: {e}")
+                send_target_error_notification(notifier, target, e)
 
-                # 5. 通知
-                notifier = Notifier(line_client, cache_manager)
-                notifier.send_notification(
-                    target_name=target.name,
-                    line_user_id=target.line_user_id,
-                    articles=summarized_articles,
+        # メッセージ通数の残りから、通知先ごとに送信・後回し・破棄を判断する
+        targets_by_name = {target.name: target for target in processed_targets}
+        decisions = delivery_scheduler.plan(candidates, run_started_at)
+        deferred_names = {d.target_name for d in decisions if d.action == "defer"}
+        sent_urls: Dict[str, List[str]] = {}
+        record_unsent_decisions(article_store, decisions)
+        articles_to_send: Dict[str, List[NewsArticle]] = {}
+        for decision in decisions:
+            target = targets_by_name[decision.target_name]
+            if decision.action == "send":
+                articles_to_send[target.name] = decision.articles
+                sent_urls.setdefault(target.name, []).extend(
+                    article.get_url_string() for article in decision.articles
                 )
+            elif decision.action == "defer":
+                digest_scheduler.defer(target, decision.articles, run_started_at)
+        # 全通知先の分をまとめ、チャンネルごとに並行して送信する
+        for target in processed_targets:
+            queue_target_notifications(
+                notifier,
+                digest_scheduler,
+                target,
+                articles_to_send.get(target.name, []),
+                channels_by_name[target.name],
+            )
+        # 送信・破棄した通知先は、送信完了後に蓄積・後回しの記事を削除する
+        released_names = {d.target_name for d in decisions} - deferred_names
 
+        # 同じ記事を受け取る通知先をまとめてアウトボックスに保存して送信し、
+        # いずれかのチャンネルで送信できた通知先を完了とする（送信に失敗した分は
+        # LINEはアウトボックスから、他のチャンネルは次回の実行で再送）
+        delivery_errors = notifier.flush()
+        for target in processed_targets:
+            error = delivery_errors.get(target.name)
+            if error is None:
+                article_store.record_deliveries(
+                    target.name, sent_urls.get(target.name, []), "sent"
+                )
+                watermark_manager.update_watermark(target.name, run_started_at)
+                if target.name in released_names:
+                    digest_scheduler.mark_flushed(target)
+                channel_failures = notifier.channel_failures.get(target.name, {})
+                for channel in channels_by_name[target.name]:
+                    if channel.name not in channel_failures:
+                        digest_scheduler.release_held(target, channel.name)
+                for channel_name, (undelivered, failure) in channel_failures.items():
+                    digest_scheduler.hold_for_channel(target, channel_name, undelivered, run_started_at)
+                    send_target_error_notification(notifier, target, failure)
                 logger.info(f"通知先処理完了: {target.name}")
+            else:
+                send_target_error_notification(notifier, target, error)
 
-            except Exception as e:
-                logger.error(f"通知先 '{target.name}' の処理中にエラー発生: {e}")
-                # エラー通知を送信
-                try:
-                    error_notifier = Notifier(line_client, cache_manager)
-                    error_notifier.send_error_notification(
-                        line_user_id=target.line_user_id,
-                        error_message=f"通知先 '{target.name}' の処理中にエラーが発生しました。\n\n{str(e)}",
-                    )
-                except Exception as notify_error:
-                    logger.error(f"エラー通知の送信にも失敗: {notify_error}")
+        outbox_dispatcher.drain(settings.OUTBOX_DRAIN_SECONDS)
+        report_failed_outbox_entries(
+            outbox_dispatcher, notifier, config_loader.get_config(), article_store
+        )
+        article_store.close()
 
         logger.info("\n" + "=" * 60)
         logger.info("ニュース収集・要約・LINE通知システム 正常終了")
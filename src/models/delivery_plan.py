@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""送信計画（メッセージ通数の見通しと通知先ごとの判断）のデータモデル."""
+
+from typing import List, Literal
+
+from pydantic import BaseModel, Field
+
+from .news_article import NewsArticle
+
+
+class QuotaForecast(BaseModel):
+    """当月のメッセージ通数の利用状況と見通しを表すモデル.
+
+    Attributes:
+        period: 対象月（YYYY-MM、JST）
+        monthly_quota: 月間の上限通数
+        used: 当月の送信済み通数
+        used_today: 本日の送信済み通数
+        remaining: 当月の残り通数
+        daily_budget: 残り通数を月末まで均等に使う場合の本日の目安通数
+        projected: 現在のペースで送信した場合の月末時点の予測通数
+    """
+
+    period: str = Field(..., description="対象月（YYYY-MM）")
+    monthly_quota: int = Field(..., ge=0, description="月間の上限通数")
+    used: int = Field(..., ge=0, description="当月の送信済み通数")
+    used_today: int = Field(..., ge=0, description="本日の送信済み通数")
+    remaining: int = Field(..., ge=0, description="当月の残り通数")
+    daily_budget: float = Field(..., ge=0.0, description="本日の目安通数")
+    projected: float = Field(..., ge=0.0, description="月末時点の予測通数")
+
+    def get_today_remaining(self) -> float:
+        """本日の目安通数のうち未使用の通数を取得.
+
+        Returns:
+            本日の残り目安通数
+        """
+        return max(0.0, self.daily_budget - self.used_today)
+
+
+class DeliveryDecision(BaseModel):
+    """通知先ごとの送信判断を表すモデル.
+
+    Attributes:
+        target_name: 通知先の名前
+        action: 今すぐ送信（send）、ダイジェストに回して後で送信（defer）、破棄（drop）
+        articles: 対象の記事のリスト
+        cost: 送信に必要な通数
+        reason: 判断の理由（ログ用）
+    """
+
+    target_name: str = Field(..., description="通知先の名前")
+    action: Literal["send", "defer", "drop"] = Field(..., description="送信判断")
+    articles: List[NewsArticle] = Field(default_factory=list, description="対象の記事")
+    cost: int = Field(default=0, ge=0, description="送信に必要な通数")
+    reason: str = Field(default="", description="判断の理由")
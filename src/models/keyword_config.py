@@ -1,9 +1,48 @@
 # -*- coding: utf-8 -*-
 """キーワード設定のデータモデル."""
 
-from typing import List, Literal
+import re
+from typing import Callable, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
+
+from src.utils.text_normalizer import normalize_text
+
+
+# ダイジェストの送信時刻（JSTのHH:MM）
+_DIGEST_TIME_PATTERN = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$")
+
+
+class ChannelConfig(BaseModel):
+    """通知チャンネルの設定を表すデータモデル.
+
+    Attributes:
+        type: チャンネルの種類（line / slack / email / webhook）
+        url: 送信先のURL（slackのIncoming Webhook、またはwebhookのURL）
+        to: 送信先のメールアドレスのリスト（email用）
+    """
+
+    type: Literal["line", "slack", "email", "webhook"] = Field(
+        ..., description="チャンネルの種類"
+    )
+    url: Optional[str] = Field(default=None, description="送信先のURL（slack / webhook）")
+    to: List[str] = Field(default_factory=list, description="送信先のメールアドレス（email）")
+
+    @model_validator(mode="after")
+    def _validate_destination(self) -> "ChannelConfig":
+        """チャンネルの種類に必要な送信先が指定されているか検証.
+
+        Returns:
+            検証済みの設定
+
+        Raises:
+            ValueError: 送信先が指定されていない場合
+        """
+        if self.type in ("slack", "webhook") and not self.url:
+            raise ValueError(f"{self.type}チャンネルにはurlを指定してください")
+        if self.type == "email" and not self.to:
+            raise ValueError("emailチャンネルにはtoを指定してください")
+        return self
 
 
 class NotificationTarget(BaseModel):
@@ -14,6 +53,16 @@ class NotificationTarget(BaseModel):
         line_user_id: LINE User ID
         keywords: 検索キーワードのリスト
         llm_provider: 使用するLLMプロバイダー（gemini または ollama）
+        scoring_method: 関連性スコアの算出方式（keyword または bm25）
+        relevance_threshold: 要約・通知対象とする関連性スコアの下限
+        max_articles: 1回の通知で送る記事数の上限
+        max_llm_tokens: 1回の実行で要約に使うLLMトークン数の上限（オプション）
+        summary_deadline_seconds: 処理開始から要約完了までの制限時間（秒、オプション）
+        enrich_articles: 要約前に記事ページから本文を取得するか
+        digest_times: ダイジェストを送信する時刻（JSTのHH:MM）のリスト
+        digest_max_articles: ダイジェストを送信する蓄積記事数（オプション）
+        priority: 送信の優先度（大きいほど優先。1以上は通数の目安を超えても送信）
+        channels: 通知チャンネルのリスト（省略時はLINEのみ）
     """
 
     name: str = Field(..., description="通知先の名前")
@@ -22,6 +71,69 @@ class NotificationTarget(BaseModel):
     llm_provider: Literal["gemini", "ollama"] = Field(
         default="gemini", description="LLMプロバイダー"
     )
+    scoring_method: Literal["keyword", "bm25"] = Field(
+        default="keyword", description="関連性スコアの算出方式"
+    )
+    relevance_threshold: float = Field(
+        default=0.0, ge=0.0, le=1.0, description="関連性スコアの下限"
+    )
+    max_articles: int = Field(default=10, ge=1, description="通知する記事数の上限")
+    max_llm_tokens: Optional[int] = Field(
+        default=None, ge=1, description="要約に使うLLMトークン数の上限"
+    )
+    summary_deadline_seconds: Optional[float] = Field(
+        default=None, gt=0, description="処理開始から要約完了までの制限時間（秒）"
+    )
+    enrich_articles: bool = Field(
+        default=False, description="要約前に記事ページから本文を取得するか"
+    )
+    digest_times: List[str] = Field(
+        default_factory=list, description="ダイジェストを送信する時刻（JSTのHH:MM）"
+    )
+    digest_max_articles: Optional[int] = Field(
+        default=None, ge=1, description="ダイジェストを送信する蓄積記事数"
+    )
+    priority: int = Field(default=0, ge=0, description="送信の優先度（大きいほど優先）")
+    channels: List[ChannelConfig] = Field(
+        default_factory=lambda: [ChannelConfig(type="line")],
+        min_length=1,
+        description="通知チャンネルのリスト",
+    )
+
+    @field_validator("digest_times")
+    @classmethod
+    def _validate_digest_times(cls, value: List[str]) -> List[str]:
+        """ダイジェストの送信時刻の形式を検証.
+
+        Args:
+            value: 送信時刻のリスト
+
+        Returns:
+            重複を除いて昇順に並べた送信時刻のリスト
+
+        Raises:
+            ValueError: HH:MM形式でない時刻が含まれる場合
+        """
+        for digest_time in value:
+            if not _DIGEST_TIME_PATTERN.match(digest_time):
+                raise ValueError(f"digest_timesはHH:MM形式で指定してください: {digest_time}")
+        return sorted(set(value))
+
+    def is_digest_mode(self) -> bool:
+        """ダイジェストモード（記事を蓄積してまとめて送信）かチェック.
+
+        Returns:
+            送信時刻または蓄積記事数が設定されている場合True
+        """
+        return bool(self.digest_times) or self.digest_max_articles is not None
+
+    def uses_line(self) -> bool:
+        """LINEで通知するかチェック（メッセージ通数を消費するか）.
+
+        Returns:
+            LINEチャンネルが含まれる場合True
+        """
+        return any(channel.type == "line" for channel in self.channels)
 
     def get_keywords_for_search(self) -> List[str]:
         """検索用のキーワードリストを取得.
@@ -35,6 +147,10 @@ class NotificationTarget(BaseModel):
 class KeywordConfig(BaseModel):
     """キーワード設定全体を表すデータモデル.
 
+    名前・LINE User ID・キーワード（正規化済み）から通知先を引く索引と、
+    重複を除いたキーワードのリストを、最初に参照したときに構築する。
+    設定ファイルを再読み込みした場合は、変更前の索引を変更のあった通知先の分だけ更新して引き継ぐ。
+
     Attributes:
         notification_targets: 通知先のリスト
     """
@@ -43,16 +159,131 @@ class KeywordConfig(BaseModel):
         ..., min_length=1, description="通知先のリスト"
     )
 
+    # 通知先の名前 -> 通知先
+    _targets_by_name: Dict[str, NotificationTarget] = PrivateAttr(default_factory=dict)
+    # LINE User ID -> 通知先のリスト
+    _targets_by_user: Dict[str, List[NotificationTarget]] = PrivateAttr(default_factory=dict)
+    # 正規化したキーワード -> 通知先のリスト
+    _targets_by_keyword: Dict[str, List[NotificationTarget]] = PrivateAttr(default_factory=dict)
+    _all_keywords: List[str] = PrivateAttr(default_factory=list)
+    _index_ready: bool = PrivateAttr(default=False)
+
+    def _ensure_index(self) -> None:
+        """索引が未構築の場合は構築."""
+        if not self._index_ready:
+            self._build_index()
+
+    def _build_index(self) -> None:
+        """通知先の索引とキーワードのリストを構築."""
+        self._targets_by_name = {}
+        self._targets_by_user = {}
+        self._targets_by_keyword = {}
+        for target in self.notification_targets:
+            self._targets_by_name.setdefault(target.name, target)
+            self._targets_by_user.setdefault(target.line_user_id, []).append(target)
+            for keyword in self._normalized_keywords(target):
+                self._targets_by_keyword.setdefault(keyword, []).append(target)
+        self._build_keyword_list()
+        self._index_ready = True
+
+    def _build_keyword_list(self) -> None:
+        """重複を除いたキーワードのリストを構築."""
+        self._all_keywords = list(
+            dict.fromkeys(k for target in self.notification_targets for k in target.keywords)
+        )
+
+    @staticmethod
+    def _normalized_keywords(target: NotificationTarget) -> List[str]:
+        """通知先のキーワードを正規化して重複を除いたリストを取得.
+
+        Args:
+            target: 通知先
+
+        Returns:
+            正規化したキーワードのリスト（空になるものは除く）
+        """
+        return [k for k in dict.fromkeys(normalize_text(k) for k in target.keywords) if k]
+
+    def reuse_index(self, previous: "KeywordConfig") -> None:
+        """変更前の設定の、内容が変わっていない通知先と索引を引き継ぐ.
+
+        設定ファイルを再読み込みした際に、変更の無い通知先は同じインスタンスを
+        使い続け、索引は追加・削除・変更された通知先の項目だけを更新する。
+
+        Args:
+            previous: 変更前の設定
+        """
+        previous._ensure_index()
+        for index, target in enumerate(self.notification_targets):
+            old = previous._targets_by_name.get(target.name)
+            if old is not None and old == target:
+                self.notification_targets[index] = old
+
+        current_ids = {id(target) for target in self.notification_targets}
+        previous_ids = {id(target) for target in previous.notification_targets}
+        removed = [t for t in previous.notification_targets if id(t) not in current_ids]
+        added = [t for t in self.notification_targets if id(t) not in previous_ids]
+
+        self._targets_by_name = dict(previous._targets_by_name)
+        self._targets_by_user = dict(previous._targets_by_user)
+        self._targets_by_keyword = dict(previous._targets_by_keyword)
+        if removed or added:
+            position = {id(target): i for i, target in enumerate(self.notification_targets)}
+            for target in removed:
+                if self._targets_by_name.get(target.name) is target:
+                    del self._targets_by_name[target.name]
+            for target in added:
+                self._targets_by_name.setdefault(target.name, target)
+            self._update_lists(
+                self._targets_by_user, removed, added, position, lambda t: [t.line_user_id]
+            )
+            self._update_lists(
+                self._targets_by_keyword, removed, added, position, self._normalized_keywords
+            )
+            self._build_keyword_list()
+        else:
+            self._all_keywords = list(previous._all_keywords)
+        self._index_ready = True
+
+    @staticmethod
+    def _update_lists(
+        index: Dict[str, List[NotificationTarget]],
+        removed: List[NotificationTarget],
+        added: List[NotificationTarget],
+        position: Dict[int, int],
+        keys_of: Callable[[NotificationTarget], List[str]],
+    ) -> None:
+        """索引のうち、削除・追加された通知先に関係する項目だけを更新.
+
+        Args:
+            index: 更新する索引（キー -> 通知先のリスト）
+            removed: 削除された通知先
+            added: 追加された通知先
+            position: 通知先のid -> 設定ファイル内の順番
+            keys_of: 通知先から索引のキーを取得する関数
+        """
+        touched: Dict[str, List[NotificationTarget]] = {}
+        for target in removed + added:
+            for key in keys_of(target):
+                if key not in touched:
+                    touched[key] = [t for t in index.get(key, []) if id(t) in position]
+        for target in added:
+            for key in keys_of(target):
+                touched[key].append(target)
+        for key, targets in touched.items():
+            if targets:
+                index[key] = sorted(targets, key=lambda t: position[id(t)])
+            else:
+                index.pop(key, None)
+
     def get_all_keywords(self) -> List[str]:
         """すべての通知先からキーワードを取得.
 
         Returns:
             重複を除いたキーワードのリスト
         """
-        all_keywords = []
-        for target in self.notification_targets:
-            all_keywords.extend(target.keywords)
-        return list(set(all_keywords))
+        self._ensure_index()
+        return list(self._all_keywords)
 
     def get_target_by_name(self, name: str) -> NotificationTarget | None:
         """名前で通知先を取得.
@@ -63,7 +294,29 @@ class KeywordConfig(BaseModel):
         Returns:
             通知先、存在しない場合はNone
         """
-        for target in self.notification_targets:
-            if target.name == name:
-                return target
-        return None
+        self._ensure_index()
+        return self._targets_by_name.get(name)
+
+    def get_targets_by_user(self, line_user_id: str) -> List[NotificationTarget]:
+        """LINE User IDが送信先の通知先を取得.
+
+        Args:
+            line_user_id: LINE User ID
+
+        Returns:
+            通知先のリスト
+        """
+        self._ensure_index()
+        return list(self._targets_by_user.get(line_user_id, []))
+
+    def get_targets_by_keyword(self, keyword: str) -> List[NotificationTarget]:
+        """キーワードを設定している通知先を取得.
+
+        Args:
+            keyword: キーワード（正規化して比較する）
+
+        Returns:
+            通知先のリスト（設定ファイルの順）
+        """
+        self._ensure_index()
+        return list(self._targets_by_keyword.get(normalize_text(keyword), []))
@@ -2,9 +2,12 @@
 """ニュース記事のデータモデル."""
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, PrivateAttr, field_validator
+
+from src.utils.date_helper import to_utc
+from src.utils.text_normalizer import normalize_text
 
 
 class NewsArticle(BaseModel):
@@ -13,10 +16,13 @@ class NewsArticle(BaseModel):
     Attributes:
         title: 記事のタイトル
         url: 記事のURL
-        published_date: 公開日時
+        published_date: 公開日時（UTCに正規化して保持）
         description: 記事の説明文
+        body: 記事ページから抽出した本文（オプション）
         summary: LLMによる要約文（オプション）
+        summary_source: 要約の生成元（llm、または簡易な抽出型要約のextractive）
         relevance_score: キーワードとの関連性スコア（オプション）
+        duplicate_urls: 同じニュースとして除外した類似記事のURLのリスト
     """
 
     model_config = ConfigDict(
@@ -30,10 +36,33 @@ class NewsArticle(BaseModel):
     url: HttpUrl = Field(..., description="記事のURL")
     published_date: datetime = Field(..., description="公開日時")
     description: str = Field(default="", description="記事の説明文")
+    body: Optional[str] = Field(default=None, description="記事ページから抽出した本文")
     summary: Optional[str] = Field(default=None, description="LLMによる要約文")
+    summary_source: Optional[Literal["llm", "extractive"]] = Field(
+        default=None, description="要約の生成元"
+    )
     relevance_score: Optional[float] = Field(
         default=None, ge=0.0, le=1.0, description="関連性スコア"
     )
+    duplicate_urls: List[str] = Field(
+        default_factory=list, description="同じニュースとして除外した類似記事のURL"
+    )
+
+    # 正規化済みテキストのキャッシュ（フィールド名 -> 正規化済みテキスト）
+    _normalized_cache: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    @field_validator("published_date")
+    @classmethod
+    def _normalize_published_date(cls, value: datetime) -> datetime:
+        """公開日時をタイムゾーン情報付きのUTCに正規化.
+
+        Args:
+            value: 公開日時（タイムゾーン情報がない場合はUTCとみなす）
+
+        Returns:
+            UTCの公開日時
+        """
+        return to_utc(value)
 
     def has_summary(self) -> bool:
         """要約が生成されているかチェック.
@@ -43,6 +72,14 @@ class NewsArticle(BaseModel):
         """
         return self.summary is not None and len(self.summary) > 0
 
+    def is_summary_degraded(self) -> bool:
+        """要約がLLMではなく簡易な抽出型要約かチェック.
+
+        Returns:
+            抽出型要約の場合True
+        """
+        return self.summary_source == "extractive"
+
     def get_url_string(self) -> str:
         """URLを文字列として取得.
 
@@ -50,3 +87,65 @@ class NewsArticle(BaseModel):
             URL文字列
         """
         return str(self.url)
+
+    def get_normalized_title(self) -> str:
+        """正規化済みのタイトルを取得.
+
+        Returns:
+            正規化済みタイトル（初回呼び出し時に計算しキャッシュ）
+        """
+        return self._get_normalized("title", self.title)
+
+    def get_normalized_description(self) -> str:
+        """正規化済みの説明文を取得.
+
+        Returns:
+            正規化済み説明文（初回呼び出し時に計算しキャッシュ）
+        """
+        return self._get_normalized("description", self.description)
+
+    def get_normalized_text(self) -> str:
+        """正規化済みのタイトルと説明文を結合したテキストを取得.
+
+        Returns:
+            正規化済みテキスト（キーワードマッチング・ハッシュ計算用）
+        """
+        title = self.get_normalized_title()
+        description = self.get_normalized_description()
+        cached = self._normalized_cache.get("text")
+        if cached is None:
+            cached = f"{title} {description}".strip()
+            self._normalized_cache["text"] = cached
+        return cached
+
+    def contains_keyword(self, keyword: str) -> bool:
+        """タイトルまたは説明文にキーワードが含まれるかチェック.
+
+        Args:
+            keyword: キーワード（正規化して比較する）
+
+        Returns:
+            含まれる場合True
+        """
+        normalized_keyword = normalize_text(keyword)
+        return bool(normalized_keyword) and normalized_keyword in self.get_normalized_text()
+
+    def _get_normalized(self, field: str, value: str) -> str:
+        """フィールド値の正規化結果をキャッシュ付きで取得.
+
+        Args:
+            field: フィールド名
+            value: フィールドの現在値
+
+        Returns:
+            正規化済みテキスト
+
+        Note:
+            フィールド値が変更された場合はキャッシュを破棄して再計算する
+        """
+        source_key = f"{field}:source"
+        if self._normalized_cache.get(source_key) != value:
+            self._normalized_cache.pop("text", None)
+            self._normalized_cache[source_key] = value
+            self._normalized_cache[field] = normalize_text(value)
+        return self._normalized_cache[field]
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""送信待ちメッセージ（アウトボックス）のデータモデル."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class OutboxEntry(BaseModel):
+    """LINE Messaging APIへの送信待ちリクエスト1件を表すモデル.
+
+    Attributes:
+        retry_key: 冪等キー（X-Line-Retry-Key）。エントリーの識別子も兼ねる
+        endpoint: 送信先のエンドポイント（push または multicast）
+        payload: 組み立て済みのリクエストボディ
+        target_names: 通知先の名前のリスト
+        article_urls: 含まれる記事のURLのリスト
+        attempts: 送信を試みた回数
+        created_at: 作成日時
+        next_attempt_at: 次に送信を試みる日時
+        last_error: 直近の送信エラー（オプション）
+    """
+
+    retry_key: str = Field(..., description="冪等キー（X-Line-Retry-Key）")
+    endpoint: Literal["push", "multicast"] = Field(..., description="送信先のエンドポイント")
+    payload: Dict[str, Any] = Field(..., description="組み立て済みのリクエストボディ")
+    target_names: List[str] = Field(default_factory=list, description="通知先の名前のリスト")
+    article_urls: List[str] = Field(default_factory=list, description="記事のURLのリスト")
+    attempts: int = Field(default=0, ge=0, description="送信を試みた回数")
+    created_at: datetime = Field(..., description="作成日時")
+    next_attempt_at: datetime = Field(..., description="次に送信を試みる日時")
+    last_error: Optional[str] = Field(default=None, description="直近の送信エラー")
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""LLMプロンプトテンプレートのデータモデル."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class PromptTemplate(BaseModel):
+    """固定のシステム指示と記事ごとの入力部分に分けたプロンプトテンプレート.
+
+    システム指示は全記事で共通のため、LLM側でプレフィックスとして
+    キャッシュ・再利用できる。文言を変更した場合はversionを上げること
+    （要約結果のキャッシュキーに使用される）。
+
+    Attributes:
+        name: テンプレート名
+        version: テンプレートのバージョン
+        system_instruction: 全記事で共通のシステム指示
+        user_template: 記事ごとの入力部分（{text}に記事テキストが入る）
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(..., description="テンプレート名")
+    version: int = Field(..., ge=1, description="テンプレートのバージョン")
+    system_instruction: str = Field(..., description="全記事で共通のシステム指示")
+    user_template: str = Field(..., description="記事ごとの入力部分")
+
+    @property
+    def cache_key(self) -> str:
+        """要約キャッシュなどで使用するテンプレートの識別子.
+
+        Returns:
+            「テンプレート名:vバージョン」形式の文字列
+        """
+        return f"{self.name}:v{self.version}"
+
+    def render(self, text: str) -> str:
+        """記事ごとの入力部分を作成.
+
+        Args:
+            text: 記事テキスト
+
+        Returns:
+            LLMに渡す入力
+        """
+        return self.user_template.format(text=text)
+
+
+SUMMARY_PROMPT_TEMPLATE = PromptTemplate(
+    name="news_summary",
+    version=1,
+    system_instruction=(
+        "あなたはニュース記事の要約者です。\n"
+        "与えられたニュース記事を日本語で簡潔に要約してください。\n"
+        "3〜5文程度で、重要なポイントを含めてまとめてください。\n"
+        "要約文のみを出力してください。"
+    ),
+    user_template="記事:\n{text}\n\n要約:",
+)
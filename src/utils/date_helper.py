@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 """日付処理のユーティリティモジュール."""
 
+import time
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional
 
+# タイムゾーンオブジェクトは呼び出しごとに生成せず使い回す
+UTC = timezone.utc
+JST = timezone(timedelta(hours=9))
+
 
 def get_jst_now() -> datetime:
     """現在のJST日時を取得.
@@ -11,8 +17,7 @@ def get_jst_now() -> datetime:
     Returns:
         現在のJST日時（タイムゾーン情報付き）
     """
-    jst = timezone(timedelta(hours=9))
-    return datetime.now(jst)
+    return datetime.now(JST)
 
 
 def get_today_start_jst() -> datetime:
@@ -40,11 +45,68 @@ def is_today_jst(dt: datetime) -> bool:
     # タイムゾーンを考慮して比較
     if dt.tzinfo is None:
         # タイムゾーン情報がない場合はUTCとみなす
-        dt = dt.replace(tzinfo=timezone.utc)
+        dt = dt.replace(tzinfo=UTC)
 
     return today_start <= dt < tomorrow_start
 
 
+def to_utc(dt: datetime) -> datetime:
+    """日時をタイムゾーン情報付きのUTCに変換.
+
+    Args:
+        dt: 変換する日時（タイムゾーン情報がない場合はUTCとみなす）
+
+    Returns:
+        UTCの日時
+    """
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=UTC)
+    if dt.tzinfo is UTC:
+        return dt
+    return dt.astimezone(UTC)
+
+
+def struct_time_to_utc(parsed: Optional[time.struct_time]) -> Optional[datetime]:
+    """feedparserがパース済みのstruct_time（UTC）をdatetimeに変換.
+
+    Args:
+        parsed: feedparserの*_parsedフィールドの値
+
+    Returns:
+        UTCの日時、変換できない場合はNone
+    """
+    if parsed is None:
+        return None
+    try:
+        return datetime(*parsed[:6], tzinfo=UTC)
+    except (ValueError, TypeError):
+        return None
+
+
+def parse_feed_date(
+    parsed: Optional[time.struct_time], date_string: str = ""
+) -> Optional[datetime]:
+    """RSSエントリーの公開日時をUTCのdatetimeに変換.
+
+    feedparserがパース済みのstruct_timeがあればそれを使い、
+    無い場合のみ日付文字列をパースする。
+
+    Args:
+        parsed: feedparserの*_parsedフィールドの値
+        date_string: 元の日付文字列
+
+    Returns:
+        UTCの日時、パースできない場合はNone
+    """
+    dt = struct_time_to_utc(parsed)
+    if dt is not None:
+        return dt
+    if not date_string:
+        return None
+    dt = parse_rss_date(date_string)
+    return to_utc(dt) if dt is not None else None
+
+
 def parse_rss_date(date_string: str) -> Optional[datetime]:
     """RSS日付文字列をdatetimeに変換.
 
@@ -54,8 +116,6 @@ def parse_rss_date(date_string: str) -> Optional[datetime]:
     Returns:
         datetime、パースできない場合はNone
     """
-    from email.utils import parsedate_to_datetime
-
     try:
         return parsedate_to_datetime(date_string)
     except (ValueError, TypeError):
@@ -71,6 +131,5 @@ def format_datetime_jst(dt: datetime) -> str:
     Returns:
         フォーマット済み文字列（例: 2025-01-15 14:30:00 JST）
     """
-    jst = timezone(timedelta(hours=9))
-    dt_jst = dt.astimezone(jst)
+    dt_jst = dt.astimezone(JST)
     return dt_jst.strftime("%Y-%m-%d %H:%M:%S JST")
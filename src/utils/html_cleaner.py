@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""RSSの説明文や記事ページのHTMLをLLM入力用のプレーンテキストに整形するユーティリティモジュール."""
+
+import html
+import re
+
+# Google Newsの説明文では配信元名が<font>タグで囲まれている
+_FONT_PATTERN = re.compile(r"<font\b[^>]*>.*?</font\s*>", re.IGNORECASE | re.DOTALL)
+_SCRIPT_PATTERN = re.compile(
+    r"<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 本文抽出時に中身ごと取り除く要素（ナビゲーション・広告枠など）
+_BOILERPLATE_PATTERN = re.compile(
+    r"<(script|style|noscript|nav|header|footer|aside|form|iframe)\b[^>]*>.*?</\1\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.DOTALL)
+_ARTICLE_PATTERN = re.compile(r"<article\b[^>]*>(.*?)</article\s*>", re.IGNORECASE | re.DOTALL)
+_PARAGRAPH_PATTERN = re.compile(r"<p\b[^>]*>(.*?)</p\s*>", re.IGNORECASE | re.DOTALL)
+
+
+def strip_html(text: str) -> str:
+    """HTMLタグを除去し、文字参照をデコードする.
+
+    Args:
+        text: HTML断片
+
+    Returns:
+        空白を1つにまとめたプレーンテキスト
+    """
+    if "<" not in text and "&" not in text:
+        return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+    text = _SCRIPT_PATTERN.sub(" ", text)
+    text = _TAG_PATTERN.sub(" ", text)
+    text = html.unescape(text)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def clean_description(description: str, title: str = "") -> str:
+    """説明文からマークアップと、タイトル・配信元の重複を取り除く.
+
+    Google Newsの説明文は「<a>記事タイトル</a> <font>配信元</font>」の形式で、
+    タイトルと配信元を繰り返しているだけのことが多い。その場合は空文字列を返す。
+
+    Args:
+        description: 説明文（HTML断片）
+        title: 記事タイトル（「記事タイトル - 配信元」の形式）
+
+    Returns:
+        整形済みの説明文
+    """
+    text = strip_html(_FONT_PATTERN.sub(" ", description))
+    if not text or not title:
+        return text
+
+    story_title, separator, source = title.rpartition(" - ")
+    if not separator:
+        story_title, source = title, ""
+
+    for repeated in (title.strip(), story_title.strip()):
+        if repeated and text.startswith(repeated):
+            text = text[len(repeated) :].strip()
+            break
+
+    source = source.strip()
+    if source and text.endswith(source):
+        text = text[: -len(source)].strip()
+
+    return text
+
+
+def extract_main_text(page_html: str, min_paragraph_chars: int = 20, max_chars: int = 4000) -> str:
+    """記事ページのHTMLから本文を抽出する.
+
+    script・ナビゲーションなどを取り除いた上で、<article>要素があればその中の、
+    なければページ全体の<p>要素のうち一定以上の長さの段落を本文とみなす。
+
+    Args:
+        page_html: 記事ページのHTML
+        min_paragraph_chars: 本文とみなす段落の最小文字数
+        max_chars: 本文の最大文字数
+
+    Returns:
+        本文（抽出できない場合は空文字列）
+    """
+    page_html = _BOILERPLATE_PATTERN.sub(" ", _COMMENT_PATTERN.sub(" ", page_html))
+
+    articles = _ARTICLE_PATTERN.findall(page_html)
+    scope = max(articles, key=len) if articles else page_html
+
+    paragraphs = []
+    length = 0
+    for raw in _PARAGRAPH_PATTERN.findall(scope):
+        paragraph = strip_html(raw)
+        if len(paragraph) < min_paragraph_chars:
+            continue
+        paragraphs.append(paragraph)
+        length += len(paragraph)
+        if length >= max_chars:
+            break
+
+    return "\n".join(paragraphs)[:max_chars]
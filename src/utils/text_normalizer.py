@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""日本語テキスト正規化のユーティリティモジュール."""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# ひらがな（ぁ〜ゖ）をカタカナ（ァ〜ヶ）へ変換するテーブル
+_HIRAGANA_TO_KATAKANA = {code: code + 0x60 for code in range(0x3041, 0x3097)}
+
+# カナの直後で長音記号として使われがちな文字（NFKC後の形）
+_LONG_VOWEL_VARIANTS = "-—―‐‑–~〜"
+_LONG_VOWEL_PATTERN = re.compile(
+    rf"(?<=[ァ-ヺー])[{re.escape(_LONG_VOWEL_VARIANTS)}]"
+)
+
+# 区切りとして空白に置き換えない記号（キーワードの一部になりうるもの）
+_KEPT_PUNCTUATION = frozenset("#&@")
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def _is_punctuation(char: str) -> bool:
+    """空白に置き換える句読点・括弧類かどうか判定.
+
+    Args:
+        char: 判定する文字
+
+    Returns:
+        句読点・括弧類の場合True
+    """
+    return char not in _KEPT_PUNCTUATION and unicodedata.category(char).startswith("P")
+
+
+@lru_cache(maxsize=4096)
+def normalize_text(text: str) -> str:
+    """マッチング・ハッシュ用にテキストを正規化.
+
+    以下の順に正規化する:
+        1. NFKC正規化（全角英数字・半角カナなどの幅を統一）
+        2. 小文字化
+        3. ひらがなをカタカナに統一し、カナに続く長音記号の揺れを「ー」に統一
+        4. 句読点・括弧類を空白に置き換え、連続する空白を1つにまとめる
+
+    Args:
+        text: 正規化するテキスト
+
+    Returns:
+        正規化済みテキスト
+    """
+    normalized = unicodedata.normalize("NFKC", text).lower()
+    normalized = normalized.translate(_HIRAGANA_TO_KATAKANA)
+    normalized = _LONG_VOWEL_PATTERN.sub("ー", normalized)
+    normalized = "".join(" " if _is_punctuation(c) else c for c in normalized)
+    return _WHITESPACE_PATTERN.sub(" ", normalized).strip()
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""LLMのトークン数を概算するユーティリティモジュール."""
+
+
+def estimate_tokens(text: str) -> int:
+    """テキストのトークン数を概算.
+
+    LLMのトークナイザーに依存せずに見積もるため、ASCII文字は約4文字で1トークン、
+    日本語などの非ASCII文字は1文字1トークンとして保守的に数える。
+
+    Args:
+        text: 対象のテキスト
+
+    Returns:
+        概算トークン数
+    """
+    ascii_count = sum(1 for c in text if c.isascii())
+    non_ascii_count = len(text) - ascii_count
+    return non_ascii_count + (ascii_count + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """概算トークン数が上限に収まるようにテキストの末尾を切り詰める.
+
+    Args:
+        text: 対象のテキスト
+        max_tokens: 最大トークン数
+
+    Returns:
+        切り詰めたテキスト（上限内であれば元のテキスト）
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    # estimate_tokensと同じ数え方で、上限を超える直前の位置を探す
+    non_ascii_count = 0
+    ascii_count = 0
+    for index, char in enumerate(text):
+        if char.isascii():
+            ascii_count += 1
+        else:
+            non_ascii_count += 1
+        if non_ascii_count + (ascii_count + 3) // 4 > max_tokens:
+            return text[:index].rstrip()
+    return text
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""LINEのメッセージでニュースを検索できるWebhookサーバーのエントリーポイント."""
+
+import asyncio
+import json
+import sys
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from config.settings import settings
+from src.business.news_query_responder import NewsQueryResponder
+from src.infrastructure.article_store import ArticleStore
+from src.infrastructure.keyword_config_loader import KeywordConfigLoader
+from src.infrastructure.line_client import LineClient, verify_signature
+from src.infrastructure.rate_limiter import RateLimiter
+from src.utils.logger import get_logger, setup_logger
+
+logger = get_logger(__name__)
+
+SIGNATURE_HEADER = "x-line-signature"
+
+
+class WebhookServer:
+    """LINEのWebhookを受け付け、記事ストアの検索結果を応答メッセージで返すサーバー.
+
+    asyncioで1スレッドのまま多数の接続を受け付ける。署名を検証したら直ちに
+    HTTP 200を返し、検索と応答メッセージの送信はスレッドプールで行う。
+    ニュースの取得やLLMの呼び出しは行わない。
+    """
+
+    def __init__(
+        self,
+        channel_secret: str,
+        line_client: LineClient,
+        responder: NewsQueryResponder,
+        path: str = "/callback",
+        max_body_bytes: int = 1024 * 1024,
+        read_timeout: float = 10.0,
+    ) -> None:
+        """初期化.
+
+        Args:
+            channel_secret: LINEチャンネルシークレット（署名の検証に使用）
+            line_client: LINEクライアント（応答メッセージの送信に使用）
+            responder: ニュース検索の応答
+            path: WebhookのURLのパス
+            max_body_bytes: 受け付けるリクエストボディの最大バイト数
+            read_timeout: リクエストの読み込みのタイムアウト（秒）
+        """
+        self.channel_secret = channel_secret
+        self.line_client = line_client
+        self.responder = responder
+        self.path = path
+        self.max_body_bytes = max_body_bytes
+        self.read_timeout = read_timeout
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def start(self, host: str, port: int) -> asyncio.Server:
+        """サーバーを起動.
+
+        Args:
+            host: 待ち受けるホスト
+            port: 待ち受けるポート番号（0の場合は空いているポート）
+
+        Returns:
+            起動したasyncio.Server
+        """
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        for sock in server.sockets:
+            logger.info(f"Webhookサーバー起動: {sock.getsockname()}{self.path}")
+        return server
+
+    async def serve_forever(self, host: str, port: int) -> None:
+        """サーバーを起動し、停止されるまで待ち受ける.
+
+        Args:
+            host: 待ち受けるホスト
+            port: 待ち受けるポート番号
+        """
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def wait_for_replies(self) -> None:
+        """送信中の応答メッセージがすべて完了するまで待機."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def handle_request(
+        self, method: str, path: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[HTTPStatus, List[Dict[str, Any]]]:
+        """リクエストを検証し、応答するイベントを取り出す.
+
+        Args:
+            method: HTTPメソッド
+            path: リクエストのパス
+            headers: リクエストヘッダー（キーは小文字）
+            body: リクエストボディ
+
+        Returns:
+            (HTTPステータス, 応答するテキストメッセージのイベントのリスト)
+        """
+        if path.split("?", 1)[0] == "/health" and method == "GET":
+            return HTTPStatus.OK, []
+        if path.split("?", 1)[0] != self.path:
+            return HTTPStatus.NOT_FOUND, []
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, []
+
+        signature = headers.get(SIGNATURE_HEADER, "")
+        if not signature or not verify_signature(self.channel_secret, body, signature):
+            logger.warning("Webhookの署名が不正なため拒否しました")
+            return HTTPStatus.UNAUTHORIZED, []
+
+        try:
+            payload = json.loads(body)
+        except json.JSONDecodeError:
+            return HTTPStatus.BAD_REQUEST, []
+
+        events = [
+            event
+            for event in payload.get("events", [])
+            if event.get("type") == "message"
+            and event.get("message", {}).get("type") == "text"
+            and event.get("replyToken")
+        ]
+        return HTTPStatus.OK, events
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """1件の接続のリクエストを処理.
+
+        Args:
+            reader: 受信ストリーム
+            writer: 送信ストリーム
+        """
+        try:
+            request = await asyncio.wait_for(self._read_request(reader), self.read_timeout)
+            if request is None:
+                status, events = HTTPStatus.BAD_REQUEST, []
+            elif isinstance(request, HTTPStatus):
+                status, events = request, []
+            else:
+                status, events = self.handle_request(*request)
+
+            # LINEプラットフォームには処理の完了を待たずに応答する
+            await self._write_response(writer, status)
+            for event in events:
+                task = asyncio.create_task(self._reply(event))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError) as e:
+            logger.debug(f"Webhookの接続を切断しました: {e!r}")
+        finally:
+            writer.close()
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader
+    ) -> Optional[Tuple[str, str, Dict[str, str], bytes] | HTTPStatus]:
+        """HTTPリクエストを読み込む.
+
+        Args:
+            reader: 受信ストリーム
+
+        Returns:
+            (メソッド, パス, ヘッダー, ボディ)、受け付けられない場合はHTTPステータス、
+            リクエストとして解釈できない場合はNone
+        """
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if len(request_line) != 3:
+            return None
+        method, path, _version = request_line
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            return None
+        if length > self.max_body_bytes:
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+        body = await reader.readexactly(length) if length > 0 else b""
+        return method, path, headers, body
+
+    @staticmethod
+    async def _write_response(writer: asyncio.StreamWriter, status: HTTPStatus) -> None:
+        """HTTPレスポンスを送信.
+
+        Args:
+            writer: 送信ストリーム
+            status: HTTPステータス
+        """
+        body = status.phrase.encode("ascii")
+        writer.write(
+            (
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                "Content-Type: text/plain; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode("ascii")
+            + body
+        )
+        await writer.drain()
+
+    async def _reply(self, event: Dict[str, Any]) -> None:
+        """テキストメッセージのイベントに検索結果で応答.
+
+        検索とAPI呼び出しはイベントループを止めないようスレッドプールで実行する。
+
+        Args:
+            event: Webhookのメッセージイベント
+        """
+        loop = asyncio.get_running_loop()
+        text = event["message"].get("text", "")
+        user_id = event.get("source", {}).get("userId")
+        try:
+            started_at = loop.time()
+            messages = await loop.run_in_executor(None, self.responder.build_reply, text, user_id)
+            await loop.run_in_executor(
+                None, self.line_client.reply_message, event["replyToken"], messages
+            )
+            logger.info(
+                f"ニュース検索に応答しました: {(loop.time() - started_at) * 1000:.0f}ms"
+            )
+        except Exception as e:
+            logger.error(f"ニュース検索の応答に失敗しました: {e}")
+
+
+def main() -> None:
+    """Webhookサーバーを起動."""
+    setup_logger("", log_file=settings.LOG_FILE, log_level=settings.LOG_LEVEL)
+
+    if not settings.LINE_CHANNEL_ACCESS_TOKEN or not settings.LINE_CHANNEL_SECRET:
+        logger.error("LINE_CHANNEL_ACCESS_TOKENとLINE_CHANNEL_SECRETを設定してください")
+        sys.exit(1)
+
+    article_store = ArticleStore(db_file=str(settings.get_absolute_path(settings.ARTICLE_STORE_FILE)))
+    line_client = LineClient(
+        channel_access_token=settings.LINE_CHANNEL_ACCESS_TOKEN,
+        rate_limiter=RateLimiter.from_config(settings.RATE_LIMITS, jitter=settings.RATE_LIMIT_JITTER),
+    )
+    server = WebhookServer(
+        settings.LINE_CHANNEL_SECRET,
+        line_client,
+        NewsQueryResponder(
+            article_store,
+            max_results=settings.WEBHOOK_MAX_RESULTS,
+            # キーワード設定の変更は再起動せずに反映する
+            config_loader=KeywordConfigLoader(str(settings.get_absolute_path(settings.KEYWORDS_FILE))),
+            search_scope=settings.WEBHOOK_SEARCH_SCOPE,
+        ),
+        path=settings.WEBHOOK_PATH,
+    )
+    logger.info(f"記事ストア: {article_store.count()}件")
+
+    try:
+        asyncio.run(server.serve_forever(settings.WEBHOOK_HOST, settings.WEBHOOK_PORT))
+    except KeyboardInterrupt:
+        logger.info("Webhookサーバーを停止しました")
+    finally:
+        article_store.close()
+
+
+if __name__ == "__main__":
+    main()
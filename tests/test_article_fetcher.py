@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""ArticleFetcher・ArticleCacheManagerのテストコード."""
+
+import base64
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import pytest
+import requests
+
+from src.infrastructure.article_cache_manager import ArticleCacheManager
+from src.infrastructure.article_fetcher import ArticleFetcher, decode_google_news_url
+
+PAGE_HTML = (
+    "<html><head><meta charset='utf-8'></head><body><article>"
+    "<p>新型AIモデルが発表され、性能が大幅に向上した。</p>"
+    "</article></body></html>"
+).encode("utf-8")
+
+
+class FakeResponse:
+    """テスト用のストリーミングレスポンス."""
+
+    def __init__(self, url: str, content: bytes) -> None:
+        """初期化."""
+        self.url = url
+        self.content = content
+        self.headers = {"Content-Type": "text/html"}
+        self.encoding = "ISO-8859-1"
+        self.body_read = False
+
+    def __enter__(self) -> "FakeResponse":
+        """コンテキストマネージャーの開始."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """コンテキストマネージャーの終了."""
+
+    def raise_for_status(self) -> None:
+        """ステータスの確認."""
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """ボディを返す."""
+        self.body_read = True
+        yield self.content
+
+
+class FakeSession:
+    """リダイレクト表に従って応答するテスト用セッション."""
+
+    def __init__(self, redirects: Dict[str, str]) -> None:
+        """初期化."""
+        self.redirects = redirects
+        self.requested: List[str] = []
+        self.responses: List[FakeResponse] = []
+
+    def get(self, url: str, **kwargs: object) -> FakeResponse:
+        """GETリクエスト."""
+        self.requested.append(url)
+        if url not in self.redirects:
+            raise requests.ConnectionError("connection refused")
+        response = FakeResponse(self.redirects[url], PAGE_HTML)
+        self.responses.append(response)
+        return response
+
+
+def google_news_url(article_url: str) -> str:
+    """記事URLを含む旧形式のGoogle NewsのリンクURLを作成."""
+    encoded = article_url.encode("utf-8")
+    token = base64.urlsafe_b64encode(b"\x08\x13\x22" + bytes([len(encoded)]) + encoded + b"\xd2\x01\x00")
+    return f"https://news.google.com/rss/articles/{token.decode('ascii').rstrip('=')}?oc=5"
+
+
+@pytest.fixture
+def cache_file(tmp_path: Path) -> str:
+    """記事キャッシュファイルのパス."""
+    return str(tmp_path / "article_bodies.json")
+
+
+def test_decode_google_news_url() -> None:
+    """Google Newsのリンクから記事URLを復元することのテスト."""
+    assert decode_google_news_url(google_news_url("https://example.com/news/1")) == "https://example.com/news/1"
+    # Google News以外のURLはそのまま
+    assert decode_google_news_url("https://example.com/news/1") == "https://example.com/news/1"
+    # 新形式の記事IDや記事ID以外のページは復元できない
+    assert decode_google_news_url("https://news.google.com/rss/articles/CBMiAU_yqLNewFormat") is None
+    assert decode_google_news_url("https://news.google.com/topics/abc") is None
+
+
+def test_fetch_bodies_resolves_redirects_and_caches(cache_file: str) -> None:
+    """リダイレクトを解決して本文を取得し、2回目はキャッシュを使うことのテスト."""
+    url_a = google_news_url("https://example.com/a")
+    url_b = google_news_url("https://example.com/b")
+    session = FakeSession(
+        {
+            "https://example.com/a": "https://example.com/news/1",
+            "https://example.com/b": "https://example.com/news/1",
+        }
+    )
+    fetcher = ArticleFetcher(ArticleCacheManager(cache_file), session=session)  # type: ignore[arg-type]
+
+    bodies = fetcher.fetch_bodies([url_a])
+    assert bodies == {url_a: "新型AIモデルが発表され、性能が大幅に向上した。"}
+    assert session.requested == ["https://example.com/a"]
+
+    # 同じ正規URLへの別のリダイレクトURLはボディを読まずに本文を再利用する
+    bodies = fetcher.fetch_bodies([url_b])
+    assert len(bodies) == 1
+    assert session.responses[-1].body_read is False
+
+    # 新しいインスタンスでもディスクのキャッシュから取得する
+    session.requested.clear()
+    fetcher = ArticleFetcher(ArticleCacheManager(cache_file), session=session)  # type: ignore[arg-type]
+    bodies = fetcher.fetch_bodies([url_a, url_b])
+    assert len(bodies) == 2
+    assert session.requested == []
+
+
+def test_fetch_bodies_skips_google_news_pages(cache_file: str) -> None:
+    """記事URLを復元できないGoogle Newsのリンクは取得せず、中間ページもキャッシュしないことのテスト."""
+    undecodable = "https://news.google.com/rss/articles/CBMiAU_yqLNewFormat?oc=5"
+    consent_redirect = google_news_url("https://example.com/consent")
+    session = FakeSession({"https://example.com/consent": "https://news.google.com/consent"})
+    cache = ArticleCacheManager(cache_file)
+    fetcher = ArticleFetcher(cache, session=session)  # type: ignore[arg-type]
+
+    assert fetcher.fetch_bodies([undecodable, consent_redirect]) == {}
+    assert session.requested == ["https://example.com/consent"]
+    assert session.responses[-1].body_read is False
+    assert cache.get_canonical_url(undecodable) is None
+    assert cache.get_canonical_url(consent_redirect) is None
+
+    # 取得しなかったリンクは有効期間の間、取得し直さない
+    assert cache.is_failed(undecodable)
+    assert cache.is_failed(consent_redirect)
+    assert fetcher.fetch_bodies([undecodable, consent_redirect]) == {}
+    assert session.requested == ["https://example.com/consent"]
+
+
+def test_fetch_bodies_skips_failed_pages(cache_file: str) -> None:
+    """取得に失敗したページは結果に含めず、失敗の有効期間の間は取得し直さないことのテスト."""
+    session = FakeSession({})
+    fetcher = ArticleFetcher(ArticleCacheManager(cache_file), session=session)  # type: ignore[arg-type]
+
+    assert fetcher.fetch_bodies(["https://example.com/down"]) == {}
+    assert fetcher.fetch_bodies(["https://example.com/down"]) == {}
+    assert session.requested == ["https://example.com/down"]
+
+    # 失敗の記録もディスクに保存され、有効期間を過ぎると取得し直す
+    assert ArticleCacheManager(cache_file).is_failed("https://example.com/down")
+    fetcher = ArticleFetcher(
+        ArticleCacheManager(cache_file, failure_ttl_hours=0), session=session  # type: ignore[arg-type]
+    )
+    assert fetcher.fetch_bodies(["https://example.com/down"]) == {}
+    assert session.requested == ["https://example.com/down"] * 2
+
+
+def test_cache_expires(cache_file: str) -> None:
+    """有効期間を過ぎたキャッシュは使わないことのテスト."""
+    cache = ArticleCacheManager(cache_file, ttl_hours=0)
+    cache.set_article("https://example.com/a", "https://example.com/a", "本文")
+
+    assert cache.get_canonical_url("https://example.com/a") is None
+    assert cache.get_body("https://example.com/a") is None
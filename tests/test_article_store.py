@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""記事ストアのテストコード."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+import sqlite3
+
+import pytest
+from pydantic import HttpUrl
+
+from src.infrastructure.article_store import ArticleStore
+from src.main import record_unsent_decisions
+from src.models.delivery_plan import DeliveryDecision
+from src.models.news_article import NewsArticle
+
+
+def _article(index: int, title: str, summary: Optional[str] = None, hours_ago: int = 0) -> NewsArticle:
+    """テスト用の記事を作成."""
+    return NewsArticle(
+        title=title,
+        url=HttpUrl(f"https://example.com/news/{index}"),
+        published_date=datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc) - timedelta(hours=hours_ago),
+        description=f"説明{index}",
+        summary=summary,
+        summary_source="llm" if summary else None,
+        relevance_score=0.5,
+    )
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Iterator[ArticleStore]:
+    """ArticleStoreのフィクスチャ."""
+    store = ArticleStore(db_file=str(tmp_path / "articles.db"))
+    yield store
+    store.close()
+
+
+def test_search_matches_all_terms_newest_first(store: ArticleStore) -> None:
+    """すべての検索語を含む記事が新しい順に返されることのテスト."""
+    store.save_articles(
+        [
+            _article(1, "生成AIの規制案が公表", summary="政府が新たな指針", hours_ago=3),
+            _article(2, "生成AIの新モデル", summary="規制への対応も発表", hours_ago=1),
+            _article(3, "半導体の輸出規制", hours_ago=2),
+        ]
+    )
+
+    results = store.search("生成ai 規制")
+
+    assert [article.title for article in results] == ["生成AIの新モデル", "生成AIの規制案が公表"]
+    assert results[0].summary == "規制への対応も発表"
+    assert results[0].published_date == datetime(2025, 1, 15, 11, 0, 0, tzinfo=timezone.utc)
+    assert [article.title for article in store.search("", limit=1)] == ["生成AIの新モデル"]
+    # LIKEのワイルドカードは文字として扱う
+    assert store.search("%") == []
+
+
+def test_upsert_keeps_existing_summary(store: ArticleStore) -> None:
+    """要約の無い記事で上書きしても保存済みの要約が残ることのテスト."""
+    store.save_articles([_article(1, "記事", summary="要約")])
+    store.save_articles([_article(1, "記事（更新）")])
+
+    [article] = store.search("記事")
+    assert store.count() == 1
+    assert article.title == "記事（更新）"
+    assert article.summary == "要約"
+    assert article.summary_source == "llm"
+
+
+def test_purge_removes_old_articles(store: ArticleStore) -> None:
+    """指定日時より前に公開された記事が削除されることのテスト."""
+    store.save_articles([_article(1, "新しい記事"), _article(2, "古い記事", hours_ago=48)])
+
+    assert store.purge(datetime(2025, 1, 14, 12, 0, 0, tzinfo=timezone.utc)) == 1
+    assert [article.title for article in store.search("")] == ["新しい記事"]
+
+
+def test_short_terms_and_fts_index_stay_in_sync(store: ArticleStore) -> None:
+    """trigramで検索できない短い語と、更新・削除後の全文検索のテスト."""
+    assert store.fts_enabled
+    store.save_articles([_article(1, "半導体の新工場", summary="AI需要に対応")])
+
+    assert [article.title for article in store.search("AI 新工場")] == ["半導体の新工場"]
+    assert store.search('半導体" OR "x') == []
+
+    store.save_articles([_article(1, "量子コンピューターの新工場", summary="量子技術")])
+    assert store.search("半導体") == []
+    assert len(store.search("量子技術")) == 1
+
+    store.purge(datetime(2025, 2, 1, tzinfo=timezone.utc))
+    assert store.search("量子技術") == []
+
+
+def test_delivery_states(store: ArticleStore) -> None:
+    """通知先ごとの配信状態が上書き記録されることのテスト."""
+    url = "https://example.com/news/1"
+    store.save_articles([_article(1, "記事")])
+    store.record_deliveries("team_a", [url], "deferred")
+    store.record_deliveries("team_b", [url], "sent")
+    store.record_deliveries("team_a", [url], "sent")
+
+    assert store.get_delivery_states(url) == {"team_a": "sent", "team_b": "sent"}
+
+
+def test_old_schema_is_recreated(tmp_path: Path) -> None:
+    """古いスキーマのデータベースが作り直されることのテスト."""
+    db_file = tmp_path / "articles.db"
+    conn = sqlite3.connect(db_file)
+    conn.execute("CREATE TABLE articles (url TEXT PRIMARY KEY, title TEXT NOT NULL)")
+    conn.commit()
+    conn.close()
+
+    store = ArticleStore(db_file=str(db_file))
+    store.save_articles([_article(1, "記事")])
+    assert store.count() == 1
+    store.close()
+
+
+def test_unsent_decisions_are_recorded_with_store_statuses(store: ArticleStore) -> None:
+    """送信判断のactionが記事ストアの配信状態に変換されて記録されることのテスト."""
+    deferred, dropped, sent = _article(1, "後回し"), _article(2, "破棄"), _article(3, "送信")
+    store.save_articles([deferred, dropped, sent])
+
+    record_unsent_decisions(
+        store,
+        [
+            DeliveryDecision(target_name="team_a", action="defer", articles=[deferred]),
+            DeliveryDecision(target_name="team_a", action="drop", articles=[dropped]),
+            DeliveryDecision(target_name="team_a", action="send", articles=[sent], cost=1),
+        ],
+    )
+
+    assert store.get_delivery_states(deferred.get_url_string()) == {"team_a": "deferred"}
+    assert store.get_delivery_states(dropped.get_url_string()) == {"team_a": "dropped"}
+    assert store.get_delivery_states(sent.get_url_string()) == {}
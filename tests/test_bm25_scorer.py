@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""BM25Scorerのテストコード."""
+
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from pydantic import HttpUrl
+
+from src.business.bm25_scorer import BM25Scorer
+from src.business.news_analyzer import NewsAnalyzer
+from src.infrastructure.corpus_stats_manager import CorpusStatsManager
+from src.models.news_article import NewsArticle
+
+
+@pytest.fixture
+def temp_stats_file() -> str:
+    """一時統計ファイルのフィクスチャ."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield str(Path(temp_dir) / "corpus_stats.json")
+
+
+def _article(
+    index: int, title: str, description: str = "", published_date: Optional[datetime] = None
+) -> NewsArticle:
+    """テスト用の記事を作成."""
+    return NewsArticle(
+        title=title,
+        url=HttpUrl(f"https://example.com/news/{index}"),
+        published_date=published_date or datetime.now(timezone.utc),
+        description=description,
+    )
+
+
+def test_score_articles_orders_by_relevance(temp_stats_file: str) -> None:
+    """BM25スコアがキーワードの出現位置と回数を反映することのテスト."""
+    scorer = BM25Scorer(CorpusStatsManager(stats_file=temp_stats_file))
+    articles = [
+        _article(1, "Python入門", "Pythonの基礎とPythonの応用"),
+        _article(2, "プログラミング言語の比較", "Pythonにも少し触れる"),
+        _article(3, "スポーツニュース", "サッカーの試合結果"),
+    ]
+
+    scores = scorer.score_articles(articles, ["Python"])
+
+    assert len(scores) == 3
+    assert all(0.0 <= score <= 1.0 for score in scores)
+    # タイトルにも含む記事が最も高い
+    assert scores[0] > scores[1] > scores[2]
+    assert scores[2] == 0.0
+
+
+def test_rare_keyword_weighs_more(temp_stats_file: str) -> None:
+    """文書頻度の低いキーワードほど重みが大きいことのテスト."""
+    scorer = BM25Scorer(CorpusStatsManager(stats_file=temp_stats_file))
+    articles = [
+        _article(1, "AIニュース", "量子コンピュータ"),
+        _article(2, "AIニュース", "AIの話題"),
+        _article(3, "AIの未来", "AIの話題"),
+        _article(4, "AIと社会", "AIの話題"),
+    ]
+
+    scores = scorer.score_articles(articles, ["AI", "量子"])
+
+    # 希少語「量子」を含む記事が上位になる
+    assert scores[0] == max(scores)
+
+
+def test_corpus_stats_incremental_update(temp_stats_file: str) -> None:
+    """コーパス統計が永続化され、同じ文書を二重に数えないことのテスト."""
+    articles = [_article(1, "Python入門"), _article(2, "AIの未来")]
+
+    scorer1 = BM25Scorer(CorpusStatsManager(stats_file=temp_stats_file))
+    scorer1.score_articles(articles, ["Python"])
+
+    stats = CorpusStatsManager(stats_file=temp_stats_file)
+    assert stats.get_document_count() == 2
+    assert stats.get_term_stats("python") == (1, 2)
+
+    # 同じ記事を再度スコアリングしても件数は増えない
+    BM25Scorer(stats).score_articles(articles + [_article(3, "Python速報")], ["Python"])
+    assert stats.get_document_count() == 3
+    assert stats.get_term_stats("python") == (2, 3)
+
+
+def test_corpus_stats_backfills_terms_of_another_target(temp_stats_file: str) -> None:
+    """別のキーワードの通知先が同じ記事をスコアリングした場合も語の統計に数えることのテスト."""
+    shared = _article(1, "Python入門", "AIとPythonの話題")
+
+    # 通知先A（Python）が先に記事を集計する
+    BM25Scorer(CorpusStatsManager(stats_file=temp_stats_file)).score_articles(
+        [shared, _article(2, "スポーツ")], ["Python"]
+    )
+    # 通知先B（AI）が同じ記事を含めてスコアリングする
+    stats = CorpusStatsManager(stats_file=temp_stats_file)
+    BM25Scorer(stats).score_articles([shared, _article(3, "AIの未来")], ["AI"])
+
+    # 文書数は二重に数えず、AIの統計には共有記事も含まれる
+    assert stats.get_document_count() == 3
+    assert stats.get_term_stats("ai") == (2, 2)
+    assert stats.get_term_stats("python") == (1, 2)
+
+    # 再読み込み後も語ごとの集計済み状態を引き継ぐ
+    reloaded = CorpusStatsManager(stats_file=temp_stats_file)
+    BM25Scorer(reloaded).score_articles([shared], ["Python", "AI"])
+    assert reloaded.get_term_stats("ai") == (2, 2)
+    assert reloaded.get_term_stats("python") == (1, 2)
+
+
+def test_corpus_stats_ignores_documents_past_tracking_period(temp_stats_file: str) -> None:
+    """保持期間を過ぎた文書キーを破棄し、再取得されても二重に数えないことのテスト."""
+    stats = CorpusStatsManager(stats_file=temp_stats_file)
+    published = datetime.now(timezone.utc) - timedelta(days=CorpusStatsManager.TRACKING_DAYS - 1)
+    article = _article(1, "Python入門", published_date=published)
+
+    BM25Scorer(stats).score_articles([article], ["Python"])
+    assert stats.get_document_count() == 1
+
+    # 保持期間を過ぎた後に同じ記事が再取得されても数えない
+    later = datetime.now(timezone.utc) + timedelta(days=2)
+    stats.add_documents(
+        document_keys=[article.get_url_string()],
+        field_lengths=[{"title": 1}],
+        document_terms=[{"python"}],
+        terms=["python"],
+        published_dates=[published],
+        now=later,
+    )
+    assert stats.get_document_count() == 1
+    assert stats.get_term_stats("python") == (1, 1)
+
+
+def test_news_analyzer_bm25(temp_stats_file: str) -> None:
+    """NewsAnalyzerでBM25方式を指定した場合のテスト."""
+    analyzer = NewsAnalyzer(
+        bm25_scorer=BM25Scorer(CorpusStatsManager(stats_file=temp_stats_file))
+    )
+    articles = [_article(1, "スポーツ"), _article(2, "Python入門", "Pythonの基礎")]
+
+    analyzed = analyzer.analyze_relevance(articles, ["Python"], scoring_method="bm25")
+
+    assert analyzed[0].title == "Python入門"
+    assert analyzed[0].relevance_score > analyzed[1].relevance_score  # type: ignore
+
+
+def test_news_analyzer_bm25_without_scorer() -> None:
+    """BM25スコアラー未設定でbm25を指定した場合のテスト."""
+    with pytest.raises(ValueError):
+        NewsAnalyzer().analyze_relevance([], ["Python"], scoring_method="bm25")
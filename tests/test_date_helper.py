@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """date_helperのテストコード."""
 
+import time
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -10,7 +11,9 @@ from src.utils.date_helper import (
     get_jst_now,
     get_today_start_jst,
     is_today_jst,
+    parse_feed_date,
     parse_rss_date,
+    to_utc,
 )
 
 
@@ -82,3 +85,38 @@ def test_format_datetime_jst() -> None:
 
     # JST（UTC+9）に変換されているはず
     assert "2025-01-15 21:00:00 JST" == formatted
+
+
+def test_to_utc() -> None:
+    """to_utcのテスト."""
+    jst = timezone(timedelta(hours=9))
+
+    # タイムゾーン付きはUTCに変換
+    converted = to_utc(datetime(2025, 1, 15, 21, 0, 0, tzinfo=jst))
+    assert converted == datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+    assert converted.utcoffset() == timedelta(0)
+
+    # タイムゾーンなしはUTCとみなす
+    naive = to_utc(datetime(2025, 1, 15, 12, 0, 0))
+    assert naive.tzinfo is not None
+    assert naive.utcoffset() == timedelta(0)
+
+
+def test_parse_feed_date_prefers_parsed_struct() -> None:
+    """パース済みstruct_timeが優先されることのテスト."""
+    parsed = time.strptime("2025-01-15 12:00:00", "%Y-%m-%d %H:%M:%S")
+
+    dt = parse_feed_date(parsed, "invalid date")
+
+    assert dt == datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def test_parse_feed_date_fallback_to_string() -> None:
+    """struct_timeが無い場合に文字列をパースしてUTCに揃えることのテスト."""
+    dt = parse_feed_date(None, "Wed, 15 Jan 2025 21:00:00 +0900")
+
+    assert dt == datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+    assert dt is not None and dt.utcoffset() == timedelta(0)
+
+    assert parse_feed_date(None, "invalid date") is None
+    assert parse_feed_date(None, "") is None
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""DeliverySchedulerのテストコード."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+import pytest
+from pydantic import HttpUrl
+
+from src.business.delivery_scheduler import DeliveryScheduler
+from src.infrastructure.quota_manager import QuotaManager
+from src.models.keyword_config import NotificationTarget
+from src.models.news_article import NewsArticle
+from src.utils.date_helper import JST
+
+# 30日の月の16日正午（今日を含めて残り15日）
+NOW = datetime(2025, 4, 16, 12, 0, tzinfo=JST)
+
+
+def _articles(count: int, score: float = 0.5) -> List[NewsArticle]:
+    """テスト用の記事を作成."""
+    return [
+        NewsArticle(
+            title=f"記事{index}",
+            url=HttpUrl(f"https://example.com/news/{score}/{index}"),
+            published_date=NOW,
+            relevance_score=score,
+        )
+        for index in range(count)
+    ]
+
+
+def _target(name: str, priority: int = 0) -> NotificationTarget:
+    """通知先を作成."""
+    return NotificationTarget(name=name, line_user_id="U1", keywords=["AI"], priority=priority)
+
+
+@pytest.fixture
+def quota_manager(tmp_path: Path) -> QuotaManager:
+    """QuotaManagerのフィクスチャ."""
+    return QuotaManager(quota_file=str(tmp_path / "message_quota.json"))
+
+
+def test_forecast(quota_manager: QuotaManager) -> None:
+    """当月の利用状況と月末予測の算出テスト."""
+    quota_manager.record("line", 140, datetime(2025, 4, 1, 9, 0, tzinfo=JST))
+    quota_manager.record("line", 10, NOW)
+    quota_manager.record("line", 99, datetime(2025, 3, 31, 9, 0, tzinfo=JST))
+
+    forecast = DeliveryScheduler(quota_manager, monthly_quota=200).forecast(NOW)
+
+    assert forecast.period == "2025-04"
+    assert (forecast.used, forecast.used_today, forecast.remaining) == (150, 10, 50)
+    # 昨日までの残り60通を今日から月末までの15日で割る
+    assert forecast.daily_budget == pytest.approx(4.0)
+    assert forecast.get_today_remaining() == 0.0
+    assert forecast.projected == pytest.approx(150 * 30 / 15.5)
+
+
+def test_plan_sends_by_priority_and_defers_the_rest(quota_manager: QuotaManager) -> None:
+    """目安の範囲で優先順に送信し、超えた分を後回し・破棄するテスト."""
+    # 残り30通 / 15日 = 本日の目安2通
+    quota_manager.record("line", 170, datetime(2025, 4, 1, 9, 0, tzinfo=JST))
+    scheduler = DeliveryScheduler(quota_manager, monthly_quota=200, max_deferred_articles=2)
+
+    decisions = scheduler.plan(
+        [
+            (_target("low"), _articles(3, score=0.2)),
+            (_target("high_score"), _articles(1, score=0.9)),
+            (_target("urgent", priority=1), _articles(1, score=0.1)),
+            (_target("mid_score"), _articles(1, score=0.5)),
+            (_target("empty"), []),
+        ],
+        NOW,
+    )
+
+    assert [(d.target_name, d.action, len(d.articles)) for d in decisions] == [
+        ("urgent", "send", 1),
+        ("high_score", "send", 1),
+        ("mid_score", "defer", 1),
+        ("low", "defer", 2),
+        ("low", "drop", 1),
+    ]
+
+
+def test_plan_drops_when_month_is_exhausted(quota_manager: QuotaManager) -> None:
+    """当月の上限に達した場合は優先度に関係なく破棄するテスト."""
+    quota_manager.record("line", 200, datetime(2025, 4, 1, 9, 0, tzinfo=JST))
+    scheduler = DeliveryScheduler(quota_manager, monthly_quota=200)
+
+    decisions = scheduler.plan([(_target("urgent", priority=5), _articles(1))], NOW)
+
+    assert [(d.action, d.cost) for d in decisions] == [("drop", 0)]
+
+
+def test_plan_without_quota_sends_everything(quota_manager: QuotaManager) -> None:
+    """上限なしの場合はすべて送信するテスト."""
+    scheduler = DeliveryScheduler(quota_manager, monthly_quota=0)
+
+    decisions = scheduler.plan([(_target("a"), _articles(51)), (_target("b"), [])], NOW)
+
+    assert [(d.target_name, d.action, d.cost) for d in decisions] == [("a", "send", 2)]
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""DigestSchedulerのテストコード."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+import pytest
+from pydantic import HttpUrl, ValidationError
+
+from src.business.digest_scheduler import DigestScheduler
+from src.business.notifier import Notifier
+from src.infrastructure.cache_manager import CacheManager
+from src.infrastructure.digest_buffer_manager import DigestBufferManager
+from src.infrastructure.notification_channel import NotificationChannel
+from src.main import queue_target_notifications
+from src.models.keyword_config import NotificationTarget
+from src.models.news_article import NewsArticle
+from src.models.notification import Notification
+from src.utils.date_helper import JST
+
+
+class NullChannel(NotificationChannel):
+    """何も送信しないテスト用チャンネル."""
+
+    def send_notification(self, notification: Notification) -> None:
+        """通知を送信."""
+
+
+def _articles(*indices: int) -> List[NewsArticle]:
+    """テスト用の要約済み記事を作成."""
+    return [
+        NewsArticle(
+            title=f"記事{index}",
+            url=HttpUrl(f"https://example.com/news/{index}"),
+            published_date=datetime(2025, 1, 15, 0, 0, 0, tzinfo=timezone.utc),
+            summary=f"要約{index}",
+            summary_source="llm",
+        )
+        for index in indices
+    ]
+
+
+def _target(**kwargs: object) -> NotificationTarget:
+    """ダイジェストモードの通知先を作成."""
+    return NotificationTarget(name="digest", line_user_id="U1", keywords=["AI"], **kwargs)
+
+
+@pytest.fixture
+def buffer_file(tmp_path: Path) -> Path:
+    """バッファファイルのパス."""
+    return tmp_path / "digest_buffer.json"
+
+
+def test_collects_until_scheduled_time(buffer_file: Path) -> None:
+    """送信時刻までは蓄積し、時刻を過ぎた実行でまとめて返すテスト."""
+    scheduler = DigestScheduler(DigestBufferManager(str(buffer_file)))
+    target = _target(digest_times=["18:00", "08:00"])
+
+    assert scheduler.collect(target, _articles(1), datetime(2025, 1, 15, 9, 0, tzinfo=JST)) == []
+    assert scheduler.collect(target, _articles(2, 1), datetime(2025, 1, 15, 12, 0, tzinfo=JST)) == []
+    # 新しい記事が無い実行でも時刻を過ぎていれば送信する
+    released = scheduler.collect(target, [], datetime(2025, 1, 15, 18, 5, tzinfo=JST))
+
+    assert [article.title for article in released] == ["記事1", "記事2"]
+    assert released[0].summary == "要約1"
+    assert released[0].summary_source == "llm"
+
+    # 送信完了まではバッファに残り、別プロセスからも読み込める
+    assert len(DigestBufferManager(str(buffer_file)).get_articles("digest")) == 2
+    scheduler.mark_flushed(target)
+    assert DigestBufferManager(str(buffer_file)).get_articles("digest") == []
+
+
+def test_empty_buffer_waits_for_next_scheduled_time(buffer_file: Path) -> None:
+    """送信時刻の後に蓄積を始めた記事は次の送信時刻まで待つテスト."""
+    scheduler = DigestScheduler(DigestBufferManager(str(buffer_file)))
+    target = _target(digest_times=["08:00"])
+
+    assert scheduler.collect(target, [], datetime(2025, 1, 15, 9, 0, tzinfo=JST)) == []
+    assert scheduler.collect(target, _articles(1), datetime(2025, 1, 15, 10, 0, tzinfo=JST)) == []
+    assert scheduler.collect(target, [], datetime(2025, 1, 16, 7, 59, tzinfo=JST)) == []
+    assert len(scheduler.collect(target, [], datetime(2025, 1, 16, 8, 0, tzinfo=JST))) == 1
+
+
+def test_releases_when_size_threshold_reached(buffer_file: Path) -> None:
+    """蓄積記事数が上限に達した時点で送信するテスト."""
+    scheduler = DigestScheduler(DigestBufferManager(str(buffer_file)))
+    target = _target(digest_max_articles=3)
+    now = datetime(2025, 1, 15, 9, 0, tzinfo=JST)
+
+    assert scheduler.collect(target, _articles(1, 2), now) == []
+    assert len(scheduler.collect(target, _articles(3), now)) == 3
+
+
+def test_digest_times_validation() -> None:
+    """送信時刻の形式が検証されることのテスト."""
+    assert _target(digest_times=["08:00", "08:00"]).digest_times == ["08:00"]
+    assert _target(digest_max_articles=5).is_digest_mode()
+    assert not _target().is_digest_mode()
+    with pytest.raises(ValidationError):
+        _target(digest_times=["8:00"])
+
+
+def test_queue_resends_held_articles_only_to_failed_channel(buffer_file: Path, tmp_path: Path) -> None:
+    """一部のチャンネルで届かなかった記事を、次回そのチャンネルにだけ再送するテスト."""
+    scheduler = DigestScheduler(DigestBufferManager(str(buffer_file)))
+    target = _target()
+    slack = NullChannel("slack:digest")
+    email = NullChannel("email:digest")
+    notifier = Notifier(None, CacheManager(str(tmp_path / "notified_urls.json")))  # type: ignore[arg-type]
+    scheduler.hold_for_channel(target, "slack:digest", _articles(1), datetime(2025, 1, 15, tzinfo=JST))
+
+    queue_target_notifications(notifier, scheduler, target, _articles(2), [slack, email])
+    # 再送する記事は今回の記事と別の通知になり、他のチャンネルには送らない
+    assert [
+        ([a.title for a in notification.articles], [c.name for c in channels])
+        for notification, channels in notifier._pending
+    ] == [(["記事1", "記事2"], ["slack:digest"]), (["記事2"], ["email:digest"])]
+
+    scheduler.release_held(target, "slack:digest")
+    assert scheduler.get_held(target, "slack:digest") == []
+    # 通知先の蓄積記事とは別に保持する
+    assert scheduler.buffer_manager.get_articles(target.name) == []
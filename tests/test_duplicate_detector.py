@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""DuplicateDetectorのテストコード."""
+
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import HttpUrl
+
+from src.business.duplicate_detector import DuplicateDetector
+from src.models.news_article import NewsArticle
+
+
+@pytest.fixture
+def duplicate_detector() -> DuplicateDetector:
+    """DuplicateDetectorのフィクスチャ."""
+    return DuplicateDetector()
+
+
+def _article(index: int, title: str, score: float = 0.5) -> NewsArticle:
+    """テスト用の記事を作成."""
+    return NewsArticle(
+        title=title,
+        url=HttpUrl(f"https://example.com/news/{index}"),
+        published_date=datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+        relevance_score=score,
+    )
+
+
+def test_deduplicate_keeps_one_per_story(duplicate_detector: DuplicateDetector) -> None:
+    """同一ニュースの別配信元が1件に集約されることのテスト."""
+    articles = [
+        _article(1, "政府、生成AIの利用ガイドラインを公表 - 日本経済新聞", score=0.5),
+        _article(2, "政府、生成AIの利用ガイドラインを公表 - NHKニュース", score=0.8),
+        _article(3, "政府が生成AIの利用ガイドラインを公表 - 読売新聞", score=0.3),
+        _article(4, "プロ野球、開幕戦の結果まとめ - スポーツ報知", score=0.1),
+    ]
+
+    kept = duplicate_detector.deduplicate(articles)
+
+    assert len(kept) == 2
+    # クラスタ内で最もスコアの高い記事が代表になる
+    assert kept[0].get_url_string() == "https://example.com/news/2"
+    assert kept[1].get_url_string() == "https://example.com/news/4"
+    # 除外した記事は代表記事と一緒に通知済みにするため代表記事に保持する
+    assert sorted(kept[0].duplicate_urls) == [
+        "https://example.com/news/1",
+        "https://example.com/news/3",
+    ]
+    assert kept[1].duplicate_urls == []
+
+
+def test_deduplicate_distinct_articles(duplicate_detector: DuplicateDetector) -> None:
+    """異なるニュースはすべて残ることのテスト."""
+    articles = [
+        _article(1, "Python 3.13がリリース"),
+        _article(2, "AI半導体の需要が拡大"),
+        _article(3, "新型スマートフォンが発表"),
+    ]
+
+    kept = duplicate_detector.deduplicate(articles)
+
+    assert kept == articles
+
+
+def test_invalid_band_configuration() -> None:
+    """num_permがbandsで割り切れない場合のテスト."""
+    with pytest.raises(ValueError):
+        DuplicateDetector(num_perm=64, bands=10)
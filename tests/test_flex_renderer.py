@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""flex_renderer・LineClientのテストコード."""
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import pytest
+from linebot.v3.messaging import (
+    FlexBubble,
+    FlexButton,
+    FlexCarousel,
+    FlexMessage,
+    URIAction,
+)
+from linebot.v3.messaging.models import FlexBox, FlexText
+from pydantic import HttpUrl
+
+from src.infrastructure.flex_renderer import encode_json, render_flex_message
+from src.infrastructure.line_client import DeliveryError, LineClient
+from src.models.news_article import NewsArticle
+from src.utils.date_helper import format_datetime_jst
+
+
+def _sdk_bubble(article: NewsArticle, index: int) -> FlexBubble:
+    """SDKのモデルでバブルを作成（比較用の参照実装）."""
+    title = article.title[:60] + "..." if len(article.title) > 60 else article.title
+    summary = article.summary or article.description
+    summary = summary[:150] + "..." if len(summary) > 150 else summary
+    if article.is_summary_degraded():
+        summary = f"【簡易要約】{summary}"
+
+    return FlexBubble(
+        header=FlexBox(
+            layout="vertical",
+            contents=[FlexText(text=f"📰 ニュース #{index}", size="sm", color="#1DB446")],
+        ),
+        body=FlexBox(
+            layout="vertical",
+            contents=[
+                FlexText(text=title, size="lg", weight="bold", wrap=True),
+                FlexBox(
+                    layout="vertical",
+                    margin="md",
+                    spacing="sm",
+                    contents=[
+                        FlexText(text=summary, size="sm", color="#666666", wrap=True),
+                        FlexText(
+                            text=format_datetime_jst(article.published_date),
+                            size="xs",
+                            color="#999999",
+                            margin="md",
+                        ),
+                    ],
+                ),
+            ],
+        ),
+        footer=FlexBox(
+            layout="vertical",
+            spacing="sm",
+            contents=[
+                FlexButton(
+                    style="primary",
+                    action=URIAction(label="記事を読む", uri=article.get_url_string()),
+                )
+            ],
+        ),
+    )
+
+
+def _articles(count: int) -> List[NewsArticle]:
+    """テスト用の記事を作成."""
+    articles = []
+    for i in range(count):
+        article = NewsArticle(
+            title=f"記事{i} " + "長いタイトル" * (i * 3),
+            url=HttpUrl(f"https://example.com/news/{i}"),
+            published_date=datetime(2025, 1, 15, 12, i, 0, tzinfo=timezone.utc),
+            description="説明文" * (i * 20),
+        )
+        if i % 2 == 0:
+            article.summary = f"要約{i}"
+            article.summary_source = "llm" if i % 4 == 0 else "extractive"
+        articles.append(article)
+    return articles
+
+
+def test_render_flex_message_matches_sdk() -> None:
+    """SDKのモデルをシリアライズした結果と一致することのテスト."""
+    articles = _articles(12)
+
+    expected = FlexMessage(
+        alt_text="main_channel: 12件の新着ニュース",
+        contents=FlexCarousel(
+            contents=[_sdk_bubble(a, i + 1) for i, a in enumerate(articles[:10])]
+        ),
+    ).to_dict()
+
+    rendered = render_flex_message(articles, "main_channel")
+
+    assert rendered == expected
+    assert json.loads(encode_json(rendered)) == expected
+
+
+class FakeResponse:
+    """テスト用のHTTPレスポンス."""
+
+    def __init__(self, status_code: int) -> None:
+        """初期化."""
+        self.status_code = status_code
+        self.headers: Dict[str, str] = {"Retry-After": "3"}
+        self.text = ""
+
+
+class FakeSession:
+    """送信内容を記録するテスト用セッション."""
+
+    def __init__(self, fail_after: Optional[int] = None) -> None:
+        """初期化."""
+        self.fail_after = fail_after
+        self.requests: List[Dict[str, Any]] = []
+
+    def post(
+        self,
+        url: str,
+        data: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> FakeResponse:
+        """POSTリクエスト（fail_after回目以降は400を返す）."""
+        if self.fail_after is not None and len(self.requests) >= self.fail_after:
+            return FakeResponse(400)
+        self.requests.append({"url": url, "body": json.loads(data)})
+        return FakeResponse(200)
+
+
+def test_line_client_posts_rendered_json() -> None:
+    """組み立てたJSONをそのまま送信することのテスト."""
+    client = LineClient("dummy")
+    session = FakeSession()
+    client.session = session  # type: ignore[assignment]
+    articles = _articles(2)
+
+    client.send_news_notification("U1", articles, "main_channel")
+
+    assert session.requests == [
+        {
+            "url": "https://api.line.me/v2/bot/message/push",
+            "body": {"to": "U1", "messages": [render_flex_message(articles, "main_channel")]},
+        }
+    ]
+
+
+def test_line_client_packs_carousels_into_requests() -> None:
+    """10件を超える記事を複数カルーセル・1リクエスト5メッセージにまとめるテスト."""
+    client = LineClient("dummy")
+    session = FakeSession()
+    client.session = session  # type: ignore[assignment]
+    articles = _articles(55)
+
+    delivered = client.send_news_notification("U1", articles, "main_channel")
+
+    assert delivered == articles
+    assert [len(r["body"]["messages"]) for r in session.requests] == [5, 1]
+    bubbles = [
+        bubble
+        for request in session.requests
+        for message in request["body"]["messages"]
+        for bubble in message["contents"]["contents"]
+    ]
+    assert len(bubbles) == 55
+    assert bubbles[54]["header"]["contents"][0]["text"] == "📰 ニュース #55"
+    assert session.requests[0]["body"]["messages"][0]["altText"] == (
+        "main_channel: 55件の新着ニュース (1/6)"
+    )
+    # 通知先の名前が空の場合（マルチキャスト）は代替テキストに含めない
+    assert render_flex_message(articles[:3], "")["altText"] == "3件の新着ニュース"
+
+
+def test_line_client_reports_partially_delivered_articles() -> None:
+    """途中のリクエストが失敗した場合に送信済みの記事を返すテスト."""
+    client = LineClient("dummy")
+    client.session = FakeSession(fail_after=1)  # type: ignore[assignment]
+    articles = _articles(60)
+
+    with pytest.raises(DeliveryError) as exc_info:
+        client.send_news_notification("U1", articles, "main_channel")
+
+    assert exc_info.value.delivered_articles == articles[:50]
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""GoogleNewsClientのテストコード."""
+
+import socket
+import time
+import urllib.error
+from typing import List
+from urllib.parse import unquote
+
+import feedparser
+import pytest
+
+from src.infrastructure.google_news_client import GoogleNewsClient
+from src.infrastructure.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Resilience,
+    RetryPolicy,
+    ServiceError,
+)
+
+
+def _entry(index: int) -> feedparser.FeedParserDict:
+    """テスト用のRSSエントリーを作成."""
+    return feedparser.FeedParserDict(
+        title=f"ニュース{index}",
+        link=f"https://example.com/news/{index}",
+        summary=f"説明文{index}",
+        published="Wed, 15 Jan 2025 12:00:00 GMT",
+        published_parsed=time.strptime("2025-01-15 12:00:00", "%Y-%m-%d %H:%M:%S"),
+    )
+
+
+@pytest.fixture
+def requested_queries() -> list[str]:
+    """リクエストされた検索クエリを記録するリストのフィクスチャ."""
+    return []
+
+
+@pytest.fixture
+def google_news_client(
+    monkeypatch: pytest.MonkeyPatch, requested_queries: list[str]
+) -> GoogleNewsClient:
+    """feedparserをスタブ化したGoogleNewsClientのフィクスチャ."""
+    feeds = {
+        "AI": [_entry(1), _entry(2), _entry(3)],
+        "Python": [_entry(3), _entry(4)],
+    }
+
+    def fake_parse(url: str) -> feedparser.FeedParserDict:
+        query = unquote(url.split("q=")[1].split("&")[0])
+        requested_queries.append(query)
+        entries = []
+        for keyword in query.split(" OR "):
+            entries.extend(feeds.get(keyword.strip('"'), []))
+        return feedparser.FeedParserDict(bozo=False, entries=entries)
+
+    monkeypatch.setattr(feedparser, "parse", fake_parse)
+    return GoogleNewsClient()
+
+
+def test_fetch_news_for_keywords_dedup(
+    google_news_client: GoogleNewsClient, requested_queries: list[str]
+) -> None:
+    """キーワードがOR検索にまとめられ、重複したURLが除去されることのテスト."""
+    articles = google_news_client.fetch_news_for_keywords(["AI", "Python"])
+
+    urls = [article.get_url_string() for article in articles]
+    assert urls == [f"https://example.com/news/{i}" for i in range(1, 5)]
+    assert requested_queries == ["AI OR Python"]
+
+
+def test_fetch_news_for_keywords_fallback_on_cap(
+    google_news_client: GoogleNewsClient, requested_queries: list[str]
+) -> None:
+    """まとめた検索結果が上限に達した場合にキーワードごとに再取得することのテスト."""
+    google_news_client.FEED_ITEM_CAP = 5
+
+    articles = google_news_client.fetch_news_for_keywords(["AI", "Python"])
+
+    assert len(articles) == 4
+    assert requested_queries == ["AI OR Python", "AI", "Python"]
+
+
+def test_fetch_news_for_keywords_skips_known_urls(
+    google_news_client: GoogleNewsClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """既知のURLは記事データに変換されないことのテスト."""
+    known_urls = {"https://example.com/news/1", "https://example.com/news/4"}
+    parsed_links = []
+    original_parse_entry = google_news_client._parse_entry
+
+    def spy_parse_entry(entry: feedparser.FeedParserDict):  # type: ignore
+        parsed_links.append(entry["link"])
+        return original_parse_entry(entry)
+
+    monkeypatch.setattr(google_news_client, "_parse_entry", spy_parse_entry)
+
+    articles = google_news_client.fetch_news_for_keywords(
+        ["AI", "Python"], is_known_url=known_urls.__contains__
+    )
+
+    urls = [article.get_url_string() for article in articles]
+    assert urls == ["https://example.com/news/2", "https://example.com/news/3"]
+    # 既知のURLと、別キーワードで取得済みのURLは変換されない
+    assert parsed_links == ["https://example.com/news/2", "https://example.com/news/3"]
+
+
+def test_fetch_news_for_keywords_shares_feeds(
+    google_news_client: GoogleNewsClient, requested_queries: list[str]
+) -> None:
+    """複数の通知先で共有するキーワードのフィードを1回だけ取得することのテスト."""
+    shared_keywords = {"AI"}
+
+    first = google_news_client.fetch_news_for_keywords(["AI", "Python"], shared_keywords=shared_keywords)
+    # 2件目の通知先は通知済みのURLを除いて、取得済みのフィードから記事を作る
+    second = google_news_client.fetch_news_for_keywords(
+        ["AI"], is_known_url={"https://example.com/news/1"}.__contains__, shared_keywords=shared_keywords
+    )
+
+    assert len(first) == 4
+    assert [article.get_url_string() for article in second] == [
+        "https://example.com/news/2",
+        "https://example.com/news/3",
+    ]
+    assert requested_queries == ["AI", "Python"]
+
+
+@pytest.mark.parametrize(
+    "failed_feed",
+    [
+        # DNSの名前解決・接続の失敗はbozo_exceptionのURLErrorとして返される
+        feedparser.FeedParserDict(bozo=True, bozo_exception=urllib.error.URLError(socket.gaierror()), entries=[]),
+        feedparser.FeedParserDict(
+            bozo=True, bozo_exception=urllib.error.URLError(ConnectionRefusedError()), entries=[]
+        ),
+        feedparser.FeedParserDict(bozo=False, status=503, entries=[]),
+    ],
+)
+def test_feed_outage_is_retried_and_opens_circuit(
+    monkeypatch: pytest.MonkeyPatch, failed_feed: feedparser.FeedParserDict
+) -> None:
+    """フィードの通信エラー・HTTP 5xxをリトライし、続く場合はサーキットが開くことのテスト."""
+    calls: List[str] = []
+
+    def failing_parse(url: str) -> feedparser.FeedParserDict:
+        calls.append(url)
+        return failed_feed
+
+    monkeypatch.setattr(feedparser, "parse", failing_parse)
+    sleeps: List[float] = []
+    resilience = Resilience(
+        CircuitBreaker("google_news", failure_threshold=2),
+        RetryPolicy(max_attempts=3, base_delay=0.1),
+        sleep=sleeps.append,
+    )
+    client = GoogleNewsClient(resilience=resilience)
+
+    for _ in range(2):
+        with pytest.raises((OSError, ServiceError)):
+            client.fetch_news("AI")
+    assert len(calls) == 6
+    assert len(sleeps) == 4
+    assert resilience.circuit_breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        client.fetch_news("AI")
+    assert len(calls) == 6
+
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""GoogleNewsQueryPlannerのテストコード."""
+
+from src.infrastructure.google_news_query_planner import GoogleNewsQueryPlanner
+
+
+def _url_builder(query: str) -> str:
+    """テスト用のURL構築関数."""
+    return f"https://news.google.com/rss/search?q={query}"
+
+
+def test_build_query() -> None:
+    """OR検索クエリの構築テスト."""
+    assert GoogleNewsQueryPlanner.build_query(["AI"]) == "AI"
+    assert (
+        GoogleNewsQueryPlanner.build_query(["AI", "machine learning"])
+        == 'AI OR "machine learning"'
+    )
+
+
+def test_plan_groups_by_keyword_count() -> None:
+    """1クエリあたりのキーワード数の上限でグループ化されることのテスト."""
+    planner = GoogleNewsQueryPlanner(url_builder=_url_builder, max_keywords_per_query=2)
+
+    groups = planner.plan(["AI", "Python", "機械学習", "AI"])
+
+    assert groups == [["AI", "Python"], ["機械学習"]]
+
+
+def test_plan_groups_by_url_length() -> None:
+    """URL長の上限でグループ化されることのテスト."""
+    base_length = len(_url_builder(""))
+    planner = GoogleNewsQueryPlanner(
+        url_builder=_url_builder, max_url_length=base_length + len("aaaa OR bbbb")
+    )
+
+    groups = planner.plan(["aaaa", "bbbb", "cccc"])
+
+    assert groups == [["aaaa", "bbbb"], ["cccc"]]
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""html_cleanerのテストコード."""
+
+from src.utils.html_cleaner import clean_description, extract_main_text, strip_html
+
+
+def test_strip_html() -> None:
+    """タグ除去と文字参照のデコードのテスト."""
+    assert strip_html("<p>AI&amp;ロボット</p>&nbsp;<b>最新</b>") == "AI&ロボット 最新"
+    assert strip_html("  プレーン  テキスト ") == "プレーン テキスト"
+    assert strip_html("<script>alert(1)</script>本文") == "本文"
+
+
+def test_clean_description_drops_repeated_title_and_source() -> None:
+    """Google News形式の説明文からタイトルと配信元の重複を除去するテスト."""
+    title = "新型AIモデルを発表 - テックニュース"
+    description = (
+        '<a href="https://news.google.com/rss/articles/abc" target="_blank">'
+        "新型AIモデルを発表</a>&nbsp;&nbsp;"
+        '<font color="#6f6f6f">テックニュース</font>'
+    )
+
+    assert clean_description(description, title) == ""
+
+
+def test_clean_description_keeps_body_text() -> None:
+    """本文がある場合は本文を残すテスト."""
+    title = "新型AIモデルを発表 - テックニュース"
+    description = "<p>新型AIモデルを発表 性能が大幅に向上した。</p> テックニュース"
+
+    assert clean_description(description, title) == "性能が大幅に向上した。"
+    assert clean_description("<p>本文のみ</p>") == "本文のみ"
+
+
+def test_extract_main_text() -> None:
+    """ナビゲーションや短い段落を除いて本文を抽出するテスト."""
+    page = (
+        "<html><head><script>var x = '<p>スクリプト内の段落です。これは本文ではありません。</p>';</script></head>"
+        "<body><nav><p>トップ ニュース 経済 スポーツ エンタメ 天気</p></nav>"
+        "<article><h1>見出し</h1><p>新型AIモデルが発表され、性能が大幅に向上した。</p>"
+        "<p>広告</p><p>開発元によると、&quot;推論速度&quot;は従来の2倍になるという。</p></article>"
+        "<footer><p>Copyright Example News. All rights reserved.</p></footer></body></html>"
+    )
+
+    assert extract_main_text(page) == (
+        "新型AIモデルが発表され、性能が大幅に向上した。\n"
+        '開発元によると、"推論速度"は従来の2倍になるという。'
+    )
+    assert extract_main_text("<html><body>本文なし</body></html>") == ""
@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 """KeywordConfigモデルのテストコード."""
 
+import os
+from pathlib import Path
+
 import pytest
 
+from src.infrastructure.keyword_config_loader import KeywordConfigLoader
 from src.models.keyword_config import KeywordConfig, NotificationTarget
 
 
@@ -109,3 +113,91 @@ def test_get_target_by_name() -> None:
     # 存在しない名前
     target_none = config.get_target_by_name("channel3")
     assert target_none is None
+
+
+def _config() -> KeywordConfig:
+    """索引のテスト用のキーワード設定を作成."""
+    return KeywordConfig(
+        notification_targets=[
+            NotificationTarget(name="channel1", line_user_id="U1", keywords=["AI", "Python"]),
+            NotificationTarget(name="channel2", line_user_id="U2", keywords=["ChatGPT", "機械学習"]),
+            NotificationTarget(name="channel3", line_user_id="U1", keywords=["半導体"]),
+        ]
+    )
+
+
+def test_lookup_indices() -> None:
+    """名前・LINE User IDから通知先を引く索引のテスト."""
+    config = _config()
+
+    assert config.get_target_by_name("channel2") is config.notification_targets[1]
+    assert [target.name for target in config.get_targets_by_user("U1")] == ["channel1", "channel3"]
+    assert config.get_targets_by_user("U9") == []
+    assert config.get_all_keywords() == ["AI", "Python", "ChatGPT", "機械学習", "半導体"]
+
+
+def test_get_targets_by_keyword() -> None:
+    """キーワードから通知先を引く索引のテスト."""
+    config = KeywordConfig(
+        notification_targets=[
+            NotificationTarget(name="channel1", line_user_id="U1", keywords=["AI", "Python"]),
+            NotificationTarget(name="channel2", line_user_id="U2", keywords=["ＡＩ", "半導体"]),
+        ]
+    )
+
+    # 全角・大文字小文字の揺れは正規化して同じキーワードとみなす
+    assert [target.name for target in config.get_targets_by_keyword("ai")] == ["channel1", "channel2"]
+    assert [target.name for target in config.get_targets_by_keyword("半導体")] == ["channel2"]
+    assert config.get_targets_by_keyword("量子") == []
+
+
+def test_reuse_index_updates_changed_targets() -> None:
+    """再読み込み時に、変更のあった通知先の分だけ索引を更新することのテスト."""
+    previous = _config()
+    previous.get_all_keywords()
+    current = KeywordConfig(
+        notification_targets=[
+            NotificationTarget(name="channel1", line_user_id="U1", keywords=["AI", "Python"]),
+            NotificationTarget(name="channel2", line_user_id="U1", keywords=["AI"]),
+            NotificationTarget(name="channel4", line_user_id="U3", keywords=["量子"]),
+        ]
+    )
+
+    current.reuse_index(previous)
+
+    channel1, channel2, channel4 = current.notification_targets
+    assert channel1 is previous.notification_targets[0]
+    assert current.get_target_by_name("channel2") is channel2
+    assert current.get_target_by_name("channel3") is None
+    assert current.get_targets_by_user("U1") == [channel1, channel2]
+    assert current.get_targets_by_user("U2") == []
+    assert current.get_targets_by_keyword("AI") == [channel1, channel2]
+    assert current.get_targets_by_keyword("機械学習") == []
+    assert current.get_targets_by_keyword("量子") == [channel4]
+    assert current.get_all_keywords() == ["AI", "Python", "量子"]
+
+
+def test_loader_reloads_changed_file(tmp_path: Path) -> None:
+    """設定ファイルの変更時だけ再読み込みし、変更の無い通知先を引き継ぐことのテスト."""
+    config_file = tmp_path / "keywords.yaml"
+    target_a = "  - name: a\n    line_user_id: U1\n    keywords: [AI]\n"
+    config_file.write_text(f"notification_targets:\n{target_a}", encoding="utf-8")
+    loader = KeywordConfigLoader(str(config_file))
+
+    first = loader.get_config()
+    assert loader.get_config() is first
+
+    config_file.write_text(
+        f"notification_targets:\n{target_a}  - name: b\n    line_user_id: U2\n    keywords: [半導体]\n",
+        encoding="utf-8",
+    )
+    os.utime(config_file, ns=(0, 10**18))
+    second = loader.get_config()
+
+    assert [target.name for target in second.notification_targets] == ["a", "b"]
+    assert second.get_target_by_name("a") is first.get_target_by_name("a")
+
+    # 不正な内容に変更された場合は前回の設定を使い続ける
+    config_file.write_text("notification_targets: []\n", encoding="utf-8")
+    os.utime(config_file, ns=(0, 2 * 10**18))
+    assert loader.get_config() is second
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""LLMクライアントのテストコード."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from src.infrastructure import llm_client as llm_client_module
+from src.infrastructure.llm_client import GeminiClient, OllamaClient
+from src.models.prompt_template import SUMMARY_PROMPT_TEMPLATE
+
+
+class FakeResponse:
+    """テスト用のHTTPレスポンス."""
+
+    status_code = 200
+    headers: Dict[str, str] = {}
+
+    def raise_for_status(self) -> None:
+        """ステータスの確認."""
+
+    def json(self) -> Dict[str, str]:
+        """レスポンスボディ."""
+        return {"response": " 要約文 "}
+
+
+def test_prompt_template_cache_key() -> None:
+    """プロンプトテンプレートの識別子と入力部分のテスト."""
+    assert SUMMARY_PROMPT_TEMPLATE.cache_key == "news_summary:v1"
+    rendered = SUMMARY_PROMPT_TEMPLATE.render("本文")
+    assert "本文" in rendered
+    assert SUMMARY_PROMPT_TEMPLATE.system_instruction not in rendered
+
+
+def test_ollama_sends_system_prompt_separately(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ollamaにシステム指示を分けて渡すことのテスト."""
+    requests_sent: List[Dict[str, Any]] = []
+
+    def fake_post(url: str, json: Dict[str, Any], timeout: int) -> FakeResponse:
+        requests_sent.append(json)
+        return FakeResponse()
+
+    monkeypatch.setattr(llm_client_module.requests, "post", fake_post)
+    client = OllamaClient(api_url="http://localhost:11434", model="llama2")
+
+    assert client.summarize("記事A") == "要約文"
+    assert client.summarize("記事B") == "要約文"
+
+    # 共通部分（system）は毎回同一で、記事ごとの部分だけが変わる
+    assert requests_sent[0]["system"] == SUMMARY_PROMPT_TEMPLATE.system_instruction
+    assert requests_sent[0]["system"] == requests_sent[1]["system"]
+    assert requests_sent[0]["prompt"] == SUMMARY_PROMPT_TEMPLATE.render("記事A")
+    assert requests_sent[0]["keep_alive"] == "10m"
+
+
+def test_gemini_falls_back_to_system_instruction() -> None:
+    """コンテキストキャッシュを作成できない場合にsystem_instructionで渡すテスト."""
+
+    class FailingCaches:
+        def create(self, **kwargs: Any) -> None:
+            raise RuntimeError("cached content is too small")
+
+    client = GeminiClient(api_key="dummy", use_context_cache=True)
+    client.client = type("FakeClient", (), {"caches": FailingCaches()})()
+
+    config = client._get_generate_config()
+
+    assert config.system_instruction == SUMMARY_PROMPT_TEMPLATE.system_instruction
+    assert config.cached_content is None
+    assert client.use_context_cache is False
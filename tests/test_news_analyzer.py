@@ -93,3 +93,66 @@ def test_filter_by_threshold(
     for article in filtered:
         assert article.relevance_score is not None
         assert article.relevance_score >= 0.5
+
+
+def test_calculate_relevance_score_normalized(news_analyzer: NewsAnalyzer) -> None:
+    """全角・半角の違いを吸収してマッチすることのテスト."""
+    article = NewsArticle(
+        title="ＰＹＴＨＯＮ最新版がリリース",
+        url=HttpUrl("https://example.com/news/4"),
+        published_date=datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+        description="ｷｶｲｶﾞｸｼｭｳ向けの改善",
+    )
+
+    score = news_analyzer._calculate_relevance_score(article, ["Python", "キカイガクシュウ"])
+    assert score == 1.0
+
+
+def _scored_article(index: int, score: float) -> NewsArticle:
+    """スコア付きのテスト用記事を作成."""
+    return NewsArticle(
+        title=f"記事{index}",
+        url=HttpUrl(f"https://example.com/news/{index}"),
+        published_date=datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+        description="説明文",
+        relevance_score=score,
+    )
+
+
+def test_select_top_articles(news_analyzer: NewsAnalyzer) -> None:
+    """ヒープによる上位記事選択のテスト."""
+    articles = [
+        _scored_article(i, score)
+        for i, score in enumerate([0.2, 0.0, 0.9, 0.5, 0.5, 0.7, 0.1])
+    ]
+
+    selected = news_analyzer.select_top_articles(articles, max_articles=3, threshold=0.2)
+
+    # スコア降順、同点は先に現れた記事を優先
+    assert [a.title for a in selected] == ["記事2", "記事5", "記事3"]
+
+
+def test_select_top_articles_excludes_zero_score(news_analyzer: NewsAnalyzer) -> None:
+    """スコア0の記事は閾値0でも選択されないことのテスト."""
+    articles = [_scored_article(0, 0.0), _scored_article(1, 0.3)]
+
+    selected = news_analyzer.select_top_articles(articles, max_articles=10)
+
+    assert [a.title for a in selected] == ["記事1"]
+
+
+def test_select_top_articles_token_budget(news_analyzer: NewsAnalyzer) -> None:
+    """トークン予算に収まる記事だけが選択されることのテスト."""
+    articles = [_scored_article(i, score) for i, score in enumerate([0.9, 0.8, 0.7])]
+
+    selected = news_analyzer.select_top_articles(
+        articles,
+        max_articles=10,
+        token_budget=250,
+        token_estimator=lambda article: 100,
+    )
+
+    assert [a.title for a in selected] == ["記事0", "記事1"]
+
+    with pytest.raises(ValueError):
+        news_analyzer.select_top_articles(articles, max_articles=10, token_budget=100)
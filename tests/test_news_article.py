@@ -61,3 +61,20 @@ def test_get_url_string() -> None:
     )
 
     assert article.get_url_string() == "https://example.com/news/1"
+
+
+def test_get_normalized_text() -> None:
+    """正規化済みテキストの取得とキャッシュ更新のテスト."""
+    article = NewsArticle(
+        title="ＰｙｔｈｏｎとＡＩ",
+        url=HttpUrl("https://example.com/news/1"),
+        published_date=datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+        description="「機械学習」の最新動向",
+    )
+
+    assert article.get_normalized_title() == "pythonトai"
+    assert article.get_normalized_text() == "pythonトai 機械学習 ノ最新動向"
+
+    # フィールドが変更された場合は再計算される
+    article.description = "ディープラーニング"
+    assert article.get_normalized_text() == "pythonトai ディープラーニング"
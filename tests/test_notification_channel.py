@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""通知チャンネルとNotifierの並行送信のテストコード."""
+
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+import requests
+from pydantic import HttpUrl, ValidationError
+
+from src.business.notifier import Notifier
+from src.infrastructure.cache_manager import CacheManager
+from src.infrastructure.line_client import DeliveryError
+from src.infrastructure.notification_channel import (
+    EmailChannel,
+    NotificationChannel,
+    SlackChannel,
+    WebhookChannel,
+)
+from src.models.keyword_config import ChannelConfig, NotificationTarget
+from src.models.news_article import NewsArticle
+from src.infrastructure.resilience import CircuitBreaker, Resilience, RetryPolicy
+from src.models.notification import Notification
+
+
+class FakeResponse:
+    """テスト用レスポンス."""
+
+    def __init__(self, status_code: int = 200) -> None:
+        """初期化."""
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        """エラーステータスの場合に例外を送出."""
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)  # type: ignore[arg-type]
+
+
+class FakeSession:
+    """送信内容を記録するテスト用セッション."""
+
+    def __init__(self, status_codes: Optional[List[int]] = None) -> None:
+        """初期化（status_codesを指定した場合は、順に応答のステータスとして使う）."""
+        self.requests: List[Dict[str, Any]] = []
+        self.status_codes = list(status_codes or [])
+
+    def post(
+        self,
+        url: str,
+        data: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> FakeResponse:
+        """POSTリクエスト."""
+        self.requests.append({"url": url, "body": json.loads(data)})
+        return FakeResponse(self.status_codes.pop(0) if self.status_codes else 200)
+
+
+class RecordingChannel(NotificationChannel):
+    """送信した通知先を記録するテスト用チャンネル."""
+
+    def __init__(
+        self,
+        name: str,
+        failing_targets: tuple = (),
+        gate: Optional[threading.Event] = None,
+    ) -> None:
+        """初期化（gateを指定した場合は、gateがセットされるまで送信を待つ）."""
+        super().__init__(name)
+        self.failing_targets = failing_targets
+        self.gate = gate
+        self.sent: List[str] = []
+
+    def send_notification(self, notification: Notification) -> None:
+        """通知を送信."""
+        if self.gate is not None and not self.gate.wait(timeout=5):
+            raise TimeoutError("gate timeout")
+        if notification.target_name in self.failing_targets:
+            raise requests.ConnectionError("send failed")
+        self.sent.append(notification.target_name)
+
+
+def _articles(*indices: int) -> List[NewsArticle]:
+    """テスト用の記事を作成."""
+    return [
+        NewsArticle(
+            title=f"記事{index}",
+            url=HttpUrl(f"https://example.com/news/{index}"),
+            published_date=datetime(2025, 1, 15, 3, 0, 0, tzinfo=timezone.utc),
+            summary=f"要約{index}",
+            relevance_score=0.5,
+        )
+        for index in indices
+    ]
+
+
+@pytest.fixture
+def cache_manager(tmp_path: Path) -> CacheManager:
+    """CacheManagerのフィクスチャ."""
+    return CacheManager(cache_file=str(tmp_path / "notified_urls.json"))
+
+
+def test_flush_fans_out_concurrently(cache_manager: CacheManager) -> None:
+    """遅いチャンネルを待たずに他のチャンネルが送信されることのテスト."""
+    gate = threading.Event()
+    slow = RecordingChannel("slow", gate=gate)
+
+    class ReleasingChannel(RecordingChannel):
+        """送信時に遅いチャンネルを解放するチャンネル."""
+
+        def send_notification(self, notification: Notification) -> None:
+            super().send_notification(notification)
+            gate.set()
+
+    fast = ReleasingChannel("fast")
+    notifier = Notifier(None, cache_manager)  # type: ignore[arg-type]
+
+    notifier.queue_notification("team_a", "U1", _articles(1), channels=[slow, fast])
+    errors = notifier.flush()
+
+    # 直列に送信していれば、slowがfastの送信を待ち続けてタイムアウトする
+    assert errors == {}
+    assert slow.sent == ["team_a"] and fast.sent == ["team_a"]
+    assert set(notifier.channel_latencies) == {"slow", "fast"}
+    assert cache_manager.is_notified("https://example.com/news/1")
+
+
+def test_flush_reports_errors_per_target(cache_manager: CacheManager) -> None:
+    """全チャンネルで失敗した通知先のみエラーになり、一部のチャンネルの失敗は保持されるテスト."""
+    flaky = RecordingChannel("flaky", failing_targets=("team_a", "team_b"))
+    healthy = RecordingChannel("healthy")
+    notifier = Notifier(None, cache_manager)  # type: ignore[arg-type]
+
+    notifier.queue_notification("team_a", "U1", _articles(1), channels=[flaky, healthy])
+    notifier.queue_notification("team_b", "U2", _articles(2), channels=[flaky])
+    errors = notifier.flush()
+
+    assert sorted(errors) == ["team_b"]
+    assert healthy.sent == ["team_a"]
+    # healthyで届いた記事は通知済みになり、flakyで届かなかった記事は再送用に保持される
+    assert cache_manager.is_notified("https://example.com/news/1")
+    assert not cache_manager.is_notified("https://example.com/news/2")
+    assert list(notifier.channel_failures) == ["team_a"]
+    undelivered, error = notifier.channel_failures["team_a"]["flaky"]
+    assert [article.get_url_string() for article in undelivered] == ["https://example.com/news/1"]
+    assert isinstance(error, requests.ConnectionError)
+
+
+def test_slack_retries_each_message() -> None:
+    """Slackの2通目の失敗でリトライしても1通目を再送しないことのテスト."""
+    session = FakeSession(status_codes=[200, 503, 200])
+    resilience = Resilience(
+        CircuitBreaker("slack"), RetryPolicy(max_attempts=2, base_delay=0), sleep=lambda _: None
+    )
+    channel = SlackChannel(
+        "slack:team_a", "https://hooks.slack.test/x", session=session, resilience=resilience  # type: ignore[arg-type]
+    )
+    notification = Notification(
+        target_name="team_a", line_user_id="U1", articles=_articles(*range(1, 22))
+    )
+
+    assert channel.send([notification]) == {}
+    assert [len(r["body"]["blocks"]) for r in session.requests] == [41, 3, 3]
+
+    # リトライしても失敗した場合は、送信できたメッセージの記事を保持する
+    session = FakeSession(status_codes=[200, 503, 503])
+    channel.session = session  # type: ignore[assignment]
+    errors = channel.send([notification])
+    assert len(session.requests) == 3
+    assert isinstance(errors["team_a"], DeliveryError)
+    assert len(errors["team_a"].delivered_articles) == 20
+
+
+def test_slack_and_webhook_payloads() -> None:
+    """SlackとWebhookの送信内容のテスト."""
+    session = FakeSession()
+    notification = Notification(
+        target_name="team_a", line_user_id="U1", articles=_articles(*range(1, 22))
+    )
+
+    SlackChannel("slack:team_a", "https://hooks.slack.test/x", session=session).send(  # type: ignore[arg-type]
+        [notification]
+    )
+    WebhookChannel("webhook:team_a", "https://example.test/hook", session=session).send(  # type: ignore[arg-type]
+        [notification]
+    )
+
+    slack_first, slack_second, webhook = session.requests
+    assert slack_first["body"]["text"] == "team_a: 21件の新着ニュース"
+    assert len(slack_first["body"]["blocks"]) == 1 + 20 * 2
+    assert slack_second["body"]["blocks"][1]["text"]["text"].startswith(
+        "*21. <https://example.com/news/21|記事21>*"
+    )
+    assert webhook["url"] == "https://example.test/hook"
+    assert webhook["body"]["articles"][0] == {
+        "title": "記事1",
+        "url": "https://example.com/news/1",
+        "published_date": "2025-01-15T03:00:00+00:00",
+        "summary": "要約1",
+        "summary_source": None,
+        "relevance_score": 0.5,
+    }
+
+
+def test_email_message() -> None:
+    """メールの作成テスト."""
+    channel = EmailChannel(
+        "email:team_a", recipients=["a@example.com", "b@example.com"], smtp_host="localhost"
+    )
+    message = channel.build_message(
+        Notification(target_name="team_a", line_user_id="U1", articles=_articles(1))
+    )
+
+    assert message["Subject"] == "[ニュース通知] team_a: 1件の新着ニュース"
+    assert message["To"] == "a@example.com, b@example.com"
+    assert "1. 記事1\n要約1\n" in message.get_content()
+
+
+def test_channel_config_validation() -> None:
+    """チャンネル設定の検証テスト."""
+    target = NotificationTarget(name="a", line_user_id="U1", keywords=["AI"])
+    assert [channel.type for channel in target.channels] == ["line"]
+    assert target.uses_line()
+
+    with pytest.raises(ValidationError):
+        ChannelConfig(type="slack")
+    with pytest.raises(ValidationError):
+        ChannelConfig(type="email")
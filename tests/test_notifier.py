@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Notifierのテストコード."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+from pydantic import HttpUrl
+
+from src.business.notifier import Notifier
+from src.infrastructure.cache_manager import CacheManager
+from src.infrastructure.line_client import DeliveryError
+from src.models.news_article import NewsArticle
+
+
+class FakeLineClient:
+    """送信内容を記録するテスト用LINEクライアント."""
+
+    def __init__(self, failing_user_ids: Tuple[str, ...] = ()) -> None:
+        """初期化."""
+        self.failing_user_ids = failing_user_ids
+        self.pushes: List[Tuple[str, List[str], str]] = []
+        self.multicasts: List[Tuple[List[str], List[str], str]] = []
+
+    def send_news_notification(
+        self, user_id: str, articles: List[NewsArticle], target_name: str
+    ) -> List[NewsArticle]:
+        """プッシュ送信（失敗する送信先は先頭の1件だけ送信できたことにする）."""
+        if user_id in self.failing_user_ids:
+            raise DeliveryError("push failed", articles[:1])
+        self.pushes.append((user_id, [a.get_url_string() for a in articles], target_name))
+        return articles
+
+    def multicast_news_notification(
+        self, user_ids: List[str], articles: List[NewsArticle], target_name: str
+    ) -> List[NewsArticle]:
+        """マルチキャスト送信."""
+        self.multicasts.append((user_ids, [a.get_url_string() for a in articles], target_name))
+        return articles
+
+
+def _articles(*indices: int) -> List[NewsArticle]:
+    """テスト用の記事を作成."""
+    return [
+        NewsArticle(
+            title=f"記事{index}",
+            url=HttpUrl(f"https://example.com/news/{index}"),
+            published_date=datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+            summary=f"要約{index}",
+        )
+        for index in indices
+    ]
+
+
+@pytest.fixture
+def cache_manager(tmp_path: Path) -> CacheManager:
+    """CacheManagerのフィクスチャ."""
+    return CacheManager(cache_file=str(tmp_path / "notified_urls.json"))
+
+
+def test_flush_groups_identical_content(cache_manager: CacheManager) -> None:
+    """同じ記事を受け取る通知先がマルチキャスト1回にまとまることのテスト."""
+    line_client = FakeLineClient()
+    notifier = Notifier(line_client, cache_manager)  # type: ignore[arg-type]
+
+    notifier.queue_notification("team_a", "U1", _articles(1, 2))
+    notifier.queue_notification("team_b", "U2", _articles(1, 2))
+    notifier.queue_notification("team_c", "U3", _articles(3))
+    notifier.queue_notification("team_d", "U4", [])
+
+    errors = notifier.flush()
+
+    assert errors == {}
+    assert line_client.multicasts == [
+        (
+            ["U1", "U2"],
+            ["https://example.com/news/1", "https://example.com/news/2"],
+            # 他の受信者の通知先の名前を含めない
+            "",
+        )
+    ]
+    assert line_client.pushes == [("U3", ["https://example.com/news/3"], "team_c")]
+    assert cache_manager.get_cache_size() == 3
+    # 送信待ちは空になる
+    assert notifier.flush() == {}
+
+
+def test_flush_reports_failed_targets(cache_manager: CacheManager) -> None:
+    """送信に失敗した通知先が返され、通知済みにならないことのテスト."""
+    line_client = FakeLineClient(failing_user_ids=("U1",))
+    notifier = Notifier(line_client, cache_manager)  # type: ignore[arg-type]
+
+    notifier.queue_notification("team_a", "U1", _articles(1, 3))
+    notifier.queue_notification("team_b", "U2", _articles(2))
+
+    errors = notifier.flush()
+
+    assert list(errors) == ["team_a"]
+    # 失敗するまでに送信できた記事だけが通知済みになる
+    assert cache_manager.is_notified("https://example.com/news/1")
+    assert not cache_manager.is_notified("https://example.com/news/3")
+    assert cache_manager.is_notified("https://example.com/news/2")
+
+
+def test_duplicates_are_marked_with_representative(cache_manager: CacheManager) -> None:
+    """代表記事を通知すると、類似記事として除外した記事も通知済みになることのテスト."""
+    line_client = FakeLineClient()
+    notifier = Notifier(line_client, cache_manager)  # type: ignore[arg-type]
+    articles = _articles(1)
+    articles[0].duplicate_urls = ["https://example.com/news/2"]
+
+    notifier.queue_notification("team_a", "U1", articles)
+    assert notifier.flush() == {}
+
+    assert line_client.pushes == [("U1", ["https://example.com/news/1"], "team_a")]
+    assert cache_manager.is_notified("https://example.com/news/2")
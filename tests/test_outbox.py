@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""アウトボックス経由のLINE通知送信のテストコード."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+from pydantic import HttpUrl
+
+from src.business.notifier import Notifier
+from src.business.outbox_dispatcher import OutboxDispatcher
+from src.infrastructure.article_store import ArticleStore
+from src.infrastructure.cache_manager import CacheManager
+from src.infrastructure.line_client import LineClient
+from src.infrastructure.outbox_manager import OutboxManager
+from src.infrastructure.quota_manager import QuotaManager
+from src.main import report_failed_outbox_entries
+from src.models.keyword_config import KeywordConfig, NotificationTarget
+from src.models.news_article import NewsArticle
+from src.utils.date_helper import JST
+
+
+class FakeResponse:
+    """テスト用レスポンス."""
+
+    def __init__(self, status_code: int) -> None:
+        """初期化."""
+        self.status_code = status_code
+        self.headers: Dict[str, str] = {}
+        self.text = ""
+
+
+class ScriptedSession:
+    """指定した順にステータスコードを返し、送信内容を記録するテスト用セッション."""
+
+    def __init__(self, statuses: List[int]) -> None:
+        """初期化（ステータスを使い切った後は200を返す）."""
+        self.statuses = statuses
+        self.requests: List[Dict[str, Any]] = []
+
+    def post(
+        self,
+        url: str,
+        data: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> FakeResponse:
+        """POSTリクエスト."""
+        self.requests.append(
+            {"url": url, "body": json.loads(data), "headers": dict(headers or {})}
+        )
+        return FakeResponse(self.statuses.pop(0) if self.statuses else 200)
+
+
+class FakeClock:
+    """sleepで進む時計."""
+
+    def __init__(self) -> None:
+        """初期化."""
+        self.now = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        """現在日時."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """時計を進める."""
+        self.now += timedelta(seconds=seconds)
+
+
+def _articles(count: int) -> List[NewsArticle]:
+    """テスト用の記事を作成."""
+    return [
+        NewsArticle(
+            title=f"記事{index}",
+            url=HttpUrl(f"https://example.com/news/{index}"),
+            published_date=datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+            summary=f"要約{index}",
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """FakeClockのフィクスチャ."""
+    return FakeClock()
+
+
+@pytest.fixture
+def outbox_manager(tmp_path: Path) -> OutboxManager:
+    """OutboxManagerのフィクスチャ."""
+    return OutboxManager(outbox_dir=str(tmp_path / "outbox"))
+
+
+def _dispatcher(
+    statuses: List[int], outbox_manager: OutboxManager, clock: FakeClock
+) -> OutboxDispatcher:
+    """ScriptedSessionを使うOutboxDispatcherを作成."""
+    line_client = LineClient("dummy")
+    line_client.session = ScriptedSession(statuses)  # type: ignore[assignment]
+    return OutboxDispatcher(
+        line_client, outbox_manager, base_delay=30, clock=clock, sleep=clock.sleep
+    )
+
+
+def test_retry_reuses_retry_key_until_delivered(
+    outbox_manager: OutboxManager, clock: FakeClock
+) -> None:
+    """一時的な障害の後、同じリトライキーで再送して成功することのテスト."""
+    dispatcher = _dispatcher([503, 500], outbox_manager, clock)
+    session = dispatcher.line_client.session
+    requests = dispatcher.line_client.build_news_requests(["U1"], _articles(2), "main")
+    [entry] = dispatcher.enqueue(requests, ["main"])
+
+    assert dispatcher.dispatch_due() == 1
+    [pending] = outbox_manager.list_entries()
+    assert pending.attempts == 1
+    assert pending.next_attempt_at > clock.now
+    assert "503" in (pending.last_error or "")
+
+    assert dispatcher.drain(max_wait_seconds=600) == 0
+    assert outbox_manager.list_entries() == []
+    retry_keys = [r["headers"][LineClient.RETRY_KEY_HEADER] for r in session.requests]  # type: ignore[attr-defined]
+    assert retry_keys == [entry.retry_key] * 3
+
+
+def test_conflict_is_treated_as_delivered(
+    outbox_manager: OutboxManager, clock: FakeClock
+) -> None:
+    """受理済みのリトライキー（HTTP 409）を送信成功として扱うテスト."""
+    dispatcher = _dispatcher([409], outbox_manager, clock)
+    requests = dispatcher.line_client.build_news_requests(["U1"], _articles(1), "main")
+    [entry] = dispatcher.enqueue(requests, ["main"])
+
+    assert dispatcher.deliver(entry)
+    assert outbox_manager.list_entries() == []
+
+
+def test_permanent_failure_and_expiry_move_to_failed(
+    outbox_manager: OutboxManager, clock: FakeClock
+) -> None:
+    """再送不可のエラーと期限切れのエントリーがfailedに移動することのテスト."""
+    dispatcher = _dispatcher([400], outbox_manager, clock)
+    requests = dispatcher.line_client.build_news_requests(["U1"], _articles(1), "main")
+    [rejected] = dispatcher.enqueue(requests, ["main"])
+    [expired] = dispatcher.enqueue(requests, ["main"])
+
+    assert not dispatcher.deliver(rejected)
+    clock.sleep(25 * 3600)
+    assert dispatcher.dispatch_due() == 0
+
+    failed = sorted(path.stem for path in outbox_manager.failed_dir.glob("*.json"))
+    assert failed == sorted([rejected.retry_key, expired.retry_key])
+    # 期限切れのエントリーは送信しない
+    assert len(dispatcher.line_client.session.requests) == 1  # type: ignore[attr-defined]
+
+
+class RecordingNotifier:
+    """送信したエラー通知を記録するテスト用の通知管理."""
+
+    def __init__(self) -> None:
+        """初期化."""
+        self.errors: List[Tuple[str, str]] = []
+
+    def send_error_notification(self, line_user_id: str, error_message: str) -> None:
+        """エラー通知を記録."""
+        self.errors.append((line_user_id, error_message))
+
+
+def test_given_up_entries_are_reported_to_targets(
+    tmp_path: Path, outbox_manager: OutboxManager, clock: FakeClock
+) -> None:
+    """再送を諦めた通知の記事を破棄として記録し、通知先にエラー通知することのテスト."""
+    dispatcher = _dispatcher([400], outbox_manager, clock)
+    articles = _articles(2)
+    requests = dispatcher.line_client.build_news_requests(["U1"], articles, "main")
+    dispatcher.enqueue(requests, ["main"])
+    dispatcher.dispatch_due()
+
+    notifier = RecordingNotifier()
+    article_store = ArticleStore(db_file=str(tmp_path / "articles.db"))
+    keyword_config = KeywordConfig(
+        notification_targets=[NotificationTarget(name="main", line_user_id="U1", keywords=["AI"])]
+    )
+    report_failed_outbox_entries(dispatcher, notifier, keyword_config, article_store)  # type: ignore[arg-type]
+
+    assert [user_id for user_id, _message in notifier.errors] == ["U1"]
+    assert "2件" in notifier.errors[0][1]
+    assert article_store.get_delivery_states(articles[0].get_url_string()) == {"main": "dropped"}
+    # 取り出したエントリーは再度通知しない
+    assert dispatcher.pop_failed_entries() == []
+    article_store.close()
+
+
+def test_notifier_marks_articles_notified_when_enqueued(
+    tmp_path: Path, outbox_manager: OutboxManager, clock: FakeClock
+) -> None:
+    """送信に失敗してもアウトボックスに残り、通知済みになることのテスト."""
+    dispatcher = _dispatcher([503], outbox_manager, clock)
+    cache_manager = CacheManager(cache_file=str(tmp_path / "notified_urls.json"))
+    notifier = Notifier(dispatcher.line_client, cache_manager, outbox_dispatcher=dispatcher)
+
+    notifier.queue_notification("team_a", "U1", _articles(2))
+    errors = notifier.flush()
+
+    assert errors == {}
+    assert cache_manager.is_notified("https://example.com/news/2")
+    [entry] = outbox_manager.list_entries()
+    assert entry.target_names == ["team_a"]
+    assert entry.article_urls == ["https://example.com/news/1", "https://example.com/news/2"]
+
+    assert dispatcher.drain(max_wait_seconds=600) == 0
+
+
+def test_failed_enqueue_rolls_back_saved_entries(
+    tmp_path: Path, outbox_manager: OutboxManager, clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """途中のリクエストを保存できない場合、保存済みのエントリーを削除し未通知のままにするテスト."""
+    dispatcher = _dispatcher([], outbox_manager, clock)
+    cache_manager = CacheManager(cache_file=str(tmp_path / "notified_urls.json"))
+    notifier = Notifier(dispatcher.line_client, cache_manager, outbox_dispatcher=dispatcher)
+    save = outbox_manager.save
+    saved: List[str] = []
+
+    def save_then_fail(entry: Any) -> None:
+        if saved:
+            raise OSError("No space left on device")
+        save(entry)
+        saved.append(entry.retry_key)
+
+    monkeypatch.setattr(outbox_manager, "save", save_then_fail)
+
+    # 55件は2リクエストに分かれる
+    notifier.queue_notification("team_a", "U1", _articles(55))
+    errors = notifier.flush()
+
+    assert isinstance(errors["team_a"], OSError)
+    assert len(saved) == 1
+    assert outbox_manager.list_entries() == []
+    assert not cache_manager.is_notified("https://example.com/news/1")
+
+
+def test_accepted_requests_are_counted_once(tmp_path: Path) -> None:
+    """受理されたリクエストの送信先数だけを送信メッセージ数として記録するテスト."""
+    quota_manager = QuotaManager(quota_file=str(tmp_path / "message_quota.json"))
+    line_client = LineClient("dummy", quota_manager=quota_manager)
+    line_client.session = ScriptedSession([200, 409])  # type: ignore[assignment]
+
+    line_client.send_request("multicast", {"to": ["U1", "U2", "U3"], "messages": []}, "key-1")
+    line_client.send_request("multicast", {"to": ["U1", "U2", "U3"], "messages": []}, "key-1")
+
+    assert quota_manager.get_daily_usage("line", datetime.now(JST).date()) == 3
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""PollingSchedulerのテストコード."""
+
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from pydantic import HttpUrl
+
+from src.business.polling_scheduler import PollingScheduler
+from src.infrastructure.keyword_stats_manager import KeywordStatsManager
+from src.models.news_article import NewsArticle
+
+RUN_STARTED_AT = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def temp_stats_file() -> str:
+    """一時実績ファイルのフィクスチャ."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield str(Path(temp_dir) / "keyword_stats.json")
+
+
+@pytest.fixture
+def polling_scheduler(temp_stats_file: str) -> PollingScheduler:
+    """PollingSchedulerのフィクスチャ."""
+    return PollingScheduler(
+        KeywordStatsManager(stats_file=temp_stats_file), hot_threshold=2, max_interval=4
+    )
+
+
+def _article(title: str, index: int = 1, published_date: datetime = RUN_STARTED_AT) -> NewsArticle:
+    """テスト用の記事を作成."""
+    return NewsArticle(
+        title=title,
+        url=HttpUrl(f"https://example.com/news/{index}"),
+        published_date=published_date,
+    )
+
+
+def test_get_interval(polling_scheduler: PollingScheduler) -> None:
+    """新着なしの連続回数に応じた取得間隔のテスト."""
+    assert polling_scheduler.get_interval(0) == 1
+    assert polling_scheduler.get_interval(1) == 1
+    assert polling_scheduler.get_interval(2) == 2
+    assert polling_scheduler.get_interval(3) == 4
+    # 上限で頭打ち
+    assert polling_scheduler.get_interval(10) == 4
+
+
+def test_cold_keyword_backoff(polling_scheduler: PollingScheduler) -> None:
+    """新着の無いキーワードの取得間隔が延び、新着があれば毎回に戻ることのテスト."""
+    keywords = ["AI", "量子"]
+    polled_history = []
+
+    for run in range(6):
+        polled_at = RUN_STARTED_AT + timedelta(hours=run)
+        polled = polling_scheduler.select_keywords("main", keywords)
+        polled_history.append(polled)
+        polling_scheduler.record_results(
+            "main", polled, [_article(f"AIニュース{run}", run)], polled_at=polled_at, window_start=polled_at
+        )
+
+    # AIは毎回、量子は2回連続で新着が無かった後は間引かれる
+    assert all("AI" in polled for polled in polled_history)
+    assert [("量子" in polled) for polled in polled_history] == [
+        True,
+        True,
+        False,
+        True,
+        False,
+        False,
+    ]
+
+    # 新着があれば毎回取得に戻る
+    polling_scheduler.select_keywords("main", keywords)
+    polled = polling_scheduler.select_keywords("main", keywords)
+    assert "量子" in polled
+    polling_scheduler.record_results(
+        "main", polled, [_article("量子コンピュータ")], polled_at=RUN_STARTED_AT, window_start=RUN_STARTED_AT
+    )
+    assert polling_scheduler.select_keywords("main", keywords) == keywords
+
+
+def test_stats_persistence(temp_stats_file: str) -> None:
+    """取得実績が永続化されることのテスト."""
+    scheduler1 = PollingScheduler(KeywordStatsManager(stats_file=temp_stats_file))
+    scheduler1.record_results("main", ["AI"], [], polled_at=RUN_STARTED_AT, window_start=RUN_STARTED_AT)
+
+    scheduler2 = PollingScheduler(KeywordStatsManager(stats_file=temp_stats_file))
+    assert scheduler2.get_oldest_last_polled_at("main", ["AI", "Python"]) == RUN_STARTED_AT
+    assert scheduler2.get_oldest_last_polled_at("main", ["Python"]) is None
+
+
+def test_overlap_articles_are_counted_once(polling_scheduler: PollingScheduler) -> None:
+    """収集期間の重なりで再び得られた記事を新着として数えないことのテスト."""
+    first_run = RUN_STARTED_AT
+    second_run = RUN_STARTED_AT + timedelta(hours=1)
+    overlapping = _article("AIニュース", 1, published_date=second_run - timedelta(minutes=5))
+
+    polling_scheduler.record_results(
+        "main", ["AI"], [overlapping], polled_at=first_run, window_start=first_run - timedelta(hours=1)
+    )
+    # 2回目の収集期間にも含まれるため同じ記事が再び得られる（通知されなかった記事）
+    polling_scheduler.record_results(
+        "main", ["AI"], [overlapping], polled_at=second_run, window_start=second_run - timedelta(minutes=10)
+    )
+
+    stats = polling_scheduler.stats_manager.get_stats("main", "AI")
+    assert stats["new_article_count"] == 1
+    assert stats["consecutive_empty"] == 1
+    assert stats["last_new_at"] == first_run.isoformat()
+
+    # 収集期間より前に公開された記事の記録は破棄する
+    later_run = second_run + timedelta(hours=1)
+    polling_scheduler.record_results("main", ["AI"], [], polled_at=later_run, window_start=later_run)
+    assert stats["counted_urls"] == {}
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""RateLimiterのテストコード."""
+
+import pytest
+
+from src.infrastructure.rate_limiter import RateLimiter, TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    """テスト用の時計."""
+
+    def __init__(self) -> None:
+        """初期化."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す."""
+        return self.now
+
+
+def test_token_bucket_burst_and_refill() -> None:
+    """バースト分は即時、それ以降は補充を待つことのテスト."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2.0, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    # 3件目は0.5秒待つ
+    assert bucket.reserve() == pytest.approx(0.5)
+
+    # 時間が経てば補充される
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_token_bucket_block_for() -> None:
+    """Retry-Afterの間はリクエストが止まることのテスト."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10.0, capacity=10.0, clock=clock)
+
+    bucket.block_for(3.0)
+
+    assert bucket.reserve() == pytest.approx(3.0)
+
+
+def test_rate_limiter_from_config() -> None:
+    """設定文字列からの生成と、未設定ホストが制限されないことのテスト."""
+    slept = []
+    rate_limiter = RateLimiter.from_config("news.google.com=1:1", jitter=0.0)
+    rate_limiter._sleep = slept.append
+
+    rate_limiter.acquire("https://news.google.com/rss/search?q=AI")
+    rate_limiter.acquire("news.google.com")
+    rate_limiter.acquire("api.line.me")
+
+    assert len(slept) == 1
+    assert slept[0] > 0
+
+    with pytest.raises(ValueError):
+        RateLimiter.from_config("news.google.com=fast")
+
+
+def test_parse_retry_after() -> None:
+    """Retry-Afterヘッダーの解釈テスト."""
+    assert parse_retry_after({"Retry-After": "5"}) == 5.0
+    assert parse_retry_after({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert parse_retry_after({}) is None
+    assert parse_retry_after(None) is None
+    assert parse_retry_after({"Retry-After": "soon"}) is None
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Resilience（リトライ・サーキットブレーカー）のテストコード."""
+
+import socket
+import urllib.error
+from typing import List
+
+import httpx
+import pytest
+import requests
+
+from src.infrastructure.rate_limiter import RateLimitError
+from src.infrastructure.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Resilience,
+    RetryPolicy,
+    ServiceError,
+    is_transient_error,
+)
+
+
+class FakeClock:
+    """テスト用の時計."""
+
+    def __init__(self) -> None:
+        """初期化."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す."""
+        return self.now
+
+
+class FlakyService:
+    """指定回数だけ失敗してから成功するテスト用サービス."""
+
+    def __init__(self, failures: int, error: Exception) -> None:
+        """初期化."""
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self) -> str:
+        """呼び出し."""
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "ok"
+
+
+def _create_resilience(
+    clock: FakeClock, sleeps: List[float], max_attempts: int = 3, threshold: int = 3
+) -> Resilience:
+    """テスト用のResilienceを作成."""
+    return Resilience(
+        circuit_breaker=CircuitBreaker(
+            "test", failure_threshold=threshold, recovery_timeout=30.0, clock=clock
+        ),
+        retry_policy=RetryPolicy(max_attempts=max_attempts, base_delay=0.5),
+        sleep=sleeps.append,
+    )
+
+
+def test_is_transient_error() -> None:
+    """一時的な障害の判定のテスト."""
+    response = requests.Response()
+    response.status_code = 503
+    assert is_transient_error(requests.HTTPError(response=response))
+    response = requests.Response()
+    response.status_code = 404
+    assert not is_transient_error(requests.HTTPError(response=response))
+
+    assert is_transient_error(requests.ConnectionError())
+    assert is_transient_error(RateLimitError("429"))
+    assert not is_transient_error(ValueError("bad input"))
+    assert is_transient_error(ConnectionResetError())
+    assert is_transient_error(TimeoutError())
+    # feedparser（urllib）とGeminiのSDK（httpx）の通信エラー
+    assert is_transient_error(urllib.error.URLError(socket.gaierror()))
+    assert is_transient_error(httpx.ConnectError("connection refused"))
+    assert is_transient_error(ServiceError("HTTP 503", 503))
+    # ネットワーク以外のOSErrorは一時的な障害とみなさない
+    assert not is_transient_error(PermissionError("permission denied"))
+    assert not is_transient_error(FileNotFoundError())
+
+
+def test_retry_then_success() -> None:
+    """一時的な障害の後に成功した場合のテスト."""
+    sleeps: List[float] = []
+    resilience = _create_resilience(FakeClock(), sleeps)
+    service = FlakyService(failures=2, error=requests.ConnectionError())
+
+    assert resilience.call(service) == "ok"
+    assert service.calls == 3
+    assert len(sleeps) == 2
+    assert resilience.circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_retry_respects_retry_after() -> None:
+    """Retry-After以上待ってからリトライすることのテスト."""
+    sleeps: List[float] = []
+    resilience = _create_resilience(FakeClock(), sleeps)
+    service = FlakyService(failures=1, error=RateLimitError("429", retry_after=2.0))
+
+    assert resilience.call(service) == "ok"
+    assert sleeps == [pytest.approx(2.0)]
+
+
+def test_non_transient_error_is_not_retried() -> None:
+    """リトライ対象外のエラーは即座に送出されることのテスト."""
+    sleeps: List[float] = []
+    resilience = _create_resilience(FakeClock(), sleeps)
+    service = FlakyService(failures=5, error=ValueError("bad input"))
+
+    with pytest.raises(ValueError):
+        resilience.call(service)
+    assert service.calls == 1
+    assert sleeps == []
+    assert resilience.circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_opens_and_fails_fast() -> None:
+    """連続失敗でサーキットが開き、以降は呼び出さずに失敗することのテスト."""
+    sleeps: List[float] = []
+    resilience = _create_resilience(FakeClock(), sleeps, max_attempts=3, threshold=2)
+    service = FlakyService(failures=100, error=requests.Timeout())
+
+    # リトライを含めた1回の呼び出しを1回の失敗として数える
+    with pytest.raises(requests.Timeout):
+        resilience.call(service)
+    assert resilience.circuit_breaker.state == CircuitBreaker.CLOSED
+    with pytest.raises(requests.Timeout):
+        resilience.call(service)
+    assert resilience.circuit_breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        resilience.call(service)
+    assert service.calls == 6
+
+
+def test_circuit_half_open_probe() -> None:
+    """回復待ち時間の経過後、試行が成功すればサーキットが閉じることのテスト."""
+    clock = FakeClock()
+    sleeps: List[float] = []
+    resilience = _create_resilience(clock, sleeps, max_attempts=1, threshold=1)
+
+    with pytest.raises(requests.ConnectionError):
+        resilience.call(FlakyService(failures=1, error=requests.ConnectionError()))
+    assert resilience.circuit_breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 31.0
+    assert resilience.call(lambda: "ok") == "ok"
+    assert resilience.circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_half_open_probe_failure_reopens() -> None:
+    """半開状態の試行が失敗すると再びサーキットが開くことのテスト."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=30.0, clock=clock)
+
+    breaker.before_call()
+    breaker.record_failure()
+    clock.now = 31.0
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # 試行中は他の呼び出しを通さない
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
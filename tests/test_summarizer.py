@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Summarizer・ExtractiveSummarizerのテストコード."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import List
+
+from pydantic import HttpUrl
+
+from src.business.extractive_summarizer import ExtractiveSummarizer
+from src.business.summarizer import Summarizer
+from src.infrastructure.article_store import ArticleStore
+from src.infrastructure.llm_client import LLMClient
+from src.models.news_article import NewsArticle
+
+
+class FakeLLMClient(LLMClient):
+    """テスト用のLLMクライアント（2件目以降は応答が遅い）."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        """初期化."""
+        self.delay = delay
+        self.calls = 0
+        self.released = threading.Event()
+
+    def summarize(self, text: str) -> str:
+        """要約（2件目以降はdelay秒待つ）."""
+        self.calls += 1
+        if self.calls > 1:
+            self.released.wait(self.delay)
+        return f"LLM要約{self.calls}"
+
+
+def _article(index: int, title: str, description: str = "") -> NewsArticle:
+    """テスト用の記事を作成."""
+    return NewsArticle(
+        title=title,
+        url=HttpUrl(f"https://example.com/news/{index}"),
+        published_date=datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
+        description=description,
+    )
+
+
+def test_extractive_summary_prefers_title_related_sentences() -> None:
+    """タイトルに関連する文が選ばれることのテスト."""
+    article = _article(
+        1,
+        "新型AIモデルを発表 - テックニュース",
+        "<p>A社は本日、記者会見を開いた。天気は晴れだった。"
+        "新型AIモデルは従来比で2倍の性能を持つ。</p>",
+    )
+
+    summary = ExtractiveSummarizer(max_sentences=2).summarize(article)
+
+    assert summary == "A社は本日、記者会見を開いた。新型AIモデルは従来比で2倍の性能を持つ。"
+
+
+def test_extractive_summary_falls_back_to_title() -> None:
+    """説明文に本文が無い場合はタイトルを使うことのテスト."""
+    article = _article(
+        1,
+        "新型AIモデルを発表 - テックニュース",
+        '<a href="https://example.com">新型AIモデルを発表</a>'
+        '&nbsp;&nbsp;<font color="#6f6f6f">テックニュース</font>',
+    )
+
+    assert ExtractiveSummarizer().summarize(article) == "新型AIモデルを発表"
+
+
+def test_summarize_articles_uses_llm() -> None:
+    """期限内であればLLMの要約を使うことのテスト."""
+    articles = [_article(1, "記事1"), _article(2, "記事2")]
+
+    summarized = Summarizer(FakeLLMClient()).summarize_articles(articles, deadline=None)
+
+    assert [a.summary for a in summarized] == ["LLM要約1", "LLM要約2"]
+    assert all(a.summary_source == "llm" for a in summarized)
+
+
+def test_summarize_articles_falls_back_after_deadline() -> None:
+    """期限を過ぎた記事は応答を待たずに簡易要約になることのテスト."""
+    llm_client = FakeLLMClient(delay=5.0)
+    summarizer = Summarizer(llm_client)
+    articles: List[NewsArticle] = [
+        _article(1, "記事1 - 配信元"),
+        _article(2, "記事2 - 配信元"),
+        _article(3, "記事3 - 配信元"),
+    ]
+
+    started = time.monotonic()
+    try:
+        summarizer.summarize_articles(articles, deadline=started + 0.2)
+    finally:
+        llm_client.released.set()
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 2.0
+    assert articles[0].summary == "LLM要約1"
+    assert articles[0].summary_source == "llm"
+    assert [a.summary for a in articles[1:]] == ["記事2", "記事3"]
+    assert all(a.is_summary_degraded() for a in articles[1:])
+    # 期限超過後の記事はLLMを呼び出さない
+    assert llm_client.calls == 2
+
+
+def test_stored_summaries_are_reused() -> None:
+    """記事ストアに同じテンプレートで要約済みの記事はLLMを呼び出さないことのテスト."""
+    store = ArticleStore(db_file=":memory:")
+    llm_client = FakeLLMClient()
+    summarizer = Summarizer(llm_client, article_store=store)
+    summarizer.summarize_articles([_article(1, "記事1")])
+    assert llm_client.calls == 1
+
+    # 別の通知先・別の実行で同じ記事を要約する
+    articles = summarizer.summarize_articles([_article(1, "記事1"), _article(2, "記事2")])
+
+    assert llm_client.calls == 2
+    assert [article.summary for article in articles] == ["LLM要約1", "LLM要約2"]
+    assert all(article.summary_source == "llm" for article in articles)
+    assert store.get_summaries(["https://example.com/news/2"], "other:v1") == {}
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""text_normalizerのテストコード."""
+
+import pytest
+
+from src.utils.text_normalizer import normalize_text
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        # 全角英数字・全角空白
+        ("ＡＩ　技術", "ai 技術"),
+        # 半角カナ
+        ("ｶﾀｶﾅ", "カタカナ"),
+        # ひらがなはカタカナに統一
+        ("ぱいそん", "パイソン"),
+        # 長音記号の揺れ
+        ("サ－バ", "サーバ"),
+        ("サーバ—", "サーバー"),
+        # 句読点・括弧と空白の畳み込み
+        ("「Python」、最新！  ニュース", "python 最新 ニュース"),
+    ],
+)
+def test_normalize_text(text: str, expected: str) -> None:
+    """normalize_textのテスト."""
+    assert normalize_text(text) == expected
+
+
+def test_normalize_text_keeps_symbols() -> None:
+    """キーワードの一部になりうる記号が保持されることのテスト."""
+    assert normalize_text("C#") == "c#"
+    assert normalize_text("C++") == "c++"
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""token_counterのテストコード."""
+
+from src.utils.token_counter import estimate_tokens, truncate_to_tokens
+
+
+def test_estimate_tokens() -> None:
+    """トークン数の概算のテスト."""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("日本語") == 3
+    assert estimate_tokens("AI日本") == 3
+
+
+def test_truncate_to_tokens() -> None:
+    """上限に収まるように切り詰めるテスト."""
+    assert truncate_to_tokens("日本語", 5) == "日本語"
+    assert truncate_to_tokens("日本語のテキスト", 3) == "日本語"
+
+    truncated = truncate_to_tokens("a" * 100 + "日本語", 10)
+    assert estimate_tokens(truncated) <= 10
+    assert truncated == "a" * 40
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""WatermarkManagerのテストコード."""
+
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.watermark_manager import WatermarkManager
+
+
+@pytest.fixture
+def temp_watermark_file() -> str:
+    """一時ウォーターマークファイルのフィクスチャ."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield str(Path(temp_dir) / "watermarks.json")
+
+
+def test_watermark_initially_none(temp_watermark_file: str) -> None:
+    """未実行の通知先のウォーターマークがNoneであることのテスト."""
+    watermark_manager = WatermarkManager(watermark_file=temp_watermark_file)
+    assert watermark_manager.get_watermark("main_channel") is None
+
+
+def test_watermark_persistence(temp_watermark_file: str) -> None:
+    """ウォーターマークの永続化テスト."""
+    run_started_at = datetime(2025, 1, 15, 23, 30, 0, tzinfo=timezone.utc)
+
+    watermark_manager1 = WatermarkManager(watermark_file=temp_watermark_file)
+    watermark_manager1.update_watermark("main_channel", run_started_at)
+
+    watermark_manager2 = WatermarkManager(watermark_file=temp_watermark_file)
+    assert watermark_manager2.get_watermark("main_channel") == run_started_at
+    assert watermark_manager2.get_watermark("other_channel") is None
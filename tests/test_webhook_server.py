@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""Webhookサーバーとニュース検索の応答のテストコード."""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from pydantic import HttpUrl
+
+from src.business.news_query_responder import NewsQueryResponder
+from src.infrastructure.article_store import ArticleStore
+from src.infrastructure.keyword_config_loader import KeywordConfigLoader
+from src.models.news_article import NewsArticle
+from src.webhook_server import WebhookServer
+
+CHANNEL_SECRET = "test-secret"
+
+
+class FakeLineClient:
+    """応答メッセージを記録するテスト用LINEクライアント."""
+
+    def __init__(self) -> None:
+        """初期化."""
+        self.replies: List[Tuple[str, List[Dict[str, Any]]]] = []
+
+    def reply_message(self, reply_token: str, messages: List[Dict[str, Any]]) -> None:
+        """応答メッセージを送信."""
+        self.replies.append((reply_token, messages))
+
+
+def _sign(body: bytes) -> str:
+    """リクエストボディの署名を作成."""
+    digest = hmac.new(CHANNEL_SECRET.encode(), body, hashlib.sha256).digest()
+    return base64.b64encode(digest).decode()
+
+
+def _event_body(text: str) -> bytes:
+    """テキストメッセージのWebhookイベントを作成."""
+    return json.dumps(
+        {
+            "destination": "Uxxx",
+            "events": [
+                {"type": "follow", "replyToken": "token-follow"},
+                {
+                    "type": "message",
+                    "replyToken": "token-1",
+                    "message": {"type": "text", "id": "1", "text": text},
+                },
+            ],
+        }
+    ).encode()
+
+
+@pytest.fixture
+def responder() -> NewsQueryResponder:
+    """記事を保存したNewsQueryResponderのフィクスチャ."""
+    store = ArticleStore(db_file=":memory:")
+    store.save_articles(
+        [
+            NewsArticle(
+                title="生成AIの新モデルが公開",
+                url=HttpUrl("https://example.com/news/1"),
+                published_date=datetime(2025, 1, 15, 3, 0, 0, tzinfo=timezone.utc),
+                summary="新モデルの要約",
+            )
+        ]
+    )
+    return NewsQueryResponder(store, max_results=5, search_scope="all")
+
+
+async def _post(port: int, body: bytes, signature: str, path: str = "/callback") -> str:
+    """Webhookサーバーにリクエストを送信し、ステータス行を返す."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        (
+            f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+            f"X-Line-Signature: {signature}\r\nContent-Length: {len(body)}\r\n\r\n"
+        ).encode()
+        + body
+    )
+    await writer.drain()
+    status_line = (await reader.readline()).decode().strip()
+    writer.close()
+    return status_line
+
+
+def test_server_verifies_signature_and_replies(responder: NewsQueryResponder) -> None:
+    """署名を検証し、テキストメッセージに検索結果で応答することのテスト."""
+    line_client = FakeLineClient()
+    server = WebhookServer(CHANNEL_SECRET, line_client, responder)  # type: ignore[arg-type]
+
+    async def scenario() -> List[str]:
+        running = await server.start("127.0.0.1", 0)
+        port = running.sockets[0].getsockname()[1]
+        body = _event_body("生成AIの最新ニュース")
+        statuses = [
+            await _post(port, body, _sign(body)),
+            await _post(port, body, _sign(b"tampered")),
+            await _post(port, body, _sign(body), path="/unknown"),
+        ]
+        await server.wait_for_replies()
+        running.close()
+        await running.wait_closed()
+        return statuses
+
+    statuses = asyncio.run(scenario())
+
+    assert statuses == ["HTTP/1.1 200 OK", "HTTP/1.1 401 Unauthorized", "HTTP/1.1 404 Not Found"]
+    [(reply_token, messages)] = line_client.replies
+    assert reply_token == "token-1"
+    assert messages[0]["type"] == "flex"
+    assert messages[0]["altText"] == "「生成AI」の最新ニュース: 1件"
+
+
+def test_responder_reply_messages(responder: NewsQueryResponder) -> None:
+    """検索語の取り出しと、一致しない場合・ヘルプの応答のテスト."""
+    assert NewsQueryResponder.parse_query("生成AIについて教えて") == "生成AI"
+    assert NewsQueryResponder.parse_query("最新 半導体 規制？") == "半導体 規制"
+    assert NewsQueryResponder.parse_query("最新") == ""
+
+    [not_found] = responder.build_reply("半導体")
+    assert not_found == {"type": "text", "text": "「半導体」に一致するニュースは見つかりませんでした。"}
+    [latest] = responder.build_reply("最新")
+    assert latest["altText"] == "最新ニュース: 1件"
+    [help_message] = responder.build_reply("ヘルプ")
+    assert help_message["type"] == "text"
+
+
+def test_latest_for_registered_user(tmp_path: Path, responder: NewsQueryResponder) -> None:
+    """通知先に登録された送信者には、その通知先に送信済みの記事で応答するテスト."""
+    config_file = tmp_path / "keywords.yaml"
+    config_file.write_text(
+        "notification_targets:\n  - name: team_a\n    line_user_id: U1\n    keywords: [AI]\n",
+        encoding="utf-8",
+    )
+    responder.config_loader = KeywordConfigLoader(str(config_file))
+
+    # 送信済みの記事が無い間は、全体の最新の記事で応答する
+    [message] = responder.build_reply("最新", line_user_id="U1")
+    assert message["altText"] == "最新ニュース: 1件"
+
+    responder.article_store.record_deliveries("team_a", ["https://example.com/news/1"], "sent")
+    [message] = responder.build_reply("最新", line_user_id="U1")
+    assert message["altText"] == "あなたへの最新ニュース: 1件"
+    [message] = responder.build_reply("最新", line_user_id="U2")
+    assert message["altText"] == "最新ニュース: 1件"
+
+
+def test_targets_scope_limits_search_to_sender(tmp_path: Path, responder: NewsQueryResponder) -> None:
+    """検索範囲がtargetsの場合、送信者の通知先に送信済みの記事だけを検索するテスト."""
+    config_file = tmp_path / "keywords.yaml"
+    config_file.write_text(
+        "notification_targets:\n"
+        "  - name: team_a\n    line_user_id: U1\n    keywords: [AI]\n"
+        "  - name: team_b\n    line_user_id: U2\n    keywords: [半導体]\n",
+        encoding="utf-8",
+    )
+    responder.config_loader = KeywordConfigLoader(str(config_file))
+    responder.search_scope = "targets"
+    responder.article_store.record_deliveries("team_a", ["https://example.com/news/1"], "sent")
+
+    [message] = responder.build_reply("生成AI", line_user_id="U1")
+    assert message["altText"] == "「生成AI」の最新ニュース: 1件"
+    # 他の通知先に送信された記事は検索できない
+    [message] = responder.build_reply("生成AI", line_user_id="U2")
+    assert message["text"] == "「生成AI」に一致するニュースは見つかりませんでした。"
+    # 通知先に登録されていない送信者には応答しない
+    [message] = responder.build_reply("生成AI", line_user_id="U9")
+    assert message["text"] == "ニュース検索は、通知先に登録されているユーザーのみ利用できます。"